@@ -1,13 +1,16 @@
-import struct
-import sys
-import os
-from typing import Dict, List, Any, Union
-from Crypto.Hash import keccak
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Tuple, Union
+from eth_hash.auto import keccak as _keccak256
 from eth_keys import keys
 from eth_utils import to_checksum_address
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from sdk.common import SDKError
+from .signer import Signer, as_signer
+
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
 
 class TypedData:
     def __init__(self, name: str, type_name: str):
@@ -23,210 +26,267 @@ class Domain:
         self.verifying_contract = verifying_contract
 
 
-def sign(private_key_bytes: bytes, domain: Domain, data_message: Dict[str, Any], 
+_EIP712_PREFIX = b"\x19\x01"
+
+_DOMAIN_TYPES: Dict[str, List[TypedData]] = {
+    "EIP712Domain": [
+        TypedData("name", "string"),
+        TypedData("version", "string"),
+        TypedData("chainId", "uint256"),
+        TypedData("verifyingContract", "address"),
+    ]
+}
+
+
+def sign(private_key: Union[bytes, Signer], domain: Domain, data_message: Dict[str, Any], 
          data_types: Dict[str, List[TypedData]]) -> bytes:
-    """Sign EIP-712 data according to the standard - properly hash bytes fields"""
+    """Sign EIP-712 data according to the standard - properly hash bytes fields.
+
+    Pass a Signer kept by the caller to avoid reloading the key on every call."""
     try:
-        from eth_utils import keccak as eth_keccak
-        fixed_data_message = data_message.copy() 
+        typed_data_hash = hash_typed_data(domain, data_message, data_types)
         
-        types_dict = {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"}, 
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"}
-            ],
-            "StorageData": [
-                {"name": field.name, "type": field.type} 
-                for field in data_types["StorageData"]
-            ]
-        }
+        return _sign_hash(as_signer(private_key), typed_data_hash)
         
-        domain_dict = {
-            "name": domain.name,
-            "version": domain.version,
-            "chainId": domain.chain_id,
-            "verifyingContract": domain.verifying_contract
-        }
-        
-        typed_data_hash = hash_typed_data(domain, fixed_data_message, data_types)
-        
-        class EncodedMessage:
-            def __init__(self, body):
-                self.body = body
-        
-        encoded_message = EncodedMessage(typed_data_hash)
+    except Exception as e:
+        raise _signing_error(e)
+
+
+def sign_batch(private_key: Union[bytes, Signer], domain: Domain, data_messages: List[Dict[str, Any]],
+               data_types: Dict[str, List[TypedData]]) -> List[bytes]:
+    """Sign several StorageData messages under one domain, resolving the key, domain
+    separator and struct encoder once for the whole batch."""
+    try:
+        domain_hash = _domain_separator(domain.name, domain.version, domain.chain_id, domain.verifying_contract)
+        fields = tuple((field.name, field.type) for field in data_types["StorageData"])
+        encoder = _compile_struct_encoder("StorageData", fields)
+        signer = as_signer(private_key)
         
-        private_key_obj = keys.PrivateKey(private_key_bytes)
-        signature_obj = private_key_obj.sign_msg_hash(encoded_message.body)
-        signature_bytes = signature_obj.to_bytes()
-        v = signature_bytes[64]
-        if v in (0, 1):
-            v_out = v + 27
-        else:
-            v_out = v
-        return signature_bytes[:64] + bytes([v_out])
+        signatures = []
+        for data_message in data_messages:
+            data_hash = _keccak256(encoder(data_message))
+            typed_data_hash = _keccak256(_EIP712_PREFIX + domain_hash + data_hash)
+            signatures.append(_sign_hash(signer, typed_data_hash))
+        return signatures
         
     except Exception as e:
-        raise SDKError(f"EIP-712 signing failed: {str(e)}")
+        raise _signing_error(e)
+
+
+def sign_with_domain_separator(private_key: Union[bytes, Signer], domain_hash: bytes, data_message: Dict[str, Any],
+                               encoder: Callable[[Dict[str, Any]], bytes]) -> bytes:
+    """Like sign, for callers that keep the domain separator and struct encoder of a fixed schema around."""
+    try:
+        data_hash = _keccak256(encoder(data_message))
+        typed_data_hash = _keccak256(_EIP712_PREFIX + domain_hash + data_hash)
+        return _sign_hash(as_signer(private_key), typed_data_hash)
+    except Exception as e:
+        raise _signing_error(e)
+
+
+def domain_separator(domain: Domain) -> bytes:
+    return _domain_separator(domain.name, domain.version, domain.chain_id, domain.verifying_contract)
+
+
+def _signing_error(e: Exception) -> Exception:
+    # Imported lazily: sdk's package __init__ imports private.ipc, which imports this module
+    from sdk.common import SDKError
+    return SDKError(f"EIP-712 signing failed: {str(e)}")
+
+
+def _sign_hash(signer: Signer, msg_hash: bytes) -> bytes:
+    signature_bytes = signer.sign_digest(msg_hash)
+    v = signature_bytes[64]
+    if v in (0, 1):
+        v_out = v + 27
+    else:
+        v_out = v
+    return signature_bytes[:64] + bytes([v_out])
 
 
 def encode_type(primary_type: str, types: Dict[str, List[TypedData]]) -> str:
-    result = primary_type + "("
-    
-    first = True
-    for field in types[primary_type]:
-        if not first:
-            result += ","
-        result += field.type + " " + field.name
-        first = False
-    
-    result += ")"
-    return result
+    fields = ",".join(f"{field.type} {field.name}" for field in types[primary_type])
+    return f"{primary_type}({fields})"
 
 
 def type_hash(primary_type: str, types: Dict[str, List[TypedData]]) -> bytes:
+    fields = tuple((field.name, field.type) for field in types[primary_type])
+    return _type_hash(primary_type, fields)
+
+
+@lru_cache(maxsize=32)
+def _type_hash(primary_type: str, fields: Tuple[Tuple[str, str], ...]) -> bytes:
+    types = {primary_type: [TypedData(name, type_name) for name, type_name in fields]}
     encoded_type = encode_type(primary_type, types)
-    hash_obj = keccak.new(digest_bits=256)
-    hash_obj.update(encoded_type.encode())
-    return hash_obj.digest()
+    return _keccak256(encoded_type.encode())
 
 
-def hash_typed_data(domain: Domain, data_message: Dict[str, Any], 
-                   data_types: Dict[str, List[TypedData]]) -> bytes:
-    
-    domain_types = {
-        "EIP712Domain": [
-            TypedData("name", "string"),
-            TypedData("version", "string"),
-            TypedData("chainId", "uint256"),
-            TypedData("verifyingContract", "address"),
-        ]
-    }
-    
+@lru_cache(maxsize=32)
+def _domain_separator(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    """Domain inputs are fixed for a deployment, so the separator is computed once per domain."""
     domain_message = {
-        "name": domain.name,
-        "version": domain.version,
-        "chainId": domain.chain_id,
-        "verifyingContract": domain.verifying_contract,
+        "name": name,
+        "version": version,
+        "chainId": chain_id,
+        "verifyingContract": verifying_contract,
     }
     
-    domain_hash = encode_data("EIP712Domain", domain_message, domain_types)
-    data_hash = encode_data("StorageData", data_message, data_types)
-    raw_data = bytes([0x19, 0x01]) + domain_hash + data_hash
+    return encode_data("EIP712Domain", domain_message, _DOMAIN_TYPES)
+
+
+def hash_typed_data(domain: Domain, data_message: Dict[str, Any], 
+                   data_types: Dict[str, List[TypedData]]) -> bytes:
     
-    hash_obj = keccak.new(digest_bits=256)
-    hash_obj.update(raw_data)
-    final_hash = hash_obj.digest()
+    domain_hash = _domain_separator(domain.name, domain.version, domain.chain_id, domain.verifying_contract)
+    data_hash = encode_data("StorageData", data_message, data_types)
+    raw_data = _EIP712_PREFIX + domain_hash + data_hash
     
-    return final_hash
+    return _keccak256(raw_data)
 
 
 def encode_data(primary_type: str, data: Dict[str, Any], 
                types: Dict[str, List[TypedData]]) -> bytes:
-    
-    type_hash_bytes = type_hash(primary_type, types)
-    
-    encoded_data = [type_hash_bytes]
-    
-    for field in types[primary_type]:
-        value = data[field.name]
-        encoded_value = encode_value(value, field.type)
-        encoded_data.append(encoded_value)
-    
-    combined = b''.join(encoded_data)
-    hash_obj = keccak.new(digest_bits=256)
-    hash_obj.update(combined)
-    return hash_obj.digest()
+    return _keccak256(struct_encoder(primary_type, types)(data))
+
+
+def struct_encoder(primary_type: str, types: Dict[str, List[TypedData]]) -> Callable[[Dict[str, Any]], bytes]:
+    """Returns a function mapping a message to its encoded struct (type hash followed by field words)."""
+    fields = tuple((field.name, field.type) for field in types[primary_type])
+    return _compile_struct_encoder(primary_type, fields)
+
+
+@lru_cache(maxsize=32)
+def _compile_struct_encoder(primary_type: str, fields: Tuple[Tuple[str, str], ...]) -> Callable[[Dict[str, Any]], bytes]:
+    """Generates a straight-line encoder per struct shape, so encoding a message is
+    one concatenation of per-field encoder calls with no loop or type dispatch."""
+    namespace: Dict[str, Any] = {"_type_hash": _type_hash(primary_type, fields)}
+    parts = ["_type_hash"]
+    for i, (name, type_name) in enumerate(fields):
+        encoder = _ENCODERS.get(type_name)
+        if encoder is None:
+            raise ValueError(f"unsupported type: {type_name}")
+        namespace[f"_enc{i}"] = encoder
+        parts.append(f"_enc{i}(data[{name!r}])")
+
+    source = f"def encode(data):\n    return {' + '.join(parts)}\n"
+    exec(compile(source, f"<eip712 encoder {primary_type}>", "exec"), namespace)
+    return namespace["encode"]
 
 
 def encode_value(value: Any, type_name: str) -> bytes:
-    
-    if type_name == "string":
-        if not isinstance(value, str):
-            raise ValueError(f"expected string, got {type(value)}")
-        hash_obj = keccak.new(digest_bits=256)
-        hash_obj.update(value.encode())
-        return hash_obj.digest()
-    
-    elif type_name == "bytes":
-        if not isinstance(value, (bytes, bytearray)):
-            raise ValueError(f"expected bytes, got {type(value)}")
-        hash_obj = keccak.new(digest_bits=256)
-        hash_obj.update(bytes(value))
-        return hash_obj.digest()
-    
-    elif type_name == "bytes32":
-        if isinstance(value, (bytes, bytearray)):
-            if len(value) != 32:
-                raise ValueError(f"expected 32 bytes, got {len(value)}")
-            return bytes(value)
-        else:
-            raise ValueError(f"expected bytes32, got {type(value)}")
-    
-    elif type_name == "uint8":
-        if not isinstance(value, int):
-            raise ValueError(f"expected int, got {type(value)}")
-        if not (0 <= value <= 255):
-            raise ValueError(f"uint8 value out of range: {value}")
-        buf = bytearray(32)
-        buf[31] = value
-        return bytes(buf)
-    
-    elif type_name == "uint64":
-        if not isinstance(value, int):
-            raise ValueError(f"expected int, got {type(value)}")
-        if not (0 <= value < 2**64):
-            raise ValueError(f"uint64 value out of range: {value}")
-        buf = bytearray(32)
-        struct.pack_into('>Q', buf, 24, value)
-        return bytes(buf)
-    
-    elif type_name == "uint256":
-        if isinstance(value, int):
-            if value < 0:
-                raise ValueError(f"uint256 cannot be negative: {value}")
-            buf = bytearray(32)
-            value_bytes = value.to_bytes(32, byteorder='big')
-            buf[:] = value_bytes
-            return bytes(buf)
-        else:
-            raise ValueError(f"expected int for uint256, got {type(value)}")
-    
-    elif type_name == "address":
-        if isinstance(value, str):
-            addr_str = value.lower()
-            if addr_str.startswith('0x'):
-                addr_str = addr_str[2:]
-            if len(addr_str) != 40:
-                raise ValueError(f"invalid address length: {len(addr_str)}")
-            addr_bytes = bytes.fromhex(addr_str)
-        elif isinstance(value, (bytes, bytearray)):
-            if len(value) != 20:
-                raise ValueError(f"address must be 20 bytes, got {len(value)}")
-            addr_bytes = bytes(value)
-        else:
-            raise ValueError(f"expected string or bytes for address, got {type(value)}")
-        
-        buf = bytearray(32)
-        buf[12:32] = addr_bytes
-        return bytes(buf)
-    
-    else:
+    encoder = _ENCODERS.get(type_name)
+    if encoder is None:
         raise ValueError(f"unsupported type: {type_name}")
+    return encoder(value)
+
+
+def _encode_string(value: Any) -> bytes:
+    if not isinstance(value, str):
+        raise ValueError(f"expected string, got {type(value)}")
+    return _keccak256(value.encode())
+
+
+def _encode_bytes(value: Any) -> bytes:
+    if not isinstance(value, (bytes, bytearray)):
+        raise ValueError(f"expected bytes, got {type(value)}")
+    if len(value) <= _CACHED_BYTES_MAX_LEN:
+        return _cached_keccak256(bytes(value))
+    return _keccak256(bytes(value))
+
+
+# Every block of a chunk signs the same chunkCID, so hashes of short dynamic
+# byte values are memoized; long values are hashed directly to bound memory.
+_CACHED_BYTES_MAX_LEN = 128
+_cached_keccak256 = lru_cache(maxsize=256)(_keccak256)
+
+
+def _encode_bytes32(value: Any) -> bytes:
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) != 32:
+            raise ValueError(f"expected 32 bytes, got {len(value)}")
+        return bytes(value)
+    else:
+        raise ValueError(f"expected bytes32, got {type(value)}")
+
+
+def _encode_uint8(value: Any) -> bytes:
+    if not isinstance(value, int):
+        raise ValueError(f"expected int, got {type(value)}")
+    if not (0 <= value <= 255):
+        raise ValueError(f"uint8 value out of range: {value}")
+    return _UINT8_WORDS[value]
+
+
+def _encode_uint64(value: Any) -> bytes:
+    if not isinstance(value, int):
+        raise ValueError(f"expected int, got {type(value)}")
+    if not (0 <= value < 2**64):
+        raise ValueError(f"uint64 value out of range: {value}")
+    return value.to_bytes(32, byteorder='big')
+
+
+def _encode_uint256(value: Any) -> bytes:
+    if isinstance(value, int):
+        if value < 0:
+            raise ValueError(f"uint256 cannot be negative: {value}")
+        return value.to_bytes(32, byteorder='big')
+    else:
+        raise ValueError(f"expected int for uint256, got {type(value)}")
+
+
+def _encode_address(value: Any) -> bytes:
+    if isinstance(value, str):
+        addr_bytes = _address_to_20bytes(value)
+    elif isinstance(value, (bytes, bytearray)):
+        if len(value) != 20:
+            raise ValueError(f"address must be 20 bytes, got {len(value)}")
+        addr_bytes = bytes(value)
+    else:
+        raise ValueError(f"expected string or bytes for address, got {type(value)}")
+    
+    return _ADDRESS_PADDING + addr_bytes
+
+
+@lru_cache(maxsize=1024)
+def _address_to_20bytes(address: str) -> bytes:
+    addr_str = address.lower()
+    if addr_str.startswith('0x'):
+        addr_str = addr_str[2:]
+    if len(addr_str) != 40:
+        raise ValueError(f"invalid address length: {len(addr_str)}")
+    return bytes.fromhex(addr_str)
+
+
+_UINT8_WORDS = [bytes(31) + bytes([i]) for i in range(256)]
+_ADDRESS_PADDING = bytes(12)
+
+_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "string": _encode_string,
+    "bytes": _encode_bytes,
+    "bytes32": _encode_bytes32,
+    "uint8": _encode_uint8,
+    "uint64": _encode_uint64,
+    "uint256": _encode_uint256,
+    "address": _encode_address,
+}
 
 
 def recover_signer_address(signature: bytes, domain: Domain, data_message: Dict[str, Any], 
                           data_types: Dict[str, List[TypedData]]) -> str:
     
     hash_bytes = hash_typed_data(domain, data_message, data_types)
-    
+    return recover_signer_address_from_hash(signature, hash_bytes)
+
+
+def recover_signer_address_from_hash(signature: bytes, hash_bytes: bytes) -> str:
     sig_copy = bytearray(signature)
     if sig_copy[64] >= 27:
         sig_copy[64] -= 27
     
-    from eth_keys import keys
+    if coincurve is not None:
+        public_key = coincurve.PublicKey.from_signature_and_message(bytes(sig_copy), hash_bytes, hasher=None)
+        return to_checksum_address(_keccak256(public_key.format(compressed=False)[1:])[-20:])
+    
     signature_obj = keys.Signature(bytes(sig_copy))
     public_key = signature_obj.recover_public_key_from_msg_hash(hash_bytes)
     
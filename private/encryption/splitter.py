@@ -1,31 +1,59 @@
 import io
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, BinaryIO, Iterator
 
 from .encryption import encrypt
 
 
+_BLOCK_INFO_PREFIX = b"block_"
+
+
+def _block_info(counter: int) -> bytes:
+    # HKDF info for block N is b"block_N"; ascii-encoding the counter skips f-string formatting
+    return _BLOCK_INFO_PREFIX + str(counter).encode('ascii')
+
+
 class Splitter:
     
-    def __init__(self, key: bytes, reader: BinaryIO, block_size: int):
-        self.key = key
+    def __init__(self, key: bytes, reader: BinaryIO, block_size: int, prefetch: int = 0):
+        self.key = bytes(key)
         self.reader = reader
         self.block_size = block_size
+        self.prefetch = prefetch
         self.counter = 0
         self._eof_reached = False
+        # Allocated on the first readinto; the prefetch path and readers without readinto never need it
+        self._buffer: Optional[bytearray] = None
+        self._view: Optional[memoryview] = None
+        
+    def _read_block(self):
+        # readinto fills one reusable buffer instead of allocating a fresh bytes per block;
+        # encrypt copies the plaintext out, so the buffer can be overwritten on the next read.
+        readinto = getattr(self.reader, 'readinto', None)
+        if readinto is None:
+            return self.reader.read(self.block_size)
+        if self._buffer is None:
+            self._buffer = bytearray(self.block_size)
+            self._view = memoryview(self._buffer)
+        n = readinto(self._buffer)
+        if not n:
+            return None
+        return self._view[:n]
         
     def next_bytes(self) -> Optional[bytes]:
         if self._eof_reached:
             return None
             
         try:
-            data = self.reader.read(self.block_size)
+            data = self._read_block()
             
             if not data:
                 self._eof_reached = True
                 return None
                 
-            info_string = f"block_{self.counter}"
-            info = info_string.encode('utf-8')
+            info = _block_info(self.counter)
             
             encrypted_data = encrypt(self.key, data, info)
             
@@ -37,12 +65,44 @@ class Splitter:
             raise Exception(f"splitter error: {str(e)}")
     
     def __iter__(self) -> Iterator[bytes]:
+        if self.prefetch > 0:
+            yield from self._iter_prefetch()
+            return
         while True:
             chunk = self.next_bytes()
             if chunk is None:
                 break
             yield chunk
     
+    def _iter_prefetch(self) -> Iterator[bytes]:
+        # Reads stay sequential on the caller's thread since the reader is stateful; up to
+        # `prefetch` blocks are encrypted ahead on the pool (AES-GCM releases the GIL) and
+        # yielded in order. Each block gets its own bytes, so the shared read buffer is not used.
+        workers = min(self.prefetch, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            while True:
+                while len(pending) < self.prefetch and not self._eof_reached:
+                    try:
+                        data = self.reader.read(self.block_size)
+                    except Exception as e:
+                        raise Exception(f"splitter error: {str(e)}")
+                    if not data:
+                        self._eof_reached = True
+                        break
+                    info = _block_info(self.counter)
+                    pending.append(executor.submit(encrypt, self.key, data, info))
+                    self.counter += 1
+                
+                if not pending:
+                    break
+                
+                try:
+                    chunk = pending.popleft().result()
+                except Exception as e:
+                    raise Exception(f"splitter error: {str(e)}")
+                yield chunk
+    
     def reset(self, new_reader: Optional[BinaryIO] = None):
         
         if new_reader is not None:
@@ -55,11 +115,11 @@ class Splitter:
         self._eof_reached = False
 
 
-def new_splitter(key: bytes, reader: BinaryIO, block_size: int) -> Splitter:
+def new_splitter(key: bytes, reader: BinaryIO, block_size: int, prefetch: int = 0) -> Splitter:
     if len(key) == 0:
         raise ValueError("encryption key cannot be empty")
     
     if len(key) != 32:
         raise ValueError("encryption key must be 32 bytes long")
         
-    return Splitter(key, reader, block_size) 
\ No newline at end of file
+    return Splitter(key, reader, block_size, prefetch)
\ No newline at end of file
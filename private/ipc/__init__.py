@@ -1,9 +1,10 @@
-from .client import Client, Config, TransactionFailedError
+from .client import Client, Config, NonceManager, TransactionFailedError
 from .errors import error_hash_to_error, parse_errors_to_hashes
 
 __all__ = [
     'Client',
     'Config',
+    'NonceManager',
     'TransactionFailedError',
     'error_hash_to_error',
     'parse_errors_to_hashes'
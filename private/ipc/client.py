@@ -1,7 +1,11 @@
 import time
 import threading
+import itertools
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, List, Dict, Any, Union, NamedTuple
+from requests import Session
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.middleware.proof_of_authority import ExtraDataToPOAMiddleware
 from web3.exceptions import TransactionNotFound
@@ -9,6 +13,11 @@ from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from .contracts import StorageContract, AccessManagerContract
 from .ipc import StorageData, sign_block
+from ..signer import Signer
+
+# Sizing of the JSON-RPC connection pool: HTTP_POOL_SIZE host pools, each keeping
+# up to 2 * HTTP_POOL_SIZE connections. requests' default of 10 queues concurrent sends.
+HTTP_POOL_SIZE = 64
 
 @dataclass
 class Config:
@@ -17,6 +26,8 @@ class Config:
     storage_contract_address: str = ""
     access_contract_address: str = ""
     policy_factory_contract_address: str = ""
+    # Number of host pools; each keeps up to 2 * http_pool_size connections.
+    http_pool_size: int = HTTP_POOL_SIZE
 
     @staticmethod
     def default_config() -> 'Config':
@@ -30,6 +41,15 @@ class ContractsAddresses:
     policy_factory: str = ""
 
 
+def new_http_provider(dial_uri: str, pool_size: int = HTTP_POOL_SIZE) -> Web3.HTTPProvider:
+    """Creates an HTTPProvider whose session keeps pool_size host pools of up to 2 * pool_size connections each."""
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size * 2, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return Web3.HTTPProvider(dial_uri, session=session)
+
+
 class BatchReceiptRequest(NamedTuple):
     hash: str
     key: str
@@ -50,6 +70,38 @@ class TransactionFailedError(Exception):
     pass
 
 
+class NonceManager:
+    """Hands out sequential transaction nonces for one account.
+
+    The pending nonce is fetched once and then advanced locally; ``next()`` on an
+    ``itertools.count`` is atomic under the GIL, so the common path takes no lock.
+    The lock only guards the RPC refetch on first use and after ``reset_nonce``.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self.web3 = web3
+        self.address = address
+        self._lock = threading.Lock()
+        self._counter: Optional[itertools.count] = None
+
+    def get_nonce(self) -> int:
+        counter = self._counter
+        if counter is None:
+            counter = self._sync()
+        return next(counter)
+
+    def reset_nonce(self) -> None:
+        with self._lock:
+            self._counter = None
+
+    def _sync(self) -> itertools.count:
+        with self._lock:
+            if self._counter is None:
+                nonce = self.web3.eth.get_transaction_count(self.address, 'pending')
+                self._counter = itertools.count(nonce)
+            return self._counter
+
+
 class Client:    
     def __init__(self, web3: Web3, auth: LocalAccount, storage: StorageContract, 
                  access_manager: Optional[AccessManagerContract] = None,
@@ -68,10 +120,15 @@ class Client:
         self.addresses = addresses or ContractsAddresses()
         self._chain_id = chain_id
 
+    @cached_property
+    def signer(self) -> Signer:
+        """Signing key for ``auth``, loaded on first use and released with the client."""
+        return Signer(self.auth.key)
+
     @classmethod
     def dial(cls, config: Config) -> 'Client':
         try:
-            client = Web3(Web3.HTTPProvider(config.dial_uri))
+            client = Web3(new_http_provider(config.dial_uri, config.http_pool_size))
             if not client.is_connected():
                 raise ConnectionError(f"Failed to connect to {config.dial_uri}")
         except Exception as e:
@@ -132,7 +189,7 @@ class Client:
 
     @classmethod
     def deploy_contracts(cls, config: Config) -> 'Client':
-        eth_client = Web3(Web3.HTTPProvider(config.dial_uri))
+        eth_client = Web3(new_http_provider(config.dial_uri, config.http_pool_size))
         if not eth_client.is_connected():
             raise ConnectionError(f"Failed to connect to {config.dial_uri}")
 
@@ -267,7 +324,11 @@ class Client:
             for req in requests:
                 batch_requests.append(('eth_getTransactionReceipt', [req.hash]))
             
-            raw_responses = self.eth.manager.request_blocking_batch(batch_requests)
+            # One JSON-RPC batch round trip; the raw provider call is used because web3's
+            # batch_requests() aborts the whole batch on a single not-yet-mined receipt.
+            raw_responses = self.eth.provider.make_batch_request(batch_requests)
+            if not isinstance(raw_responses, list):
+                raise ValueError(raw_responses.get('error', {}).get('message', 'batch request failed'))
             
             responses = []
             for i, (req, raw_response) in enumerate(zip(requests, raw_responses)):
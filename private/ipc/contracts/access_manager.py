@@ -4,9 +4,121 @@ from web3 import Web3
 from web3.contract import Contract
 import json
 
+from .contract_cache import get_contract
+from .signing import sign_transaction
+from .tx_params import shared_tx_params
+
+
 class AccessManagerContract:
     """Python bindings for the AccessManager smart contract."""
     
+    # Contract ABI from the Go bindings
+    abi = [
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "_storageContract",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "constructor"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "isPublic",
+                    "type": "bool"
+                }
+            ],
+            "name": "changePublicAccess",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "getFileAccessInfo",
+            "outputs": [
+                {
+                    "internalType": "address",
+                    "name": "",
+                    "type": "address"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "getPolicy",
+            "outputs": [
+                {
+                    "internalType": "address",
+                    "name": "",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "address",
+                    "name": "policyContract",
+                    "type": "address"
+                }
+            ],
+            "name": "setPolicy",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "storageContract",
+            "outputs": [
+                {
+                    "internalType": "address",
+                    "name": "",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        }
+    ]
+
     def __init__(self, web3: Web3, contract_address: HexAddress):
         """Initialize the AccessManager contract interface.
         
@@ -16,115 +128,8 @@ class AccessManagerContract:
         """
         self.web3 = web3
         self.contract_address = contract_address
-        
-        # Contract ABI from the Go bindings
-        self.abi = [
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "_storageContract",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "constructor"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "isPublic",
-                        "type": "bool"
-                    }
-                ],
-                "name": "changePublicAccess",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "getFileAccessInfo",
-                "outputs": [
-                    {
-                        "internalType": "address",
-                        "name": "",
-                        "type": "address"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "getPolicy",
-                "outputs": [
-                    {
-                        "internalType": "address",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "address",
-                        "name": "policyContract",
-                        "type": "address"
-                    }
-                ],
-                "name": "setPolicy",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "storageContract",
-                "outputs": [
-                    {
-                        "internalType": "address",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        self.contract = web3.eth.contract(address=contract_address, abi=self.abi)
+        self.contract = get_contract(web3, contract_address, self.abi)
+        self._tx_params = shared_tx_params(web3)
 
     def change_public_access(self, auth, file_id: bytes, is_public: bool) -> HexStr:
         """Changes the public access status of a file matching Go SDK signature.
@@ -137,35 +142,18 @@ class AccessManagerContract:
         Returns:
             Transaction hash
         """
-        from eth_account import Account
-        
-        # Build transaction
         function = self.contract.functions.changePublicAccess(file_id, is_public)
         
-        # Get transaction parameters
-        tx_params = {
-            'from': auth.address,
-            'gas': 500000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(auth.address),
-        }
-        
-        # Build the transaction
-        tx = function.build_transaction(tx_params)
-        
-        # Sign the transaction
-        if isinstance(auth.key, str):
-            # Key is hex string, parse it
-            key_str = auth.key.replace('0x', '')
-            private_key_bytes = bytes.fromhex(key_str)
-        else:
-            # Key is already bytes
-            private_key_bytes = auth.key
-            
-        signed_tx = Account.sign_transaction(tx, private_key_bytes)
-        
-        # Send the transaction
-        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        # The nonce comes from the cache shared with the other contract wrappers
+        # on this web3 instance and is handed back if the send does not go out.
+        tx_params = self._tx_params.prep(auth.address)
+        try:
+            tx_params['gas'] = 500000
+            tx = function.build_transaction(tx_params)
+            tx_hash = self.web3.eth.send_raw_transaction(sign_transaction(tx, auth.key))
+        except Exception:
+            self._tx_params.invalidate_nonce(auth.address)
+            raise
         
         return tx_hash.hex()
 
@@ -177,8 +165,7 @@ class AccessManagerContract:
             is_public: Whether the file should be publicly accessible
             from_address: Address changing the access
         """
-        tx_hash = self.contract.functions.changePublicAccess(file_id, is_public).transact({'from': from_address})
-        self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        self._transact_from(self.contract.functions.changePublicAccess(file_id, is_public), from_address)
 
     def get_file_access_info(self, file_id: bytes) -> Tuple[HexAddress, bool]:
         """Gets access information for a file.
@@ -210,8 +197,18 @@ class AccessManagerContract:
             policy_contract: Address of the policy contract
             from_address: Address setting the policy
         """
-        tx_hash = self.contract.functions.setPolicy(file_id, policy_contract).transact({'from': from_address})
-        self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        self._transact_from(self.contract.functions.setPolicy(file_id, policy_contract), from_address)
+
+    def _transact_from(self, function, from_address: HexAddress) -> None:
+        # Node-signed sends still take their nonce from the shared cache, so they
+        # can be mixed with the locally signed sends from the same account.
+        tx_params = self._tx_params.prep(from_address)
+        try:
+            tx_hash = function.transact(tx_params)
+            self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        except Exception:
+            self._tx_params.invalidate_nonce(from_address)
+            raise
 
     def get_storage_contract(self) -> HexAddress:
         """Gets the address of the associated storage contract.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional, Dict, Any
 
 from eth_typing import Address, HexStr
@@ -7,6 +8,9 @@ from web3 import Web3
 from web3.contract import Contract
 from eth_account.signers.local import LocalAccount
 
+from .contract_cache import get_contract
+from .tx_params import get_raw_transaction
+
 
 class AkaveTokenMetaData:
     ABI = [
@@ -42,23 +46,33 @@ class AkaveTokenTransactor:
     def __init__(self, contract: Contract, web3: Web3):
         self.contract = contract
         self.web3 = web3
+        self._grant_role = contract.functions.grantRole
 
     def grant_role(self, account: LocalAccount, role: bytes, grantee: Address, tx_params: Optional[Dict[str, Any]] = None) -> HexStr:
-        params = {"from": account.address, "gasPrice": self.web3.eth.gas_price}
+        params = {"from": account.address}
         if tx_params:
             params.update(tx_params)
-        tx = self.contract.functions.grantRole(role, grantee).build_transaction(params)
+        # Callers granting roles in bulk can pass gasPrice/gas (or EIP-1559 fees) to skip the per-call RPCs
+        if "gasPrice" not in params and "maxFeePerGas" not in params:
+            params["gasPrice"] = self.web3.eth.gas_price
+        tx = self._grant_role(role, grantee).build_transaction(params)
         signed = account.sign_transaction(tx)
-        tx_hash = self.web3.eth.send_raw_transaction(getattr(signed, "raw_transaction", getattr(signed, "rawTransaction")))
+        tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed))
         return tx_hash.hex()
 
 
 class AkaveToken:
     def __init__(self, w3: Web3, address: Address):
         self.web3 = w3
-        self.contract = w3.eth.contract(address=address, abi=AkaveTokenMetaData.ABI)
-        self.caller = AkaveTokenCaller(self.contract)
-        self.transactor = AkaveTokenTransactor(self.contract, w3)
+        self.contract = get_contract(w3, address, AkaveTokenMetaData.ABI)
+
+    @cached_property
+    def caller(self) -> AkaveTokenCaller:
+        return AkaveTokenCaller(self.contract)
+
+    @cached_property
+    def transactor(self) -> AkaveTokenTransactor:
+        return AkaveTokenTransactor(self.contract, self.web3)
 
     @property
     def address(self) -> Address:
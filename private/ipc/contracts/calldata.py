@@ -0,0 +1,14 @@
+from typing import Any, Sequence
+
+from eth_abi import encode
+from eth_utils import keccak
+
+
+def function_selector(signature: str) -> bytes:
+    """Returns the 4-byte selector for a canonical signature such as ``assignRole(address)``."""
+    return keccak(text=signature)[:4]
+
+
+def encode_call(selector: bytes, types: Sequence[str], args: Sequence[Any]) -> bytes:
+    """Builds calldata without going through web3's contract function proxies."""
+    return selector + encode(types, args)
@@ -0,0 +1,119 @@
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Type
+
+from web3 import Web3
+from web3.contract import Contract
+
+CONTRACT_CACHE_SIZE = 1024
+FACTORY_CACHE_SIZE = 64
+CHECKSUM_CACHE_SIZE = 4096
+
+_lock = threading.Lock()
+_contracts: "OrderedDict[Tuple[int, str, int], Tuple[Web3, Sequence[Any], Contract]]" = OrderedDict()
+_factories: "OrderedDict[Tuple[int, int], Tuple[Web3, Sequence[Any], Type[Contract]]]" = OrderedDict()
+
+
+def freeze_abi(abi: Iterable[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Returns an immutable copy of an ABI so it can be shared as a cache key.
+
+    Top-level entries become read-only mappings inside a tuple; web3 accepts
+    this shape wherever it takes a list of dicts.
+    """
+    return tuple(MappingProxyType(entry) for entry in abi)
+
+
+@lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def checksum_address(address: str) -> str:
+    """Returns the EIP-55 form of an address, hashing each distinct input only once."""
+    return Web3.to_checksum_address(address)
+
+
+class LazyABI:
+    """Class-level descriptor that parses a JSON ABI on first access.
+
+    The parsed ABI is frozen and kept, so every later access returns the same
+    object and identity-keyed caches keep working. ABIs that are never used
+    are never materialized.
+    """
+
+    def __init__(self, abi_json: str):
+        self._abi_json = abi_json
+        self._abi: Optional[Tuple[Mapping[str, Any], ...]] = None
+
+    def __get__(self, obj: Any, owner: Any = None) -> Tuple[Mapping[str, Any], ...]:
+        if self._abi is None:
+            abi = freeze_abi(json.loads(self._abi_json))
+            with _lock:
+                if self._abi is None:
+                    self._abi = abi
+        return self._abi
+
+
+def get_contract_factory(w3: Web3, abi: Sequence[Any]) -> Type[Contract]:
+    """Returns the contract class web3 builds for an ABI, parsed once per web3 instance.
+
+    Factories live in an LRU of ``FACTORY_CACHE_SIZE`` entries. Like contracts,
+    entries keep their web3 instance alive so an id cannot be reused while it
+    is cached, and evicted web3 instances are released.
+    """
+    key = (id(w3), id(abi))
+    with _lock:
+        entry = _factories.get(key)
+        if entry is not None:
+            _factories.move_to_end(key)
+            return entry[2]
+
+    factory = w3.eth.contract(abi=abi)
+    with _lock:
+        entry = _factories.setdefault(key, (w3, abi, factory))
+        _factories.move_to_end(key)
+        while len(_factories) > FACTORY_CACHE_SIZE:
+            _factories.popitem(last=False)
+    return entry[2]
+
+
+def get_contract(w3: Web3, address: str, abi: Sequence[Any]) -> Contract:
+    """Returns a shared ``w3.eth.contract`` instance for the given address and ABI.
+
+    Building a contract parses the whole ABI, so wrappers that are created often
+    reuse one instance per (web3, address, ABI) in an LRU of
+    ``CONTRACT_CACHE_SIZE`` entries, and new addresses are bound through a
+    per-ABI factory. The web3 instance and ABI are keyed by identity, which is
+    why ABIs should be module or class level constants. Entries keep both
+    objects alive so their ids cannot be reused. Addresses are checksummed
+    before lookup, so differently cased inputs share an entry.
+
+    Args:
+        w3: Web3 instance
+        address: Contract address
+        abi: Contract ABI
+
+    Returns:
+        Contract instance bound to ``w3``
+    """
+    address = checksum_address(address)
+    key = (id(w3), address, id(abi))
+    with _lock:
+        entry = _contracts.get(key)
+        if entry is not None:
+            _contracts.move_to_end(key)
+            return entry[2]
+
+    contract = get_contract_factory(w3, abi)(address=address)
+    with _lock:
+        _contracts[key] = (w3, abi, contract)
+        _contracts.move_to_end(key)
+        while len(_contracts) > CONTRACT_CACHE_SIZE:
+            _contracts.popitem(last=False)
+    return contract
+
+
+def clear_contract_cache() -> None:
+    """Drops every cached contract instance and factory."""
+    with _lock:
+        _contracts.clear()
+        _factories.clear()
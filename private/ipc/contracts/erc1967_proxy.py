@@ -5,6 +5,7 @@ This file is auto-generated - DO NOT EDIT manually.
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from eth_typing import Address, HexStr, HexAddress
 from web3 import Web3
@@ -12,6 +13,9 @@ from web3.contract import Contract
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 
+from .contract_cache import get_contract
+from .tx_params import get_raw_transaction
+
 
 class ERC1967ProxyMetaData:
     """Metadata for the ERC1967Proxy contract."""
@@ -96,31 +100,26 @@ class ERC1967ProxyTransactor:
         Returns:
             Transaction hash
         """
-        params = {
-            "from": account.address,
-            "gasPrice": self.web3.eth.gas_price,
-            "data": calldata
-        }
-        if tx_params:
-            params.update(tx_params)
-        
         # Build transaction manually since this is a fallback call
         tx = {
             "to": self.contract.address,
             "from": account.address,
-            "data": calldata,
-            "gasPrice": self.web3.eth.gas_price
+            "data": calldata
         }
         if tx_params:
             tx.update(tx_params)
         
+        # Only query the legacy gas price when the caller didn't supply fees (incl. EIP-1559 ones)
+        if "gasPrice" not in tx and "maxFeePerGas" not in tx:
+            tx["gasPrice"] = self.web3.eth.gas_price
+        
         # Estimate gas if not provided
         if "gas" not in tx:
             tx["gas"] = self.web3.eth.estimate_gas(tx)
         
         # Sign and send transaction
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
 
 
@@ -190,15 +189,20 @@ class ERC1967Proxy:
         """
         self.web3 = web3
         self.contract_address = contract_address
-        self.contract = web3.eth.contract(
-            address=contract_address,
-            abi=ERC1967ProxyMetaData.ABI
-        )
-        
-        # Initialize component bindings
-        self.caller = ERC1967ProxyCaller(self.contract)
-        self.transactor = ERC1967ProxyTransactor(self.contract, web3)
-        self.filterer = ERC1967ProxyFilterer(self.contract)
+        self.contract = get_contract(web3, contract_address, ERC1967ProxyMetaData.ABI)
+    
+    # Component bindings are built on first use
+    @cached_property
+    def caller(self) -> ERC1967ProxyCaller:
+        return ERC1967ProxyCaller(self.contract)
+    
+    @cached_property
+    def transactor(self) -> ERC1967ProxyTransactor:
+        return ERC1967ProxyTransactor(self.contract, self.web3)
+    
+    @cached_property
+    def filterer(self) -> ERC1967ProxyFilterer:
+        return ERC1967ProxyFilterer(self.contract)
     
     @classmethod
     def deploy(cls, web3: Web3, account: LocalAccount, implementation: Address, 
@@ -222,13 +226,14 @@ class ERC1967Proxy:
         )
         
         # Build deployment transaction
-        params = {
-            "from": account.address,
-            "gasPrice": web3.eth.gas_price
-        }
+        params = {"from": account.address}
         if tx_params:
             params.update(tx_params)
         
+        # Only query the legacy gas price when the caller didn't supply fees (incl. EIP-1559 ones)
+        if "gasPrice" not in params and "maxFeePerGas" not in params:
+            params["gasPrice"] = web3.eth.gas_price
+        
         tx = contract_factory.constructor(implementation, data).build_transaction(params)
         
         # Estimate gas if not provided
@@ -237,7 +242,7 @@ class ERC1967Proxy:
         
         # Sign and send transaction
         signed_tx = account.sign_transaction(tx)
-        tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         
         # Wait for transaction receipt
         tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
@@ -0,0 +1,43 @@
+from typing import List, Optional, Sequence, Tuple
+
+from eth_abi import decode
+from web3 import Web3
+
+from .calldata import encode_call, function_selector
+
+# Multicall3 is deployed at the same address on most EVM chains.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SELECTOR = function_selector("aggregate3((address,bool,bytes)[])")
+
+
+class MulticallUnavailable(Exception):
+    """Raised when no Multicall3 contract answers at the configured address."""
+
+
+def aggregate(w3: Web3, calls: Sequence[Tuple[str, bytes]],
+              multicall_address: str = MULTICALL3_ADDRESS) -> List[Optional[bytes]]:
+    """Runs several read-only calls in a single eth_call through Multicall3.aggregate3.
+
+    Args:
+        w3: Web3 instance
+        calls: (target address, calldata) pairs
+        multicall_address: Address of the Multicall3 contract
+
+    Returns:
+        Return data per call, or None where that call reverted
+
+    Raises:
+        MulticallUnavailable: If there is no Multicall3 contract at multicall_address
+    """
+    if not calls:
+        return []
+
+    data = encode_call(AGGREGATE3_SELECTOR, ['(address,bool,bytes)[]'],
+                       [[(target, True, calldata) for target, calldata in calls]])
+    result = w3.eth.call({'to': multicall_address, 'data': data})
+    if not result:
+        raise MulticallUnavailable(f"no Multicall3 contract at {multicall_address}")
+
+    (results,) = decode(['(bool,bytes)[]'], result)
+    return [return_data if success else None for success, return_data in results]
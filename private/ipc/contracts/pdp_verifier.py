@@ -7,6 +7,9 @@ from web3.contract import Contract
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 
+from .contract_cache import checksum_address, get_contract
+from .tx_params import get_raw_transaction
+
 
 class CidsCid:
     def __init__(self, data: bytes):
@@ -572,11 +575,8 @@ class PDPVerifierMetaData:
 class PDPVerifier:
     def __init__(self, w3: Web3, address: str):
         self.w3 = w3
-        self.address = Web3.to_checksum_address(address)
-        self.contract = w3.eth.contract(
-            address=self.address,
-            abi=PDPVerifierMetaData.ABI
-        )
+        self.address = checksum_address(address)
+        self.contract = get_contract(w3, self.address, PDPVerifierMetaData.ABI)
     
     # Constants
     def extra_data_max_size(self) -> int:
@@ -682,7 +682,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def claim_proof_set_ownership(self, account: LocalAccount, set_id: int, gas_limit: int = 1000000) -> str:
@@ -693,7 +693,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def create_proof_set(self, account: LocalAccount, listener_addr: str, extra_data: bytes, value: int = 0, gas_limit: int = 1000000) -> str:
@@ -707,7 +707,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def delete_proof_set(self, account: LocalAccount, set_id: int, extra_data: bytes, gas_limit: int = 1000000) -> str:
@@ -718,7 +718,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def next_proving_period(self, account: LocalAccount, set_id: int, challenge_epoch: int, extra_data: bytes, gas_limit: int = 1000000) -> str:
@@ -731,7 +731,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def propose_proof_set_owner(self, account: LocalAccount, set_id: int, new_owner: str, gas_limit: int = 1000000) -> str:
@@ -742,7 +742,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def prove_possession(self, account: LocalAccount, set_id: int, proofs: List[Tuple], value: int = 0, gas_limit: int = 1000000) -> str:
@@ -754,7 +754,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def renounce_ownership(self, account: LocalAccount, gas_limit: int = 1000000) -> str:
@@ -765,7 +765,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def schedule_removals(self, account: LocalAccount, set_id: int, root_ids: List[int], extra_data: bytes, gas_limit: int = 1000000) -> str:
@@ -778,7 +778,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
     
     def transfer_ownership(self, account: LocalAccount, new_owner: str, gas_limit: int = 1000000) -> str:
@@ -789,7 +789,7 @@ class PDPVerifier:
         })
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
 
 
@@ -811,7 +811,7 @@ def deploy_pdp_verifier(w3: Web3, account: LocalAccount, challenge_finality: int
     })
     
     signed_tx = account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    tx_hash = w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
     
     receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
     
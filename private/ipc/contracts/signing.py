@@ -0,0 +1,45 @@
+from typing import Any, Dict, Union
+
+import rlp
+from eth_account import Account
+from eth_hash.auto import keccak
+
+from ...signer import Signer, as_signer
+from .tx_params import get_raw_transaction
+
+
+def sign_transaction(tx: Dict[str, Any], private_key: Union[str, bytes, Signer]) -> bytes:
+    """Signs a transaction and returns the raw bytes to pass to send_raw_transaction.
+
+    Legacy EIP-155 transactions (``gasPrice`` and ``chainId`` set, which is what
+    the contract wrappers build) are RLP-encoded and signed directly with
+    libsecp256k1 through coincurve, or eth_keys when coincurve is missing.
+    Anything else goes through ``Account.sign_transaction``. Pass a Signer kept
+    by the caller to avoid reloading the key for every transaction.
+    """
+    signer = as_signer(private_key)
+    if 'gasPrice' not in tx or 'chainId' not in tx or 'maxFeePerGas' in tx or tx.get('type') not in (None, 0, '0x0'):
+        return get_raw_transaction(Account.sign_transaction(tx, signer.secret))
+
+    chain_id = tx['chainId']
+    fields = [
+        tx['nonce'],
+        tx['gasPrice'],
+        tx['gas'],
+        _hex_to_bytes(tx.get('to', b'')),
+        tx.get('value', 0),
+        _hex_to_bytes(tx.get('data', b'')),
+    ]
+    digest = keccak(rlp.encode(fields + [chain_id, 0, 0]))
+    signature = signer.sign_digest(digest)
+
+    v = signature[64] + 35 + 2 * chain_id
+    r = int.from_bytes(signature[:32], 'big')
+    s = int.from_bytes(signature[32:64], 'big')
+    return rlp.encode(fields + [v, r, s])
+
+
+def _hex_to_bytes(value: Union[str, bytes]) -> bytes:
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+    return bytes(value)
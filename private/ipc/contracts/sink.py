@@ -12,6 +12,9 @@ from web3.contract import Contract
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 
+from .contract_cache import checksum_address, get_contract
+from .tx_params import get_raw_transaction
+
 
 class SinkMetaData:
     """Metadata for the Sink contract."""
@@ -32,11 +35,8 @@ class SinkContract:
     def __init__(self, w3: Web3, address: str):
         """Initialize Sink contract interface."""
         self.w3 = w3
-        self.address = Web3.to_checksum_address(address)
-        self.contract = w3.eth.contract(
-            address=self.address,
-            abi=SinkMetaData.ABI
-        )
+        self.address = checksum_address(address)
+        self.contract = get_contract(w3, self.address, SinkMetaData.ABI)
     
     # Fallback function
     def fallback(self, account: LocalAccount, data: bytes = b'', value: int = 0, gas_limit: int = 500000) -> str:
@@ -51,7 +51,7 @@ class SinkContract:
         }
         
         signed_tx = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        tx_hash = self.w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
         return tx_hash.hex()
 
 
@@ -79,7 +79,7 @@ def deploy_sink(w3: Web3, account: LocalAccount, gas_limit: int = 500000) -> Tup
     })
     
     signed_tx = account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    tx_hash = w3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
     
     # Wait for transaction receipt
     receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
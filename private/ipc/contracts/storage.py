@@ -1,2077 +1,2122 @@
-from typing import List, Tuple, Optional
+import asyncio
+from typing import List, Tuple, Optional, Union
 from eth_typing import HexAddress, HexStr
 from web3 import Web3
 from web3.contract import Contract
-from eth_account import Account
-
-def get_raw_transaction(signed_tx):
-    if hasattr(signed_tx, 'raw_transaction'):
-        return signed_tx.raw_transaction  # web3 v7+
-    elif hasattr(signed_tx, 'rawTransaction'):
-        return signed_tx.rawTransaction   # web3 v6
-    else:
-        raise AttributeError("SignedTransaction has neither raw_transaction nor rawTransaction attribute")
+from eth_abi import decode
+from hexbytes import HexBytes
+from .tx_params import get_raw_transaction, shared_tx_params
+from .contract_cache import LazyABI, checksum_address, get_contract
+from .calldata import encode_call, function_selector
+from .signing import sign_transaction
+from .multicall import MulticallUnavailable, aggregate
+from ..errors import error_hash_to_error
+from ...signer import Signer
 import json
 
+# web3's wait_for_transaction_receipt defaults
+RECEIPT_POLL_LATENCY = 0.1
+RECEIPT_TIMEOUT = 120.0
+
+# Node errors meaning the cached nonce is behind the chain; resync and send again once.
+STALE_NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced")
+
+CREATE_BUCKET_SELECTOR = function_selector("createBucket(string)")
+CREATE_FILE_SELECTOR = function_selector("createFile(bytes32,string)")
+COMMIT_FILE_SELECTOR = function_selector("commitFile(bytes32,string,uint256,uint256,bytes)")
+DELETE_BUCKET_SELECTOR = function_selector("deleteBucket(bytes32,string,uint256)")
+DELETE_FILE_SELECTOR = function_selector("deleteFile(bytes32,bytes32,string,uint256)")
+GET_FILE_BY_NAME_SELECTOR = function_selector("getFileByName(bytes32,string)")
+ADD_FILE_CHUNK_SELECTOR = function_selector("addFileChunk(bytes,bytes32,string,uint256,bytes32[],uint256[],uint256)")
+ADD_FILE_CHUNKS_SELECTOR = function_selector("addFileChunks(bytes[],bytes32,string,uint256[],bytes32[][],uint256[][],uint256)")
+INITIALIZE_SELECTOR = function_selector("initialize(address)")
+ADD_PEER_BLOCK_SELECTOR = function_selector("addPeerBlock(bytes32,bytes32,string,bool)")
+DELETE_PEER_BLOCK_SELECTOR = function_selector("deletePeerBlock(bytes32,bytes32,bytes32,string,uint256)")
+SET_ACCESS_MANAGER_SELECTOR = function_selector("setAccessManager(address)")
+UPGRADE_TO_AND_CALL_SELECTOR = function_selector("upgradeToAndCall(address,bytes)")
+
+# IStorage.FillChunkBlockArgs
+FILL_CHUNK_BLOCK_ARGS_TYPE = "(bytes32,bytes32,bytes32,uint256,uint256,uint8,string,bytes,uint256)"
+FILL_CHUNK_BLOCK_SELECTOR = function_selector(f"fillChunkBlock({FILL_CHUNK_BLOCK_ARGS_TYPE})")
+FILL_CHUNK_BLOCKS_SELECTOR = function_selector(f"fillChunkBlocks({FILL_CHUNK_BLOCK_ARGS_TYPE}[])")
+
+# IStorage.File as returned by getFileByName
+FILE_TYPE = "(bytes32,bytes,bytes32,string,uint256,uint256,uint256,(bytes[],uint256[]))"
+
+
+def _decode_file(data: bytes) -> tuple:
+    # Match web3's call output, which returns arrays as lists
+    file_info = decode([FILE_TYPE], data)[0]
+    chunk_cids, chunk_sizes = file_info[7]
+    return (*file_info[:7], (list(chunk_cids), list(chunk_sizes)))
+
 class StorageContract:
     """Python bindings for the Storage smart contract."""
     
-    def __init__(self, web3: Web3, contract_address: HexAddress):
+    # Contract ABI from the Go bindings
+    abi = LazyABI("""
+    [
+        {
+            "inputs": [],
+            "stateMutability": "nonpayable",
+            "type": "constructor"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "target",
+                    "type": "address"
+                }
+            ],
+            "name": "AddressEmptyCode",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BlockAlreadyExists",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BlockAlreadyFilled",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BlockInvalid",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BlockNonexists",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BucketAlreadyExists",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BucketInvalid",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BucketInvalidOwner",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BucketNonempty",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "BucketNonexists",
+            "type": "error"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes",
+                    "name": "fileCID",
+                    "type": "bytes"
+                }
+            ],
+            "name": "ChunkCIDMismatch",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "ECDSAInvalidSignature",
+            "type": "error"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "length",
+                    "type": "uint256"
+                }
+            ],
+            "name": "ECDSAInvalidSignatureLength",
+            "type": "error"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "s",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "ECDSAInvalidSignatureS",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileAlreadyExists",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileChunkDuplicate",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileFullyUploaded",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileInvalid",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileNameDuplicate",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileNonempty",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileNotExists",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "FileNotFilled",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "IndexMismatch",
+            "type": "error"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "cidsLength",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "sizesLength",
+                    "type": "uint256"
+                }
+            ],
+            "name": "InvalidArrayLength",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidBlockIndex",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidBlocksAmount",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidEncodedSize",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidFileBlocksCount",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidFileCID",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidLastBlockSize",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "InvalidShortString",
+            "type": "error"
+        },
+        {
+            "inputs": [],
+            "name": "LastChunkDuplicate",
+            "type": "error"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "str",
+                    "type": "string"
+                }
+            ],
+            "name": "StringTooLong",
+            "type": "error"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": false,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "AddFile",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "CreateBucket",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": false,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "CreateFile",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "DeleteBucket",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": false,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "DeleteFile",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "blockId",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "bytes",
+                    "name": "peerId",
+                    "type": "bytes"
+                }
+            ],
+            "name": "DeletePeerBlock",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [],
+            "name": "EIP712DomainChanged",
+            "type": "event"
+        },
+        {
+            "anonymous": false,
+            "inputs": [
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "indexed": true,
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "indexed": false,
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "FileUploaded",
+            "type": "event"
+        },
+        {
+            "inputs": [],
+            "name": "MAX_BLOCKS_PER_FILE",
+            "outputs": [
+                {
+                    "internalType": "uint64",
+                    "name": "",
+                    "type": "uint64"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "MAX_BLOCK_SIZE",
+            "outputs": [
+                {
+                    "internalType": "uint64",
+                    "name": "",
+                    "type": "uint64"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "accessManager",
+            "outputs": [
+                {
+                    "internalType": "contract IAccessManager",
+                    "name": "",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes",
+                    "name": "cid",
+                    "type": "bytes"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "encodedChunkSize",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "bytes32[]",
+                    "name": "cids",
+                    "type": "bytes32[]"
+                },
+                {
+                    "internalType": "uint256[]",
+                    "name": "chunkBlocksSizes",
+                    "type": "uint256[]"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "chunkIndex",
+                    "type": "uint256"
+                }
+            ],
+            "name": "addFileChunk",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes",
+                    "name": "peerId",
+                    "type": "bytes"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "isReplica",
+                    "type": "bool"
+                }
+            ],
+            "name": "addPeerBlock",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                }
+            ],
+            "name": "createBucket",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                }
+            ],
+            "name": "createFile",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "encodedFileSize",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "actualSize",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "bytes",
+                    "name": "fileCID",
+                    "type": "bytes"
+                }
+            ],
+            "name": "commitFile",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                }
+            ],
+            "name": "deleteBucket",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileID",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                }
+            ],
+            "name": "deleteFile",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                }
+            ],
+            "name": "getBucketByName",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "address",
+                            "name": "owner",
+                            "type": "address"
+                        },
+                        {
+                            "internalType": "bytes32[]",
+                            "name": "files",
+                            "type": "bytes32[]"
+                        }
+                    ],
+                    "internalType": "struct IStorage.Bucket",
+                    "name": "bucket",
+                    "type": "tuple"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "bucketName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileOffset",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileLimit",
+                    "type": "uint256"
+                }
+            ],
+            "name": "getBucketByName",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "address",
+                            "name": "owner",
+                            "type": "address"
+                        },
+                        {
+                            "internalType": "bytes32[]",
+                            "name": "files",
+                            "type": "bytes32[]"
+                        }
+                    ],
+                    "internalType": "struct IStorage.Bucket",
+                    "name": "bucket",
+                    "type": "tuple"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                }
+            ],
+            "name": "getFileByName",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "fileCID",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "encodedSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "actualSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "components": [
+                                {
+                                    "internalType": "bytes[]",
+                                    "name": "chunkCIDs",
+                                    "type": "bytes[]"
+                                },
+                                {
+                                    "internalType": "uint256[]",
+                                    "name": "chunkSize",
+                                    "type": "uint256[]"
+                                }
+                            ],
+                            "internalType": "struct IStorage.Chunk",
+                            "name": "chunks",
+                            "type": "tuple"
+                        }
+                    ],
+                    "internalType": "struct IStorage.File",
+                    "name": "file",
+                    "type": "tuple"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                }
+            ],
+            "name": "getFileByName",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "fileCID",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "encodedSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "actualSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "components": [
+                                {
+                                    "internalType": "bytes[]",
+                                    "name": "chunkCIDs",
+                                    "type": "bytes[]"
+                                },
+                                {
+                                    "internalType": "uint256[]",
+                                    "name": "chunkSize",
+                                    "type": "uint256[]"
+                                }
+                            ],
+                            "internalType": "struct IStorage.Chunk",
+                            "name": "chunks",
+                            "type": "tuple"
+                        }
+                    ],
+                    "internalType": "struct IStorage.File",
+                    "name": "file",
+                    "type": "tuple"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "getFileIndexById",
+            "outputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "isFileFilled",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "isFileFilledV2",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "UPGRADE_INTERFACE_VERSION",
+            "outputs": [
+                {
+                    "internalType": "string",
+                    "name": "",
+                    "type": "string"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes[]",
+                    "name": "cids",
+                    "type": "bytes[]"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256[]",
+                    "name": "encodedChunkSizes",
+                    "type": "uint256[]"
+                },
+                {
+                    "internalType": "bytes32[][]",
+                    "name": "chunkBlocksCIDs",
+                    "type": "bytes32[][]"
+                },
+                {
+                    "internalType": "uint256[][]",
+                    "name": "chunkBlockSizes",
+                    "type": "uint256[][]"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "startingChunkIndex",
+                    "type": "uint256"
+                }
+            ],
+            "name": "addFileChunks",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "getFileById",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "fileCID",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "encodedSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "actualSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "components": [
+                                {
+                                    "internalType": "bytes[]",
+                                    "name": "chunkCIDs",
+                                    "type": "bytes[]"
+                                },
+                                {
+                                    "internalType": "uint256[]",
+                                    "name": "chunkSize",
+                                    "type": "uint256[]"
+                                }
+                            ],
+                            "internalType": "struct IStorage.Chunk",
+                            "name": "chunks",
+                            "type": "tuple"
+                        }
+                    ],
+                    "internalType": "struct IStorage.File",
+                    "name": "file",
+                    "type": "tuple"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "bucketName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "getBucketIndexByName",
+            "outputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "exists",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "chunkIndex",
+                    "type": "uint256"
+                }
+            ],
+            "name": "isChunkFilled",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "fileId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "uint8",
+                    "name": "blockIndex",
+                    "type": "uint8"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "chunkIndex",
+                    "type": "uint256"
+                }
+            ],
+            "name": "isBlockFilled",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "version",
+            "outputs": [
+                {
+                    "internalType": "string",
+                    "name": "",
+                    "type": "string"
+                }
+            ],
+            "stateMutability": "pure",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "getChainID",
+            "outputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "",
+                    "type": "uint256"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "getFileOwner",
+            "outputs": [
+                {
+                    "internalType": "address",
+                    "name": "",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32[]",
+                    "name": "ids",
+                    "type": "bytes32[]"
+                }
+            ],
+            "name": "getBucketsByIds",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "address",
+                            "name": "owner",
+                            "type": "address"
+                        },
+                        {
+                            "internalType": "bytes32[]",
+                            "name": "files",
+                            "type": "bytes32[]"
+                        }
+                    ],
+                    "internalType": "struct IStorage.Bucket[]",
+                    "name": "",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "offset",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "limit",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileOffset",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileLimit",
+                    "type": "uint256"
+                }
+            ],
+            "name": "getOwnerBuckets",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "address",
+                            "name": "owner",
+                            "type": "address"
+                        },
+                        {
+                            "internalType": "bytes32[]",
+                            "name": "files",
+                            "type": "bytes32[]"
+                        }
+                    ],
+                    "internalType": "struct IStorage.Bucket[]",
+                    "name": "buckets",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "tokenAddress",
+                    "type": "address"
+                }
+            ],
+            "name": "initialize",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "timestamp",
+            "outputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "",
+                    "type": "uint256"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "token",
+            "outputs": [
+                {
+                    "internalType": "contractIAkaveToken",
+                    "name": "",
+                    "type": "address"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "peerId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "isReplica",
+                    "type": "bool"
+                }
+            ],
+            "name": "addPeerBlock",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "peerId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                }
+            ],
+            "name": "deletePeerBlock",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "blockCID",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "nodeId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "chunkIndex",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "nonce",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint8",
+                            "name": "blockIndex",
+                            "type": "uint8"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "fileName",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "signature",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "deadline",
+                            "type": "uint256"
+                        }
+                    ],
+                    "internalType": "struct IStorage.FillChunkBlockArgs",
+                    "name": "args",
+                    "type": "tuple"
+                }
+            ],
+            "name": "fillChunkBlock",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "blockCID",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "nodeId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "chunkIndex",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "nonce",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint8",
+                            "name": "blockIndex",
+                            "type": "uint8"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "fileName",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "signature",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "deadline",
+                            "type": "uint256"
+                        }
+                    ],
+                    "internalType": "struct IStorage.FillChunkBlockArgs[]",
+                    "name": "args",
+                    "type": "tuple[]"
+                }
+            ],
+            "name": "fillChunkBlocks",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "id",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                }
+            ],
+            "name": "getChunkByIndex",
+            "outputs": [
+                {
+                    "internalType": "bytes",
+                    "name": "",
+                    "type": "bytes"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "",
+                    "type": "uint256"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "string",
+                    "name": "bucketName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "bucketId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "address",
+                    "name": "owner",
+                    "type": "address"
+                }
+            ],
+            "name": "getFullFileInfo",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "bytes",
+                            "name": "fileCID",
+                            "type": "bytes"
+                        },
+                        {
+                            "internalType": "bytes32",
+                            "name": "bucketId",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "encodedSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "actualSize",
+                            "type": "uint256"
+                        },
+                        {
+                            "components": [
+                                {
+                                    "internalType": "bytes[]",
+                                    "name": "chunkCIDs",
+                                    "type": "bytes[]"
+                                },
+                                {
+                                    "internalType": "uint256[]",
+                                    "name": "chunkSize",
+                                    "type": "uint256[]"
+                                }
+                            ],
+                            "internalType": "struct IStorage.Chunk",
+                            "name": "chunks",
+                            "type": "tuple"
+                        }
+                    ],
+                    "internalType": "struct IStorage.File",
+                    "name": "file",
+                    "type": "tuple"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "exists",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32[]",
+                    "name": "ids",
+                    "type": "bytes32[]"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "bucketOffset",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "bucketLimit",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileOffset",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "fileLimit",
+                    "type": "uint256"
+                }
+            ],
+            "name": "getBucketsByIdsWithFiles",
+            "outputs": [
+                {
+                    "components": [
+                        {
+                            "internalType": "bytes32",
+                            "name": "id",
+                            "type": "bytes32"
+                        },
+                        {
+                            "internalType": "string",
+                            "name": "name",
+                            "type": "string"
+                        },
+                        {
+                            "internalType": "uint256",
+                            "name": "createdAt",
+                            "type": "uint256"
+                        },
+                        {
+                            "internalType": "address",
+                            "name": "owner",
+                            "type": "address"
+                        },
+                        {
+                            "internalType": "bytes32[]",
+                            "name": "files",
+                            "type": "bytes32[]"
+                        }
+                    ],
+                    "internalType": "struct IStorage.Bucket[]",
+                    "name": "buckets",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "peerId",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                }
+            ],
+            "name": "getPeerBlockIndexById",
+            "outputs": [
+                {
+                    "internalType": "uint256",
+                    "name": "index",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "bool",
+                    "name": "exists",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32[]",
+                    "name": "cids",
+                    "type": "bytes32[]"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                }
+            ],
+            "name": "getPeersArrayByPeerBlockCid",
+            "outputs": [
+                {
+                    "internalType": "bytes32[][]",
+                    "name": "peers",
+                    "type": "bytes32[][]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "string",
+                    "name": "fileName",
+                    "type": "string"
+                }
+            ],
+            "name": "getPeersByPeerBlockCid",
+            "outputs": [
+                {
+                    "internalType": "bytes32[]",
+                    "name": "peers",
+                    "type": "bytes32[]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "cid",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "peerId",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "isPeerBlockReplica",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "fileFillCounter",
+            "outputs": [
+                {
+                    "internalType": "uint16",
+                    "name": "",
+                    "type": "uint16"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "name": "fileRewardClaimed",
+            "outputs": [
+                {
+                    "internalType": "bool",
+                    "name": "",
+                    "type": "bool"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "",
+                    "type": "uint256"
+                }
+            ],
+            "name": "fulfilledBlocks",
+            "outputs": [
+                {
+                    "internalType": "uint32",
+                    "name": "",
+                    "type": "uint32"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "eip712Domain",
+            "outputs": [
+                {
+                    "internalType": "bytes1",
+                    "name": "fields",
+                    "type": "bytes1"
+                },
+                {
+                    "internalType": "string",
+                    "name": "name",
+                    "type": "string"
+                },
+                {
+                    "internalType": "string",
+                    "name": "version",
+                    "type": "string"
+                },
+                {
+                    "internalType": "uint256",
+                    "name": "chainId",
+                    "type": "uint256"
+                },
+                {
+                    "internalType": "address",
+                    "name": "verifyingContract",
+                    "type": "address"
+                },
+                {
+                    "internalType": "bytes32",
+                    "name": "salt",
+                    "type": "bytes32"
+                },
+                {
+                    "internalType": "uint256[]",
+                    "name": "extensions",
+                    "type": "uint256[]"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [],
+            "name": "proxiableUUID",
+            "outputs": [
+                {
+                    "internalType": "bytes32",
+                    "name": "",
+                    "type": "bytes32"
+                }
+            ],
+            "stateMutability": "view",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "accessManagerAddress",
+                    "type": "address"
+                }
+            ],
+            "name": "setAccessManager",
+            "outputs": [],
+            "stateMutability": "nonpayable",
+            "type": "function"
+        },
+        {
+            "inputs": [
+                {
+                    "internalType": "address",
+                    "name": "newImplementation",
+                    "type": "address"
+                },
+                {
+                    "internalType": "bytes",
+                    "name": "data",
+                    "type": "bytes"
+                }
+            ],
+            "name": "upgradeToAndCall",
+            "outputs": [],
+            "stateMutability": "payable",
+            "type": "function"
+        }
+    ]
+    """)
+
+    def __init__(self, web3: Web3, contract_address: HexAddress,
+                 receipt_poll_latency: float = RECEIPT_POLL_LATENCY, receipt_timeout: float = RECEIPT_TIMEOUT):
         """Initialize the Storage contract interface.
         
         Args:
             web3: Web3 instance
             contract_address: Address of the deployed Storage contract
+            receipt_poll_latency: Seconds between receipt polls; raise towards the block time to cut RPC load
+            receipt_timeout: Seconds to wait for a transaction receipt
         """
         self.web3 = web3
-        self.contract_address = contract_address
-        
-        # Contract ABI from the Go bindings
-        self.abi = [
-            {
-                "inputs": [],
-                "stateMutability": "nonpayable",
-                "type": "constructor"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "target",
-                        "type": "address"
-                    }
-                ],
-                "name": "AddressEmptyCode",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BlockAlreadyExists",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BlockAlreadyFilled",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BlockInvalid",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BlockNonexists",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BucketAlreadyExists",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BucketInvalid",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BucketInvalidOwner",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BucketNonempty",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "BucketNonexists",
-                "type": "error"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes",
-                        "name": "fileCID",
-                        "type": "bytes"
-                    }
-                ],
-                "name": "ChunkCIDMismatch",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "ECDSAInvalidSignature",
-                "type": "error"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "length",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "ECDSAInvalidSignatureLength",
-                "type": "error"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "s",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "ECDSAInvalidSignatureS",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileAlreadyExists",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileChunkDuplicate",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileFullyUploaded",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileInvalid",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileNameDuplicate",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileNonempty",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileNotExists",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "FileNotFilled",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "IndexMismatch",
-                "type": "error"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "cidsLength",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "sizesLength",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "InvalidArrayLength",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidBlockIndex",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidBlocksAmount",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidEncodedSize",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidFileBlocksCount",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidFileCID",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidLastBlockSize",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "InvalidShortString",
-                "type": "error"
-            },
-            {
-                "inputs": [],
-                "name": "LastChunkDuplicate",
-                "type": "error"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "str",
-                        "type": "string"
-                    }
-                ],
-                "name": "StringTooLong",
-                "type": "error"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": False,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "AddFile",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "CreateBucket",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": False,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "CreateFile",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "DeleteBucket",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": False,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "DeleteFile",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "blockId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "bytes",
-                        "name": "peerId",
-                        "type": "bytes"
-                    }
-                ],
-                "name": "DeletePeerBlock",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [],
-                "name": "EIP712DomainChanged",
-                "type": "event"
-            },
-            {
-                "anonymous": False,
-                "inputs": [
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "indexed": True,
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "indexed": False,
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "FileUploaded",
-                "type": "event"
-            },
-            {
-                "inputs": [],
-                "name": "MAX_BLOCKS_PER_FILE",
-                "outputs": [
-                    {
-                        "internalType": "uint64",
-                        "name": "",
-                        "type": "uint64"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "MAX_BLOCK_SIZE",
-                "outputs": [
-                    {
-                        "internalType": "uint64",
-                        "name": "",
-                        "type": "uint64"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "accessManager",
-                "outputs": [
-                    {
-                        "internalType": "contract IAccessManager",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes",
-                        "name": "cid",
-                        "type": "bytes"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "encodedChunkSize",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "bytes32[]",
-                        "name": "cids",
-                        "type": "bytes32[]"
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "chunkBlocksSizes",
-                        "type": "uint256[]"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "chunkIndex",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "addFileChunk",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes",
-                        "name": "peerId",
-                        "type": "bytes"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "isReplica",
-                        "type": "bool"
-                    }
-                ],
-                "name": "addPeerBlock",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    }
-                ],
-                "name": "createBucket",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    }
-                ],
-                "name": "createFile",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "encodedFileSize",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "actualSize",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "bytes",
-                        "name": "fileCID",
-                        "type": "bytes"
-                    }
-                ],
-                "name": "commitFile",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "deleteBucket",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileID",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "deleteFile",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    }
-                ],
-                "name": "getBucketByName",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address"
-                            },
-                            {
-                                "internalType": "bytes32[]",
-                                "name": "files",
-                                "type": "bytes32[]"
-                            }
-                        ],
-                        "internalType": "struct IStorage.Bucket",
-                        "name": "bucket",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "bucketName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileOffset",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileLimit",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "getBucketByName",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address"
-                            },
-                            {
-                                "internalType": "bytes32[]",
-                                "name": "files",
-                                "type": "bytes32[]"
-                            }
-                        ],
-                        "internalType": "struct IStorage.Bucket",
-                        "name": "bucket",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    }
-                ],
-                "name": "getFileByName",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "fileCID",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "encodedSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "actualSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "components": [
-                                    {
-                                        "internalType": "bytes[]",
-                                        "name": "chunkCIDs",
-                                        "type": "bytes[]"
-                                    },
-                                    {
-                                        "internalType": "uint256[]",
-                                        "name": "chunkSize",
-                                        "type": "uint256[]"
-                                    }
-                                ],
-                                "internalType": "struct IStorage.Chunk",
-                                "name": "chunks",
-                                "type": "tuple"
-                            }
-                        ],
-                        "internalType": "struct IStorage.File",
-                        "name": "file",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    }
-                ],
-                "name": "getFileByName",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "fileCID",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "encodedSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "actualSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "components": [
-                                    {
-                                        "internalType": "bytes[]",
-                                        "name": "chunkCIDs",
-                                        "type": "bytes[]"
-                                    },
-                                    {
-                                        "internalType": "uint256[]",
-                                        "name": "chunkSize",
-                                        "type": "uint256[]"
-                                    }
-                                ],
-                                "internalType": "struct IStorage.Chunk",
-                                "name": "chunks",
-                                "type": "tuple"
-                            }
-                        ],
-                        "internalType": "struct IStorage.File",
-                        "name": "file",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "getFileIndexById",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "isFileFilled",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "isFileFilledV2",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "UPGRADE_INTERFACE_VERSION",
-                "outputs": [
-                    {
-                        "internalType": "string",
-                        "name": "",
-                        "type": "string"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes[]",
-                        "name": "cids",
-                        "type": "bytes[]"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "encodedChunkSizes",
-                        "type": "uint256[]"
-                    },
-                    {
-                        "internalType": "bytes32[][]",
-                        "name": "chunkBlocksCIDs",
-                        "type": "bytes32[][]"
-                    },
-                    {
-                        "internalType": "uint256[][]",
-                        "name": "chunkBlockSizes",
-                        "type": "uint256[][]"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "startingChunkIndex",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "addFileChunks",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "getFileById",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "fileCID",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "encodedSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "actualSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "components": [
-                                    {
-                                        "internalType": "bytes[]",
-                                        "name": "chunkCIDs",
-                                        "type": "bytes[]"
-                                    },
-                                    {
-                                        "internalType": "uint256[]",
-                                        "name": "chunkSize",
-                                        "type": "uint256[]"
-                                    }
-                                ],
-                                "internalType": "struct IStorage.Chunk",
-                                "name": "chunks",
-                                "type": "tuple"
-                            }
-                        ],
-                        "internalType": "struct IStorage.File",
-                        "name": "file",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "bucketName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "getBucketIndexByName",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "exists",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "chunkIndex",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "isChunkFilled",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "fileId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "uint8",
-                        "name": "blockIndex",
-                        "type": "uint8"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "chunkIndex",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "isBlockFilled",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "version",
-                "outputs": [
-                    {
-                        "internalType": "string",
-                        "name": "",
-                        "type": "string"
-                    }
-                ],
-                "stateMutability": "pure",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "getChainID",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "getFileOwner",
-                "outputs": [
-                    {
-                        "internalType": "address",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32[]",
-                        "name": "ids",
-                        "type": "bytes32[]"
-                    }
-                ],
-                "name": "getBucketsByIds",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address"
-                            },
-                            {
-                                "internalType": "bytes32[]",
-                                "name": "files",
-                                "type": "bytes32[]"
-                            }
-                        ],
-                        "internalType": "struct IStorage.Bucket[]",
-                        "name": "",
-                        "type": "tuple[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "offset",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "limit",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileOffset",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileLimit",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "getOwnerBuckets",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address"
-                            },
-                            {
-                                "internalType": "bytes32[]",
-                                "name": "files",
-                                "type": "bytes32[]"
-                            }
-                        ],
-                        "internalType": "struct IStorage.Bucket[]",
-                        "name": "buckets",
-                        "type": "tuple[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "tokenAddress",
-                        "type": "address"
-                    }
-                ],
-                "name": "initialize",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "timestamp",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "token",
-                "outputs": [
-                    {
-                        "internalType": "contractIAkaveToken",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "peerId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "isReplica",
-                        "type": "bool"
-                    }
-                ],
-                "name": "addPeerBlock",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "peerId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "deletePeerBlock",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "blockCID",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "nodeId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "chunkIndex",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "nonce",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint8",
-                                "name": "blockIndex",
-                                "type": "uint8"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "fileName",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "signature",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "deadline",
-                                "type": "uint256"
-                            }
-                        ],
-                        "internalType": "struct IStorage.FillChunkBlockArgs",
-                        "name": "args",
-                        "type": "tuple"
-                    }
-                ],
-                "name": "fillChunkBlock",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "blockCID",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "nodeId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "chunkIndex",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "nonce",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint8",
-                                "name": "blockIndex",
-                                "type": "uint8"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "fileName",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "signature",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "deadline",
-                                "type": "uint256"
-                            }
-                        ],
-                        "internalType": "struct IStorage.FillChunkBlockArgs[]",
-                        "name": "args",
-                        "type": "tuple[]"
-                    }
-                ],
-                "name": "fillChunkBlocks",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "id",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "getChunkByIndex",
-                "outputs": [
-                    {
-                        "internalType": "bytes",
-                        "name": "",
-                        "type": "bytes"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "string",
-                        "name": "bucketName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "bucketId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "address",
-                        "name": "owner",
-                        "type": "address"
-                    }
-                ],
-                "name": "getFullFileInfo",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "bytes",
-                                "name": "fileCID",
-                                "type": "bytes"
-                            },
-                            {
-                                "internalType": "bytes32",
-                                "name": "bucketId",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "encodedSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "actualSize",
-                                "type": "uint256"
-                            },
-                            {
-                                "components": [
-                                    {
-                                        "internalType": "bytes[]",
-                                        "name": "chunkCIDs",
-                                        "type": "bytes[]"
-                                    },
-                                    {
-                                        "internalType": "uint256[]",
-                                        "name": "chunkSize",
-                                        "type": "uint256[]"
-                                    }
-                                ],
-                                "internalType": "struct IStorage.Chunk",
-                                "name": "chunks",
-                                "type": "tuple"
-                            }
-                        ],
-                        "internalType": "struct IStorage.File",
-                        "name": "file",
-                        "type": "tuple"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "exists",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32[]",
-                        "name": "ids",
-                        "type": "bytes32[]"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "bucketOffset",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "bucketLimit",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileOffset",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "fileLimit",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "getBucketsByIdsWithFiles",
-                "outputs": [
-                    {
-                        "components": [
-                            {
-                                "internalType": "bytes32",
-                                "name": "id",
-                                "type": "bytes32"
-                            },
-                            {
-                                "internalType": "string",
-                                "name": "name",
-                                "type": "string"
-                            },
-                            {
-                                "internalType": "uint256",
-                                "name": "createdAt",
-                                "type": "uint256"
-                            },
-                            {
-                                "internalType": "address",
-                                "name": "owner",
-                                "type": "address"
-                            },
-                            {
-                                "internalType": "bytes32[]",
-                                "name": "files",
-                                "type": "bytes32[]"
-                            }
-                        ],
-                        "internalType": "struct IStorage.Bucket[]",
-                        "name": "buckets",
-                        "type": "tuple[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "peerId",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    }
-                ],
-                "name": "getPeerBlockIndexById",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "index",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "bool",
-                        "name": "exists",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32[]",
-                        "name": "cids",
-                        "type": "bytes32[]"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    }
-                ],
-                "name": "getPeersArrayByPeerBlockCid",
-                "outputs": [
-                    {
-                        "internalType": "bytes32[][]",
-                        "name": "peers",
-                        "type": "bytes32[][]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "fileName",
-                        "type": "string"
-                    }
-                ],
-                "name": "getPeersByPeerBlockCid",
-                "outputs": [
-                    {
-                        "internalType": "bytes32[]",
-                        "name": "peers",
-                        "type": "bytes32[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "cid",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "peerId",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "isPeerBlockReplica",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "fileFillCounter",
-                "outputs": [
-                    {
-                        "internalType": "uint16",
-                        "name": "",
-                        "type": "uint16"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "name": "fileRewardClaimed",
-                "outputs": [
-                    {
-                        "internalType": "bool",
-                        "name": "",
-                        "type": "bool"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "",
-                        "type": "uint256"
-                    }
-                ],
-                "name": "fulfilledBlocks",
-                "outputs": [
-                    {
-                        "internalType": "uint32",
-                        "name": "",
-                        "type": "uint32"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "eip712Domain",
-                "outputs": [
-                    {
-                        "internalType": "bytes1",
-                        "name": "fields",
-                        "type": "bytes1"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "name",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "string",
-                        "name": "version",
-                        "type": "string"
-                    },
-                    {
-                        "internalType": "uint256",
-                        "name": "chainId",
-                        "type": "uint256"
-                    },
-                    {
-                        "internalType": "address",
-                        "name": "verifyingContract",
-                        "type": "address"
-                    },
-                    {
-                        "internalType": "bytes32",
-                        "name": "salt",
-                        "type": "bytes32"
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "extensions",
-                        "type": "uint256[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "proxiableUUID",
-                "outputs": [
-                    {
-                        "internalType": "bytes32",
-                        "name": "",
-                        "type": "bytes32"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "accessManagerAddress",
-                        "type": "address"
-                    }
-                ],
-                "name": "setAccessManager",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "address",
-                        "name": "newImplementation",
-                        "type": "address"
-                    },
-                    {
-                        "internalType": "bytes",
-                        "name": "data",
-                        "type": "bytes"
-                    }
-                ],
-                "name": "upgradeToAndCall",
-                "outputs": [],
-                "stateMutability": "payable",
-                "type": "function"
-            }
-        ]
+        self.receipt_poll_latency = receipt_poll_latency
+        self.receipt_timeout = receipt_timeout
+        self._tx_params = shared_tx_params(web3)
         
         try:
-            self.contract = web3.eth.contract(address=contract_address, abi=self.abi)
+            self.contract_address = checksum_address(contract_address)
+            self.contract = get_contract(web3, self.contract_address, self.abi)
         except Exception as e:
             # Hide the ABI details from error messages
             error_msg = str(e)
@@ -2080,6 +2125,106 @@ class StorageContract:
             else:
                 raise ValueError(f"Failed to initialize storage contract at {contract_address}: {type(e).__name__}")from e
 
+        # Fields shared by every transaction sent to this contract
+        self._call_proto = {'to': self.contract.address, 'value': 0}
+
+        # Bound read functions used on hot lookup paths
+        functions = self.contract.functions
+        self._fn_get_bucket_by_name = functions.getBucketByName
+        self._fn_get_bucket_index_by_name = functions.getBucketIndexByName
+        self._fn_get_file_by_name = functions.getFileByName
+        self._fn_get_file_by_id = functions.getFileById
+        self._fn_get_file_index_by_id = functions.getFileIndexById
+
+    def _prep_tx_params(self, from_address: HexAddress, nonce_manager=None) -> dict:
+        return self._tx_params.prep(from_address, nonce_manager)
+
+    def _wait_receipt(self, tx_hash):
+        return self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.receipt_timeout, poll_latency=self.receipt_poll_latency
+        )
+
+    def _call_tx(self, tx_params: dict, data: bytes) -> dict:
+        tx_params.update(self._call_proto)
+        tx_params['data'] = data
+        return tx_params
+
+    def _send_call(self, from_address: HexAddress, private_key: Union[str, Signer], data: bytes, gas: int, nonce_manager=None) -> HexBytes:
+        # Everything after the nonce is reserved sits inside the try, so a signing
+        # failure hands the nonce back just like a rejected send.
+        for attempt in range(2):
+            tx_params = self._prep_tx_params(from_address, nonce_manager)
+            try:
+                tx_params['gas'] = gas
+                raw_tx = sign_transaction(self._call_tx(tx_params, data), private_key)
+                return self.web3.eth.send_raw_transaction(raw_tx)
+            except Exception as e:
+                stale = any(msg in str(e) for msg in STALE_NONCE_ERRORS)
+                if nonce_manager and stale:
+                    nonce_manager.reset_nonce()
+                self.invalidate_nonce(from_address)
+                if not stale or attempt:
+                    raise
+
+    def _transact(self, from_address: HexAddress, private_key: Union[str, Signer], data: bytes, gas: int, nonce_manager=None) -> HexStr:
+        # Sends through _send_call and waits for the receipt, decoding the revert reason on failure.
+        # A timed-out or failed transaction may leave the local nonce out of step, so resync it.
+        tx_hash = self._send_call(from_address, private_key, data, gas, nonce_manager)
+        try:
+            receipt = self._wait_receipt(tx_hash)
+        except Exception:
+            self.invalidate_nonce(from_address)
+            raise
+        if receipt.status != 1:
+            self.invalidate_nonce(from_address)
+            raise self._revert_error(from_address, data, receipt)
+        return tx_hash.hex()
+
+    def _revert_error(self, from_address: HexAddress, data: bytes, receipt) -> Exception:
+        # Replays the failed call against the parent block's state to recover
+        # the revert data, then maps known custom error selectors to their names.
+        try:
+            self.web3.eth.call(
+                {'from': from_address, 'to': self.contract.address, 'data': data}, receipt.blockNumber - 1
+            )
+        except Exception as e:
+            return Exception(f"Transaction reverted: {error_hash_to_error(e)}")
+        return Exception(f"Transaction failed. Receipt: {receipt}")
+
+    def wait_tx(self, tx_hash) -> None:
+        """Waits for a transaction sent by one of the ``send_*`` methods to be mined.
+        
+        Args:
+            tx_hash: Transaction hash returned by the send
+            
+        Raises:
+            Exception: If the transaction reverted
+        """
+        receipt = self._wait_receipt(HexBytes(tx_hash))
+        if receipt.status != 1:
+            raise Exception(f"Transaction failed. Receipt: {receipt}")
+
+    async def await_tx(self, aw3, tx_hash) -> None:
+        """Async variant of wait_tx, so several sends can be confirmed with asyncio.gather.
+        
+        Args:
+            aw3: AsyncWeb3 instance (e.g. backed by AsyncHTTPProvider)
+            tx_hash: Transaction hash returned by the send
+        """
+        receipt = await aw3.eth.wait_for_transaction_receipt(
+            HexBytes(tx_hash), timeout=self.receipt_timeout, poll_latency=self.receipt_poll_latency
+        )
+        if receipt.status != 1:
+            raise Exception(f"Transaction failed. Receipt: {receipt}")
+
+    def invalidate_nonce(self, from_address: HexAddress) -> None:
+        """Drops the locally tracked nonce for an address so the next transaction refetches it.
+
+        Args:
+            from_address: Address whose nonce should be resynced
+        """
+        self._tx_params.invalidate_nonce(from_address)
+
     def get_access_manager(self) -> HexAddress:
         """Gets the address of the associated access manager contract.
         
@@ -2104,7 +2249,7 @@ class StorageContract:
         """
         return self.contract.functions.MAX_BLOCK_SIZE().call()
 
-    def create_bucket(self, bucket_name: str, from_address: HexAddress, private_key: str, gas_limit: int = None, nonce_manager=None) -> HexStr:
+    def create_bucket(self, bucket_name: str, from_address: HexAddress, private_key: Union[str, Signer], gas_limit: int = None, nonce_manager=None) -> HexStr:
         """Creates a new bucket.
         
         Args:
@@ -2117,46 +2262,21 @@ class StorageContract:
         Returns:
             Transaction hash of the create operation
         """
-        # Build transaction
-        tx_params = {
-            'from': from_address,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        if gas_limit:
-            tx_params['gas'] = gas_limit
-        else:
-            tx_params['gas'] = 500000  # Default gas limit
-            
-        tx = self.contract.functions.createBucket(bucket_name).build_transaction(tx_params)
-        
-        # Sign transaction
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        # Send raw transaction
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
+        data = encode_call(CREATE_BUCKET_SELECTOR, ['string'], [bucket_name])
+        return self._transact(from_address, private_key, data, gas_limit or 500000, nonce_manager)
+
+    def send_create_bucket(self, bucket_name: str, from_address: HexAddress, private_key: Union[str, Signer], gas_limit: int = None, nonce_manager=None) -> HexStr:
+        """Sends a createBucket transaction without waiting for it to be mined.
         
-        # Wait for receipt
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            # Get revert reason if possible
-            try:
-                self.contract.functions.createBucket(bucket_name).call({
-                    'from': from_address
-                })
-            except Exception as e:
-                raise Exception(f"Transaction reverted: {str(e)}")
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
+        Pair with wait_tx (or await_tx) to confirm; see create_bucket for the arguments.
         
-        return tx_hash.hex()
+        Returns:
+            Transaction hash of the create operation
+        """
+        data = encode_call(CREATE_BUCKET_SELECTOR, ['string'], [bucket_name])
+        return self._send_call(from_address, private_key, data, gas_limit or 500000, nonce_manager).hex()
 
-    def create_file(self, from_address: HexAddress, private_key: str, bucket_id: bytes, file_name: str, nonce_manager=None) -> HexStr:
+    def create_file(self, from_address: HexAddress, private_key: Union[str, Signer], bucket_id: bytes, file_name: str, nonce_manager=None) -> HexStr:
         """Creates a new file entry in the specified bucket.
         
         Args:
@@ -2169,42 +2289,76 @@ class StorageContract:
         Returns:
             Transaction hash of the create operation
         """
-        # Build transaction with signature: createFile(bucketId, name)
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,  # Gas limit
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
+        data = encode_call(CREATE_FILE_SELECTOR, ['bytes32', 'string'], [bucket_id, file_name])
+        return self._transact(from_address, private_key, data, 500000, nonce_manager)
+
+    def send_create_file(self, from_address: HexAddress, private_key: Union[str, Signer], bucket_id: bytes, file_name: str, nonce_manager=None) -> HexStr:
+        """Sends a createFile transaction without waiting for it to be mined.
         
-        tx = self.contract.functions.createFile(bucket_id, file_name).build_transaction(tx_params)
+        Pair with wait_tx (or await_tx) to confirm; see create_file for the arguments.
         
-        # Sign transaction
-        signed_tx = Account.sign_transaction(tx, private_key)
+        Returns:
+            Transaction hash of the create operation
+        """
+        # createFile(bucketId, name)
+        data = encode_call(CREATE_FILE_SELECTOR, ['bytes32', 'string'], [bucket_id, file_name])
+        return self._send_call(from_address, private_key, data, 500000, nonce_manager).hex()
+
+    def create_files_batch(self, from_address: HexAddress, private_key: Union[str, Signer], files: List[Tuple[bytes, str]]) -> List[HexStr]:
+        """Creates several files with one nonce sequence and one send round trip.
         
-        # Send raw transaction
+        Gas price, chain id and the starting nonce are prepared once, every
+        transaction is signed locally with consecutive nonces, and all raw
+        transactions go out in a single JSON-RPC batch (one request per
+        transaction if the provider cannot batch). Receipts are awaited after
+        everything has been sent, so the files are mined together.
+        
+        Args:
+            from_address: Address creating the files
+            private_key: Private key for signing the transactions
+            files: (bucket_id, file_name) pairs
+            
+        Returns:
+            Transaction hashes in the order of files
+        """
+        if not files:
+            return []
+
+        calls = [encode_call(CREATE_FILE_SELECTOR, ['bytes32', 'string'], [bucket_id, name]) for bucket_id, name in files]
         try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
+            raw_txs = []
+            for data in calls:
+                tx_params = self._prep_tx_params(from_address)
+                tx_params['gas'] = 500000
+                raw_txs.append(sign_transaction(self._call_tx(tx_params, data), private_key))
+            tx_hashes = self._send_raw_transactions(raw_txs)
+        except Exception:
+            self.invalidate_nonce(from_address)
             raise
-        
-        # Wait for receipt
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            # Get revert reason if possible
-            try:
-                self.contract.functions.createFile(bucket_id, file_name).call({
-                    'from': from_address
-                })
-            except Exception as e:
-                raise Exception(f"Transaction reverted: {str(e)}")
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
 
-    def add_file_chunk(self, from_address: HexAddress, private_key: str, cid: bytes, bucket_id: bytes, name: str, encoded_chunk_size: int, cids: list, chunk_blocks_sizes: list, chunk_index: int, nonce_manager=None) -> HexStr:
+        for tx_hash in tx_hashes:
+            receipt = self._wait_receipt(tx_hash)
+            if receipt.status != 1:
+                raise Exception(f"Transaction failed. Receipt: {receipt}")
+
+        return [tx_hash.hex() for tx_hash in tx_hashes]
+
+    def _send_raw_transactions(self, raw_txs: List[bytes]) -> List[HexBytes]:
+        try:
+            responses = self.web3.provider.make_batch_request(
+                [('eth_sendRawTransaction', [HexBytes(raw).to_0x_hex()]) for raw in raw_txs]
+            )
+        except Exception:
+            responses = None
+        if not isinstance(responses, list):
+            return [self.web3.eth.send_raw_transaction(raw) for raw in raw_txs]
+
+        errors = [response['error'].get('message') for response in responses if 'error' in response]
+        if errors:
+            raise Exception(f"Failed to send {len(errors)} of {len(raw_txs)} transactions: {errors[0]}")
+        return [HexBytes(response['result']) for response in responses]
+
+    def add_file_chunk(self, from_address: HexAddress, private_key: Union[str, Signer], cid: bytes, bucket_id: bytes, name: str, encoded_chunk_size: int, cids: list, chunk_blocks_sizes: list, chunk_index: int, nonce_manager=None) -> HexStr:
         """Adds a chunk to a file.
         
         Args:
@@ -2222,44 +2376,15 @@ class StorageContract:
         Returns:
             Transaction hash of the add operation
         """
-        # Build transaction
-        tx_params = {
-            'from': from_address,
-            'gas': 1000000,  # Higher gas limit for chunk operations
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.addFileChunk(
-            cid, bucket_id, name, encoded_chunk_size, cids, chunk_blocks_sizes, chunk_index
-        ).build_transaction(tx_params)
-        
-        # Sign transaction
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        # Send raw transaction
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        # Wait for receipt
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            # Get revert reason if possible
-            try:
-                self.contract.functions.addFileChunk(
-                    cid, bucket_id, name, encoded_chunk_size, cids, chunk_blocks_sizes, chunk_index
-                ).call({'from': from_address})
-            except Exception as e:
-                raise Exception(f"Transaction reverted: {str(e)}")
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(
+            ADD_FILE_CHUNK_SELECTOR,
+            ['bytes', 'bytes32', 'string', 'uint256', 'bytes32[]', 'uint256[]', 'uint256'],
+            [cid, bucket_id, name, encoded_chunk_size, cids, chunk_blocks_sizes, chunk_index]
+        )
+        # Higher gas limit for chunk operations
+        return self._transact(from_address, private_key, data, 1000000, nonce_manager)
 
-    def commit_file(self, bucket_id: bytes, file_name: str, encoded_size: int, actual_size: int, root_cid: bytes, from_address: HexAddress, private_key: str) -> None:
+    def commit_file(self, bucket_id: bytes, file_name: str, encoded_size: int, actual_size: int, root_cid: bytes, from_address: HexAddress, private_key: Union[str, Signer]) -> None:
         """Updates the file metadata after upload using new ABI signature.
         
         Args:
@@ -2271,44 +2396,48 @@ class StorageContract:
             from_address: Address committing the file
             private_key: Private key for signing the transaction
         """
-        # Ensure bucket_id is bytes32
-        if isinstance(bucket_id, str):
-            if bucket_id.startswith('0x'):
-                bucket_id = bytes.fromhex(bucket_id[2:])
-            else:
-                bucket_id = bytes.fromhex(bucket_id)
-        
-        if len(bucket_id) != 32:
-            raise ValueError(f"bucket_id must be 32 bytes, got {len(bucket_id)}")
-        
-        # commitFile signature: commitFile(bucketId, name, encodedFileSize, actualSize, fileCID)
-        tx = self.contract.functions.commitFile(bucket_id, file_name, encoded_size, actual_size, root_cid).build_transaction({
-            'from': from_address,
-            'gas': 500000,  # Gas limit (adjust as needed)
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(from_address)
-        })
-        
-        # Sign transaction
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        # Send raw transaction
-        tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
+        tx_hash = self.send_commit_file(bucket_id, file_name, encoded_size, actual_size, root_cid, from_address, private_key)
         
         # Wait for receipt
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self._wait_receipt(HexBytes(tx_hash))
         if receipt.status != 1:
             print(f"[COMMIT_FILE_ERROR] Transaction receipt: {receipt}")
             print(f"[COMMIT_FILE_ERROR] Status: {receipt.status}")
             print(f"[COMMIT_FILE_ERROR] Gas used: {receipt.gasUsed}")
-            print(f"[COMMIT_FILE_ERROR] Bucket ID: {bucket_id.hex()}")
+            print(f"[COMMIT_FILE_ERROR] Bucket ID: {bucket_id.hex() if isinstance(bucket_id, bytes) else bucket_id}")
             print(f"[COMMIT_FILE_ERROR] File name: {file_name}")
             print(f"[COMMIT_FILE_ERROR] Encoded size: {encoded_size}")
             print(f"[COMMIT_FILE_ERROR] Actual size: {actual_size}")
             print(f"[COMMIT_FILE_ERROR] Root CID: {root_cid.hex()}")
             raise Exception(f"Transaction failed for commitFile. Status: {receipt.status}, Gas used: {receipt.gasUsed}")
 
-    def delete_bucket(self, bucket_name: str, from_address: HexAddress, private_key: str, bucket_id_hex: str = None) -> HexStr:
+    def send_commit_file(self, bucket_id: bytes, file_name: str, encoded_size: int, actual_size: int, root_cid: bytes, from_address: HexAddress, private_key: Union[str, Signer]) -> HexStr:
+        """Sends a commitFile transaction without waiting for it to be mined.
+        
+        Pair with wait_tx (or await_tx) to confirm; see commit_file for the arguments.
+        
+        Returns:
+            Transaction hash of the commit operation
+        """
+        # Ensure bucket_id is bytes32
+        if isinstance(bucket_id, str):
+            if bucket_id.startswith('0x'):
+                bucket_id = bytes.fromhex(bucket_id[2:])
+            else:
+                bucket_id = bytes.fromhex(bucket_id)
+        
+        if len(bucket_id) != 32:
+            raise ValueError(f"bucket_id must be 32 bytes, got {len(bucket_id)}")
+        
+        # commitFile signature: commitFile(bucketId, name, encodedFileSize, actualSize, fileCID)
+        data = encode_call(
+            COMMIT_FILE_SELECTOR,
+            ['bytes32', 'string', 'uint256', 'uint256', 'bytes'],
+            [bucket_id, file_name, encoded_size, actual_size, root_cid]
+        )
+        return self._send_call(from_address, private_key, data, 500000).hex()
+
+    def delete_bucket(self, bucket_name: str, from_address: HexAddress, private_key: Union[str, Signer], bucket_id_hex: str = None) -> HexStr:
         if not bucket_id_hex:
             raise Exception("bucket_id_hex is required - get it from IPC BucketView response")
             
@@ -2323,7 +2452,7 @@ class StorageContract:
             print(f"Using bucket_id from IPC: 0x{bucket_id_hex}")
             
             try:
-                result = self.contract.functions.getBucketIndexByName(bucket_name, from_address).call()
+                result = self._fn_get_bucket_index_by_name(bucket_name, from_address).call()
                 bucket_index = result[0] if isinstance(result, (list, tuple)) else result
                 print(f"Got bucket_index result: {result}")
                 print(f"Using bucket_index: {bucket_index}")
@@ -2334,14 +2463,6 @@ class StorageContract:
         except Exception as e:
             raise Exception(f"Failed to prepare bucket deletion: {str(e)}")
 
-        # Build transaction parameters - use standard legacy transaction
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,  # Gas limit
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(from_address),
-        }
-        
         try:
             print(f"Calling deleteBucket with:")
             print(f"  bucket_id: 0x{bucket_id_hex}")
@@ -2385,23 +2506,16 @@ class StorageContract:
                 raise Exception(f"Contract call simulation failed: {str(call_error)}")
             
             # Build and send the transaction
-            tx = self.contract.functions.deleteBucket(
-                bucket_id_bytes,      # bytes32 id (from IPC BucketView response)
-                bucket_name,          # string name  
-                bucket_index          # uint256 index
-            ).build_transaction(tx_params)
-            
-            print(f"Built transaction")
-            
-            # Sign transaction
-            signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
-            
-            # Send transaction
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
+            data = encode_call(
+                DELETE_BUCKET_SELECTOR,
+                ['bytes32', 'string', 'uint256'],
+                [bucket_id_bytes, bucket_name, bucket_index]
+            )
+            tx_hash = self._send_call(from_address, private_key, data, 500000)
             print(f"Transaction sent: {tx_hash.hex()}")
             
             # Wait for receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self._wait_receipt(tx_hash)
             print(f"Transaction receipt: status={receipt.status}, gasUsed={receipt.gasUsed}")
             
             if receipt.status != 1:
@@ -2414,36 +2528,134 @@ class StorageContract:
 
     def delete_file(self, auth, file_id: bytes, bucket_id: bytes, file_name: str, file_index: int) -> str:
         
-        # Build transaction
-        tx = self.contract.functions.deleteFile(file_id, bucket_id, file_name, file_index).build_transaction({
-            'from': auth.address,
-            'gas': 500000,  # Gas limit
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(auth.address)
-        })
-        signed_tx = Account.sign_transaction(tx, auth.key)
-        
-        tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
+        tx_hash = self.send_delete_file(auth, file_id, bucket_id, file_name, file_index)
         
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self._wait_receipt(HexBytes(tx_hash))
         if receipt.status != 1:
             raise Exception("Transaction failed")
             
-        return tx_hash.hex()
+        return tx_hash
+
+    def send_delete_file(self, auth, file_id: bytes, bucket_id: bytes, file_name: str, file_index: int) -> HexStr:
+        """Sends a deleteFile transaction without waiting for it to be mined.
+        
+        Pair with wait_tx (or await_tx) to confirm.
+        
+        Returns:
+            Transaction hash of the delete operation
+        """
+        data = encode_call(
+            DELETE_FILE_SELECTOR, ['bytes32', 'bytes32', 'string', 'uint256'], [file_id, bucket_id, file_name, file_index]
+        )
+        return self._send_call(auth.address, auth.key, data, 500000).hex()
+
+    async def acreate_file(self, aw3, from_address: HexAddress, private_key: Union[str, Signer], bucket_id: bytes, file_name: str) -> HexStr:
+        """Async variant of create_file using an AsyncWeb3 instance.
+        
+        Args:
+            aw3: AsyncWeb3 instance (e.g. backed by AsyncHTTPProvider)
+            from_address: Address creating the file
+            private_key: Private key for signing the transaction
+            bucket_id: ID of the bucket to create the file in (bytes32)
+            file_name: Name of the file
+            
+        Returns:
+            Transaction hash of the create operation
+        """
+        return (await self.acreate_files(aw3, from_address, private_key, bucket_id, [file_name]))[0]
+
+    async def acreate_files(self, aw3, from_address: HexAddress, private_key: Union[str, Signer], bucket_id: bytes, file_names: List[str]) -> List[HexStr]:
+        """Creates several files in a bucket concurrently.
+        
+        All transactions are signed locally with consecutive nonces, sent together
+        and then awaited together, so the batch costs roughly one send and one
+        receipt wait instead of one of each per file.
+        
+        Args:
+            aw3: AsyncWeb3 instance (e.g. backed by AsyncHTTPProvider)
+            from_address: Address creating the files
+            private_key: Private key for signing the transactions
+            bucket_id: ID of the bucket to create the files in (bytes32)
+            file_names: Names of the files
+            
+        Returns:
+            Transaction hashes in the order of file_names
+        """
+        calls = [encode_call(CREATE_FILE_SELECTOR, ['bytes32', 'string'], [bucket_id, name]) for name in file_names]
+        return await self._asend_calls(aw3, from_address, private_key, calls, 500000)
+
+    async def adelete_file(self, aw3, auth, file_id: bytes, bucket_id: bytes, file_name: str, file_index: int) -> HexStr:
+        """Async variant of delete_file using an AsyncWeb3 instance.
+        
+        Returns:
+            Transaction hash of the delete operation
+        """
+        return (await self.adelete_files(aw3, auth, [(file_id, bucket_id, file_name, file_index)]))[0]
+
+    async def adelete_files(self, aw3, auth, files: List[Tuple[bytes, bytes, str, int]]) -> List[HexStr]:
+        """Deletes several files concurrently.
+        
+        Args:
+            aw3: AsyncWeb3 instance (e.g. backed by AsyncHTTPProvider)
+            auth: Account with address and key
+            files: (file_id, bucket_id, file_name, file_index) tuples
+            
+        Returns:
+            Transaction hashes in the order of files
+        """
+        calls = [
+            encode_call(DELETE_FILE_SELECTOR, ['bytes32', 'bytes32', 'string', 'uint256'], list(args))
+            for args in files
+        ]
+        return await self._asend_calls(aw3, auth.address, auth.key, calls, 500000)
+
+    async def _asend_calls(self, aw3, from_address: HexAddress, private_key: Union[str, Signer], calls: List[bytes], gas: int) -> List[HexStr]:
+        if not calls:
+            return []
+
+        # Reserve the whole nonce range from the shared cache so sync sends from the
+        # same account cannot take any of it; the cache fetch runs off the event loop.
+        loop = asyncio.get_running_loop()
+        proto = await loop.run_in_executor(None, self._tx_params.reserve, from_address, len(calls))
+        nonce = proto['nonce']
+        proto.update(self._call_proto)
+        proto['gas'] = gas
+        try:
+            raw_txs = []
+            for i, data in enumerate(calls):
+                tx = proto.copy()
+                tx['nonce'] = nonce + i
+                tx['data'] = data
+                raw_txs.append(sign_transaction(tx, private_key))
+
+            tx_hashes = await asyncio.gather(*[aw3.eth.send_raw_transaction(raw) for raw in raw_txs])
+        except Exception:
+            self.invalidate_nonce(from_address)
+            raise
+
+        receipts = await asyncio.gather(*[aw3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=self.receipt_timeout, poll_latency=self.receipt_poll_latency
+        ) for tx_hash in tx_hashes])
+        for i, receipt in enumerate(receipts):
+            if receipt.status != 1:
+                err = await loop.run_in_executor(None, self._revert_error, from_address, calls[i], receipt)
+                raise Exception(f"transaction {i} of {len(calls)} failed: {err}")
+
+        return [tx_hash.hex() for tx_hash in tx_hashes]
 
     def get_bucket(self, bucket_name: str, owner_address: str = None) -> Tuple[str, int, HexAddress]:
         if owner_address is None:
             raise ValueError("Owner address must be provided for bucket lookup")
-        bucket = self.contract.functions.getBucketByName(bucket_name, owner_address, 0, 10).call()
+        bucket = self._fn_get_bucket_by_name(bucket_name, owner_address, 0, 10).call()
         return (bucket[1], bucket[2], bucket[3])  # (name, createdAt, owner)
 
     def get_file(self, bucket_name: str, file_name: str, owner_address: str = None) -> Tuple[str, bytes, int, int]:
         if owner_address is None:
             raise ValueError("Owner address must be provided for bucket lookup")
             
-        bucket = self.contract.functions.getBucketByName(bucket_name, owner_address, 0, 10).call()
+        bucket = self._fn_get_bucket_by_name(bucket_name, owner_address, 0, 10).call()
         bucket_id = bucket[0]  # bytes32 id
-        file_info = self.contract.functions.getFileByName(bucket_id, file_name).call()
+        file_info = self._fn_get_file_by_name(bucket_id, file_name).call()
         return (file_info[3], file_info[0], file_info[4], file_info[5])  # (name, id, encodedSize, createdAt)
 
     def get_bucket_by_name(self, call_opts: dict, bucket_name: str, owner_address: str = None, file_offset: int = 0, file_limit: int = 10):
@@ -2453,21 +2665,49 @@ class StorageContract:
             raise ValueError("Owner address must be provided either as parameter or in call_opts['from']")
             
         if call_opts:
-            return self.contract.functions.getBucketByName(bucket_name, owner_address, file_offset, file_limit).call(call_opts)
+            return self._fn_get_bucket_by_name(bucket_name, owner_address, file_offset, file_limit).call(call_opts)
         else:
-            return self.contract.functions.getBucketByName(bucket_name, owner_address, file_offset, file_limit).call()
+            return self._fn_get_bucket_by_name(bucket_name, owner_address, file_offset, file_limit).call()
 
     def get_file_by_name(self, call_opts: dict, bucket_id: bytes, file_name: str):
         if call_opts:
-            return self.contract.functions.getFileByName(bucket_id, file_name).call(call_opts)
+            return self._fn_get_file_by_name(bucket_id, file_name).call(call_opts)
         else:
-            return self.contract.functions.getFileByName(bucket_id, file_name).call()
+            return self._fn_get_file_by_name(bucket_id, file_name).call()
+
+    def get_files_by_name(self, bucket_id: bytes, file_names: List[str]) -> list:
+        """Fetches several files of a bucket in one eth_call via Multicall3.
+        
+        Falls back to one getFileByName call per file when Multicall3 is not deployed.
+        
+        Args:
+            bucket_id: ID of the bucket (bytes32)
+            file_names: Names of the files
+            
+        Returns:
+            File tuples as returned by get_file_by_name, or None for files whose lookup reverted
+        """
+        calls = [
+            (self.contract.address, encode_call(GET_FILE_BY_NAME_SELECTOR, ['bytes32', 'string'], [bucket_id, name]))
+            for name in file_names
+        ]
+        try:
+            results = aggregate(self.web3, calls)
+        except MulticallUnavailable:
+            return [self._try_get_file_by_name(bucket_id, name) for name in file_names]
+        return [None if result is None else _decode_file(result) for result in results]
+
+    def _try_get_file_by_name(self, bucket_id: bytes, file_name: str):
+        try:
+            return self.get_file_by_name(None, bucket_id, file_name)
+        except Exception:
+            return None
 
     def get_file_index_by_id(self, call_opts: dict, bucket_name: str, file_id: bytes):
         if call_opts:
-            return self.contract.functions.getFileIndexById(bucket_name, file_id).call(call_opts)
+            return self._fn_get_file_index_by_id(bucket_name, file_id).call(call_opts)
         else:
-            return self.contract.functions.getFileIndexById(bucket_name, file_id).call()
+            return self._fn_get_file_index_by_id(bucket_name, file_id).call()
 
     def is_file_filled(self, file_id: bytes) -> bool:
         """Returns info about file status.
@@ -2495,41 +2735,23 @@ class StorageContract:
         
         return self.contract.functions.UPGRADE_INTERFACE_VERSION().call()
 
-    def add_file_chunks(self, from_address: HexAddress, private_key: str, cids: List[bytes], bucket_id: bytes, 
+    def add_file_chunks(self, from_address: HexAddress, private_key: Union[str, Signer], cids: List[bytes], bucket_id: bytes, 
                        file_name: str, encoded_chunk_sizes: List[int], chunk_blocks_cids: List[List[bytes]], 
                        chunk_block_sizes: List[List[int]], starting_chunk_index: int, nonce_manager=None) -> HexStr:
         
-        tx_params = {
-            'from': from_address,
-            'gas': 2000000,  # Higher gas limit for multiple chunks
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.addFileChunks(
-            cids, bucket_id, file_name, encoded_chunk_sizes, chunk_blocks_cids, chunk_block_sizes, starting_chunk_index
-        ).build_transaction(tx_params)
-        
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(
+            ADD_FILE_CHUNKS_SELECTOR,
+            ['bytes[]', 'bytes32', 'string', 'uint256[]', 'bytes32[][]', 'uint256[][]', 'uint256'],
+            [cids, bucket_id, file_name, encoded_chunk_sizes, chunk_blocks_cids, chunk_block_sizes, starting_chunk_index]
+        )
+        # Higher gas limit for multiple chunks
+        return self._transact(from_address, private_key, data, 2000000, nonce_manager)
 
     def get_file_by_id(self, file_id: bytes):       
-        return self.contract.functions.getFileById(file_id).call()
+        return self._fn_get_file_by_id(file_id).call()
 
     def get_bucket_index_by_name(self, bucket_name: str, owner_address: HexAddress) -> Tuple[int, bool]:
-        return self.contract.functions.getBucketIndexByName(bucket_name, owner_address).call()
+        return self._fn_get_bucket_index_by_name(bucket_name, owner_address).call()
 
     def is_chunk_filled(self, file_id: bytes, chunk_index: int) -> bool:
         return self.contract.functions.isChunkFilled(file_id, chunk_index).call()
@@ -2553,29 +2775,9 @@ class StorageContract:
                          file_offset: int = 0, file_limit: int = 10):
         return self.contract.functions.getOwnerBuckets(owner_address, offset, limit, file_offset, file_limit).call()
 
-    def initialize_contract(self, from_address: HexAddress, private_key: str, token_address: HexAddress, nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.initialize(token_address).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+    def initialize_contract(self, from_address: HexAddress, private_key: Union[str, Signer], token_address: HexAddress, nonce_manager=None) -> HexStr:
+        data = encode_call(INITIALIZE_SELECTOR, ['address'], [token_address])
+        return self._transact(from_address, private_key, data, 500000, nonce_manager)
 
     def get_timestamp(self) -> int:
         return self.contract.functions.timestamp().call()
@@ -2583,64 +2785,23 @@ class StorageContract:
     def get_token(self) -> HexAddress:
         return self.contract.functions.token().call()
 
-    def add_peer_block(self, from_address: HexAddress, private_key: str, peer_id: bytes, cid: bytes, 
+    def add_peer_block(self, from_address: HexAddress, private_key: Union[str, Signer], peer_id: bytes, cid: bytes, 
                       file_name: str, is_replica: bool, nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.addPeerBlock(peer_id, cid, file_name, is_replica).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(
+            ADD_PEER_BLOCK_SELECTOR, ['bytes32', 'bytes32', 'string', 'bool'], [peer_id, cid, file_name, is_replica]
+        )
+        return self._transact(from_address, private_key, data, 500000, nonce_manager)
 
-    def delete_peer_block(self, from_address: HexAddress, private_key: str, block_id: bytes, 
+    def delete_peer_block(self, from_address: HexAddress, private_key: Union[str, Signer], block_id: bytes, 
                          peer_id: bytes, cid: bytes, file_name: str, index: int, nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.deletePeerBlock(block_id, peer_id, cid, file_name, index).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(
+            DELETE_PEER_BLOCK_SELECTOR,
+            ['bytes32', 'bytes32', 'bytes32', 'string', 'uint256'],
+            [block_id, peer_id, cid, file_name, index]
+        )
+        return self._transact(from_address, private_key, data, 500000, nonce_manager)
 
-    def fill_chunk_block(self, from_address: HexAddress, private_key: str, fill_args: dict, nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 1000000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
+    def fill_chunk_block(self, from_address: HexAddress, private_key: Union[str, Signer], fill_args: dict, nonce_manager=None) -> HexStr:
         args_tuple = (
             fill_args['blockCID'],
             fill_args['nodeId'], 
@@ -2653,30 +2814,10 @@ class StorageContract:
             fill_args['deadline']
         )
         
-        tx = self.contract.functions.fillChunkBlock(args_tuple).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(FILL_CHUNK_BLOCK_SELECTOR, [FILL_CHUNK_BLOCK_ARGS_TYPE], [args_tuple])
+        return self._transact(from_address, private_key, data, 1000000, nonce_manager)
 
-    def fill_chunk_blocks(self, from_address: HexAddress, private_key: str, fill_args_list: List[dict], nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 2000000,  
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
+    def fill_chunk_blocks(self, from_address: HexAddress, private_key: Union[str, Signer], fill_args_list: List[dict], nonce_manager=None) -> HexStr:
         args_tuples = []
         for fill_args in fill_args_list:
             args_tuple = (
@@ -2692,21 +2833,8 @@ class StorageContract:
             )
             args_tuples.append(args_tuple)
         
-        tx = self.contract.functions.fillChunkBlocks(args_tuples).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(FILL_CHUNK_BLOCKS_SELECTOR, [FILL_CHUNK_BLOCK_ARGS_TYPE + '[]'], [args_tuples])
+        return self._transact(from_address, private_key, data, 2000000, nonce_manager)
 
     def get_chunk_by_index(self, file_id: bytes, index: int) -> Tuple[bytes, int]:
         return self.contract.functions.getChunkByIndex(file_id, index).call()
@@ -2747,52 +2875,12 @@ class StorageContract:
     def get_proxiable_uuid(self) -> bytes:
         return self.contract.functions.proxiableUUID().call()
 
-    def set_access_manager(self, from_address: HexAddress, private_key: str, access_manager_address: HexAddress, 
+    def set_access_manager(self, from_address: HexAddress, private_key: Union[str, Signer], access_manager_address: HexAddress, 
                           nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 500000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.setAccessManager(access_manager_address).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        data = encode_call(SET_ACCESS_MANAGER_SELECTOR, ['address'], [access_manager_address])
+        return self._transact(from_address, private_key, data, 500000, nonce_manager)
 
-    def upgrade_to_and_call(self, from_address: HexAddress, private_key: str, new_implementation: HexAddress, 
+    def upgrade_to_and_call(self, from_address: HexAddress, private_key: Union[str, Signer], new_implementation: HexAddress, 
                            data: bytes, nonce_manager=None) -> HexStr:
-        tx_params = {
-            'from': from_address,
-            'gas': 1000000,
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': nonce_manager.get_nonce() if nonce_manager else self.web3.eth.get_transaction_count(from_address)
-        }
-        
-        tx = self.contract.functions.upgradeToAndCall(new_implementation, data).build_transaction(tx_params)
-        signed_tx = Account.sign_transaction(tx, private_key)
-        
-        try:
-            tx_hash = self.web3.eth.send_raw_transaction(get_raw_transaction(signed_tx))
-        except Exception as e:
-            if nonce_manager and "nonce too low" in str(e):
-                nonce_manager.reset_nonce()
-            raise
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt.status != 1:
-            raise Exception(f"Transaction failed. Receipt: {receipt}")
-        
-        return tx_hash.hex()
+        call_data = encode_call(UPGRADE_TO_AND_CALL_SELECTOR, ['address', 'bytes'], [new_implementation, data])
+        return self._transact(from_address, private_key, call_data, 1000000, nonce_manager)
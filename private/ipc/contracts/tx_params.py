@@ -0,0 +1,160 @@
+import operator
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from eth_account.datastructures import SignedTransaction
+from eth_typing import HexAddress
+from web3 import Web3
+
+# Gas price is refreshed at most once per block interval.
+GAS_PRICE_TTL = 12.0
+
+# eth-account renamed rawTransaction to raw_transaction; resolve the name once.
+_RAW_TX_ATTR = "raw_transaction" if hasattr(SignedTransaction, "raw_transaction") else "rawTransaction"
+get_raw_transaction = operator.attrgetter(_RAW_TX_ATTR)
+
+# Attribute under which the shared TxParamsCache is stored on a web3 instance.
+_SHARED_ATTR = "_akave_tx_params"
+_shared_lock = threading.Lock()
+
+
+def prep_tx_params(web3: Web3, from_address: HexAddress, nonce_manager=None) -> Dict[str, Any]:
+    """Fetches gas price, pending nonce and chain id in one JSON-RPC batch.
+
+    Pre-filling ``chainId`` also stops ``build_transaction`` from making its own
+    ``eth_chainId`` call. When a nonce manager is given the nonce comes from it
+    and only gas price and chain id are requested. Falls back to sequential
+    calls if the provider cannot batch.
+
+    Args:
+        web3: Web3 instance
+        from_address: Address sending the transaction
+        nonce_manager: Optional nonce manager for coordinated transactions
+
+    Returns:
+        Dict with ``from``, ``gasPrice``, ``nonce`` and ``chainId`` set
+    """
+    gas_price, chain_id, nonce = _fetch_tx_state(web3, from_address, nonce_manager is None, True)
+    return {
+        'from': from_address,
+        'gasPrice': gas_price,
+        'chainId': chain_id,
+        'nonce': nonce_manager.get_nonce() if nonce_manager else nonce,
+    }
+
+
+class TxParamsCache:
+    """Caches gas price, chain id and per-address nonces between transactions.
+
+    The pending nonce is fetched once per address and then incremented locally;
+    call ``invalidate_nonce`` after a failed send so the next transaction
+    resyncs from the node. Gas price is refetched once it is older than
+    ``gas_price_ttl`` seconds. The chain id never changes for a provider, so
+    it is requested only once. Prepared params are copied from a prototype
+    dict that is rebuilt only when the cached values change.
+    """
+
+    def __init__(self, web3: Web3, gas_price_ttl: float = GAS_PRICE_TTL):
+        self.web3 = web3
+        self.gas_price_ttl = gas_price_ttl
+        self._lock = threading.Lock()
+        self._nonces: Dict[str, int] = {}
+        self._gas_price: Optional[int] = None
+        self._gas_price_at = float('-inf')
+        self._chain_id: Optional[int] = None
+        self._proto: Dict[str, Any] = {'from': None, 'gasPrice': None, 'chainId': None}
+
+    def prep(self, from_address: HexAddress, nonce_manager=None) -> Dict[str, Any]:
+        """Same contract as ``prep_tx_params`` but served from the cache when fresh."""
+        if nonce_manager is None:
+            return self._prep(from_address, 1)
+        params = self._prep(from_address, 0)
+        params['nonce'] = nonce_manager.get_nonce()
+        return params
+
+    def reserve(self, from_address: HexAddress, count: int) -> Dict[str, Any]:
+        """Like ``prep`` but reserves ``count`` consecutive nonces in one step.
+
+        The returned ``nonce`` is the first of the range; the caller owns it up
+        to ``nonce + count - 1`` and must call ``invalidate_nonce`` if any of
+        those transactions fails to send.
+        """
+        return self._prep(from_address, count)
+
+    def _prep(self, from_address: HexAddress, count: int) -> Dict[str, Any]:
+        key = str(from_address).lower()
+        with self._lock:
+            now = time.monotonic()
+            need_nonce = count > 0 and key not in self._nonces
+            if need_nonce or self._chain_id is None or now - self._gas_price_at >= self.gas_price_ttl:
+                gas_price, chain_id, nonce = _fetch_tx_state(self.web3, from_address, need_nonce, self._chain_id is None)
+                self._gas_price, self._gas_price_at = gas_price, now
+                if chain_id is not None:
+                    self._chain_id = chain_id
+                if need_nonce:
+                    self._nonces[key] = nonce
+                self._proto = {'from': None, 'gasPrice': self._gas_price, 'chainId': self._chain_id}
+            params = self._proto.copy()
+            params['from'] = from_address
+            if count > 0:
+                params['nonce'] = self._nonces[key]
+                self._nonces[key] += count
+        return params
+
+    @property
+    def chain_id(self) -> Optional[int]:
+        """Chain id seen by the last fetch, or None before the first transaction."""
+        return self._chain_id
+
+    def invalidate_nonce(self, from_address: HexAddress) -> None:
+        """Drops the cached nonce so the next transaction refetches it."""
+        with self._lock:
+            self._nonces.pop(str(from_address).lower(), None)
+
+
+def shared_tx_params(web3: Web3) -> TxParamsCache:
+    """Returns the TxParamsCache shared by every contract wrapper bound to ``web3``.
+
+    Wrappers that send from the same account must draw nonces from one local
+    counter, otherwise interleaved sends reuse or skip nonces. The cache is
+    stored on the web3 instance itself, so it lives exactly as long as it.
+    """
+    cache = vars(web3).get(_SHARED_ATTR)
+    if cache is None:
+        with _shared_lock:
+            cache = vars(web3).get(_SHARED_ATTR)
+            if cache is None:
+                cache = TxParamsCache(web3)
+                setattr(web3, _SHARED_ATTR, cache)
+    return cache
+
+
+def _fetch_tx_state(web3: Web3, from_address: HexAddress, include_nonce: bool,
+                    include_chain_id: bool) -> Tuple[int, Optional[int], Optional[int]]:
+    requests = [('eth_gasPrice', [])]
+    if include_chain_id:
+        requests.append(('eth_chainId', []))
+    if include_nonce:
+        requests.append(('eth_getTransactionCount', [from_address, 'pending']))
+
+    try:
+        responses = web3.provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            raise ValueError(responses.get('error', {}).get('message', 'batch request failed'))
+        results = [_to_int(response['result']) for response in responses]
+    except Exception:
+        results = [web3.eth.gas_price]
+        if include_chain_id:
+            results.append(web3.eth.chain_id)
+        if include_nonce:
+            results.append(web3.eth.get_transaction_count(from_address, 'pending'))
+
+    gas_price = results[0]
+    chain_id = results[1] if include_chain_id else None
+    nonce = results[-1] if include_nonce else None
+    return gas_price, chain_id, nonce
+
+
+def _to_int(value) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
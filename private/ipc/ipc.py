@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import secrets
+import os
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Union
 
-from eth_utils import keccak, to_bytes, to_checksum_address
+from eth_hash.auto import keccak as _keccak256
+from eth_utils import to_bytes, to_checksum_address
 
-try:
-    from ..eip712 import Domain as EIP712Domain, TypedData as EIP712TypedData, sign as eip712_sign
-except ImportError:
-    import sys
-    import os
-    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-    from eip712 import Domain as EIP712Domain, TypedData as EIP712TypedData, sign as eip712_sign
+from ..eip712 import (
+    Domain as EIP712Domain,
+    TypedData as EIP712TypedData,
+    domain_separator as eip712_domain_separator,
+    sign_batch as eip712_sign_batch,
+    sign_with_domain_separator as eip712_sign_with_domain_separator,
+    struct_encoder as eip712_struct_encoder,
+)
+from ..signer import Signer
 
 
 @dataclass
@@ -40,60 +44,93 @@ class StorageData:
 
 
 def generate_nonce() -> int:
-    return int.from_bytes(secrets.token_bytes(32), byteorder="big")
+    return int.from_bytes(os.urandom(32), byteorder="big")
 
 
 def calculate_file_id(bucket_id: bytes, name: str) -> bytes:
     if not isinstance(bucket_id, (bytes, bytearray)):
         raise TypeError("bucket_id must be bytes")
     
-    data = bucket_id + name.encode('utf-8')
-    return keccak(data)
+    # eth_hash directly: eth_utils.keccak adds a type-dispatch layer per call
+    return _keccak256(bytes(bucket_id) + name.encode('utf-8'))
 
 
-def calculate_bucket_id(bucket_name: str, address: str) -> bytes:
-    data = bucket_name.encode('utf-8')
-    
-    addr = address.lower()
-    if addr.startswith("0x"):
-        addr = addr[2:]
-    if len(addr) != 40:
-        raise ValueError("address must be a 20-byte hex string")
-    
-    address_bytes = bytes.fromhex(addr)
-    data += address_bytes
+def calculate_file_ids(bucket_id: bytes, names: List[str]) -> List[bytes]:
+    """calculate_file_id for many names in one bucket, validating and converting bucket_id once."""
+    if not isinstance(bucket_id, (bytes, bytearray)):
+        raise TypeError("bucket_id must be bytes")
     
-    return keccak(data)
-
-
-def sign_block(private_key_hex: str, storage_address: str, chain_id: int, data: StorageData) -> bytes:
-    key_hex = private_key_hex.lower()
-    if key_hex.startswith("0x"):
-        key_hex = key_hex[2:]
-    private_key_bytes = bytes.fromhex(key_hex)
+    prefix = bytes(bucket_id)
+    keccak = _keccak256
+    return [keccak(prefix + name.encode('utf-8')) for name in names]
 
-    checksum_addr = to_checksum_address(storage_address)
 
-    domain = EIP712Domain(
+def calculate_bucket_id(bucket_name: str, address: str) -> bytes:
+    address_bytes = _hex_to_bytes(address, 20, "address must be a 20-byte hex string")
+    return _keccak256(bucket_name.encode('utf-8') + address_bytes)
+
+
+def _hex_to_bytes(value: str, expected_len: Optional[int] = None, error: str = "") -> bytes:
+    # bytes.fromhex accepts either case, so only the prefix needs stripping
+    if value.startswith(("0x", "0X")):
+        value = value[2:]
+    if expected_len is not None and len(value) != expected_len * 2:
+        raise ValueError(error or f"expected {expected_len} bytes of hex, got {len(value)} characters")
+    return bytes.fromhex(value)
+
+
+_STORAGE_DATA_TYPES: Dict[str, List[EIP712TypedData]] = {
+    "StorageData": [
+        EIP712TypedData("chunkCID", "bytes"),
+        EIP712TypedData("blockCID", "bytes32"),
+        EIP712TypedData("chunkIndex", "uint256"),
+        EIP712TypedData("blockIndex", "uint8"),
+        EIP712TypedData("nodeId", "bytes32"),
+        EIP712TypedData("nonce", "uint256"),
+        EIP712TypedData("deadline", "uint256"),
+        EIP712TypedData("bucketId", "bytes32"),
+    ]
+}
+
+# Type hash and field encoders are resolved once; sign_block only encodes values
+_encode_storage_data = eip712_struct_encoder("StorageData", _STORAGE_DATA_TYPES)
+
+
+def _load_signer(private_key: Union[str, Signer]) -> Signer:
+    # A Signer held by the caller is used as is; a hex key is loaded for this call only
+    if isinstance(private_key, Signer):
+        return private_key
+    return Signer(_hex_to_bytes(private_key))
+
+
+@lru_cache(maxsize=32)
+def _storage_domain(storage_address: str, chain_id: int) -> EIP712Domain:
+    # Cached so the EIP-55 checksum (a keccak over the address) runs once per storage contract
+    return EIP712Domain(
         name="Storage",
         version="1",
         chain_id=chain_id,
-        verifying_contract=checksum_addr,
+        verifying_contract=to_checksum_address(storage_address),
     )
 
-    storage_data_types: Dict[str, List[EIP712TypedData]] = {
-        "StorageData": [
-            EIP712TypedData("chunkCID", "bytes"),
-            EIP712TypedData("blockCID", "bytes32"),
-            EIP712TypedData("chunkIndex", "uint256"),
-            EIP712TypedData("blockIndex", "uint8"),
-            EIP712TypedData("nodeId", "bytes32"),
-            EIP712TypedData("nonce", "uint256"),
-            EIP712TypedData("deadline", "uint256"),
-            EIP712TypedData("bucketId", "bytes32"),
-        ]
-    }
-
-    message = data.to_message_dict()
-
-    return eip712_sign(private_key_bytes, domain, message, storage_data_types)
\ No newline at end of file
+
+@lru_cache(maxsize=32)
+def _storage_domain_separator(storage_address: str, chain_id: int) -> bytes:
+    return eip712_domain_separator(_storage_domain(storage_address, chain_id))
+
+
+def sign_block(private_key: Union[str, Signer], storage_address: str, chain_id: int, data: StorageData) -> bytes:
+    # The domain separator is fixed per (storage, chain), so only the struct hash is computed per block
+    return eip712_sign_with_domain_separator(
+        _load_signer(private_key),
+        _storage_domain_separator(storage_address, chain_id),
+        data.to_message_dict(),
+        _encode_storage_data,
+    )
+
+
+def sign_blocks(private_key: Union[str, Signer], storage_address: str, chain_id: int, data: List[StorageData]) -> List[bytes]:
+    """Signs several blocks under one domain; the key and domain are resolved once for the batch."""
+    domain = _storage_domain(storage_address, chain_id)
+    messages = [item.to_message_dict() for item in data]
+    return eip712_sign_batch(_load_signer(private_key), domain, messages, _STORAGE_DATA_TYPES)
@@ -8,6 +8,8 @@ from eth_account import Account
 from eth_account.signers.local import LocalAccount
 import logging
 
+from ..ipc.contracts.tx_params import get_raw_transaction
+
 _nonce_lock = threading.Lock()
 
 class IPCTestError(Exception):
@@ -103,7 +105,7 @@ def deposit(
             'data': b'',
         }
         signed_txn = source_account.sign_transaction(transaction)  
-        tx_hash = web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        tx_hash = web3.eth.send_raw_transaction(get_raw_transaction(signed_txn))
         wait_for_tx(web3, tx_hash)
         
     except Exception as e:
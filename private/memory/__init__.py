@@ -2,6 +2,14 @@
 Memory utilities for Akave SDK.
 """
 
-from .memory import Size
+from .memory import (
+    B, KiB, MiB, GiB, TiB, PiB, EiB,
+    KB, MB, GB, TB, PB, EB,
+    Size, format_bytes, format_size,
+)
 
-__all__ = ['Size']
+__all__ = [
+    'B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB',
+    'KB', 'MB', 'GB', 'TB', 'PB', 'EB',
+    'Size', 'format_bytes', 'format_size',
+]
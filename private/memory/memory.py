@@ -1,24 +1,76 @@
+B = 1
+KiB = B << 10
+MiB = KiB << 10
+GiB = MiB << 10
+TiB = GiB << 10
+PiB = TiB << 10
+EiB = PiB << 10
+
+KB = int(1e3)
+MB = int(1e6)
+GB = int(1e9)
+TB = int(1e12)
+PB = int(1e15)
+EB = int(1e18)
+
+_UNITS = ((EB, "EB"), (PB, "PB"), (TB, "TB"), (GB, "GB"), (MB, "MB"), (KB, "KB"))
+_BYTES_UNITS = ((GB, "GB"), (MB, "MB"), (KB, "KB"))
+
+# Decimal unit per power of 1000, indexed by floor(log10(size)) // 3
+_POW10 = tuple(10 ** i for i in range(19))
+_UNIT_BY_EXP = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
+
+def format_size(size: int) -> str:
+    if size < KB:
+        return f"{size}B"
+    if size >= EB:
+        return f"{size / EB:.2f}EB"
+    if not isinstance(size, int):
+        for threshold, unit in _UNITS:
+            if size >= threshold:
+                return f"{size / threshold:.2f}{unit}"
+
+    # floor(log10(size)) from the bit length (1233 / 4096 ~ log10(2)), corrected by one compare
+    exp = (size.bit_length() * 1233) >> 12
+    if size < _POW10[exp]:
+        exp -= 1
+    idx = exp // 3
+    return f"{size / _POW10[idx * 3]:.2f}{_UNIT_BY_EXP[idx]}"
+
+
+def format_bytes(bytes_size: int) -> str:
+    for threshold, unit in _BYTES_UNITS:
+        if bytes_size >= threshold:
+            return f"{bytes_size // threshold} {unit}"
+    return f"{bytes_size} Bytes"
+
+
 class Size:
-    B = 1
-    KiB = B << 10
-    MiB = KiB << 10
-    GiB = MiB << 10
-    TiB = GiB << 10
-    PiB = TiB << 10
-    EiB = PiB << 10
-
-    KB = int(1e3)
-    MB = int(1e6)
-    GB = int(1e9)
-    TB = int(1e12)
-    PB = int(1e15)
-    EB = int(1e18)
+    """Kept for existing callers; new code should use the module constants and functions."""
+
+    B = B
+    KiB = KiB
+    MiB = MiB
+    GiB = GiB
+    TiB = TiB
+    PiB = PiB
+    EiB = EiB
+
+    KB = KB
+    MB = MB
+    GB = GB
+    TB = TB
+    PB = PB
+    EB = EB
+
+    __slots__ = ("size",)
 
     def __init__(self, size: int):
         self.size = size
 
     def __str__(self) -> str:
-        return self.format_size()
+        return format_size(self.size)
 
     def to_int(self) -> int:
         return self.size
@@ -30,28 +82,6 @@ class Size:
         return Size(self.size // n)
 
     def format_size(self) -> str:
-        if self.size >= self.EB:
-            return f"{self.size / self.EB:.2f}EB"
-        elif self.size >= self.PB:
-            return f"{self.size / self.PB:.2f}PB"
-        elif self.size >= self.TB:
-            return f"{self.size / self.TB:.2f}TB"
-        elif self.size >= self.GB:
-            return f"{self.size / self.GB:.2f}GB"
-        elif self.size >= self.MB:
-            return f"{self.size / self.MB:.2f}MB"
-        elif self.size >= self.KB:
-            return f"{self.size / self.KB:.2f}KB"
-        else:
-            return f"{self.size}B"
-
-    @staticmethod
-    def format_bytes(bytes_size: int) -> str:
-        if bytes_size >= Size.GB:
-            return f"{bytes_size // Size.GB} GB"
-        elif bytes_size >= Size.MB:
-            return f"{bytes_size // Size.MB} MB"
-        elif bytes_size >= Size.KB:
-            return f"{bytes_size // Size.KB} KB"
-        else:
-            return f"{bytes_size} Bytes"
+        return format_size(self.size)
+
+    format_bytes = staticmethod(format_bytes)
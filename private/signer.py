@@ -0,0 +1,52 @@
+from typing import Any, Union
+
+from eth_keys import keys
+
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+
+class Signer:
+    """A secp256k1 private key loaded once for repeated signing.
+
+    Loading a key derives its public key, which costs more than a signature,
+    so callers that sign often should build one Signer and keep it for as long
+    as they hold the key. Nothing is cached at module level: the key lives
+    exactly as long as its owner keeps the Signer.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, private_key: Union[str, bytes]):
+        key = key_bytes(private_key)
+        # coincurve calls libsecp256k1 directly; eth_keys is the pure-Python fallback.
+        self._key: Any = coincurve.PrivateKey(key) if coincurve is not None else keys.PrivateKey(key)
+
+    def __repr__(self) -> str:
+        return "Signer(<private key>)"
+
+    @property
+    def secret(self) -> bytes:
+        """Raw 32-byte private key, for code paths that need to hand it to eth_account."""
+        return self._key.secret if coincurve is not None else self._key.to_bytes()
+
+    def sign_digest(self, digest: bytes) -> bytes:
+        """Signs a 32-byte hash and returns 65 bytes r || s || recovery id (0 or 1)."""
+        if coincurve is not None:
+            return self._key.sign_recoverable(digest, hasher=None)
+        return self._key.sign_msg_hash(digest).to_bytes()
+
+
+def as_signer(private_key: Union[str, bytes, Signer]) -> Signer:
+    """Returns ``private_key`` if it already is a Signer, otherwise loads it for a single use."""
+    if isinstance(private_key, Signer):
+        return private_key
+    return Signer(private_key)
+
+
+def key_bytes(private_key: Union[str, bytes]) -> bytes:
+    if isinstance(private_key, str):
+        return bytes.fromhex(private_key[2:] if private_key.startswith(('0x', '0X')) else private_key)
+    return bytes(private_key)
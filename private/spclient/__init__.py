@@ -2,6 +2,6 @@
 Storage provider client for Akave SDK.
 """
 
-from .spclient import SPClient
+from .spclient import SPClient, verify_blocks
 
-__all__ = ['SPClient']
+__all__ = ['SPClient', 'verify_blocks']
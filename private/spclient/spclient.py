@@ -1,3 +1,11 @@
+import asyncio
+import hashlib
+import hmac
+import warnings
+from typing import List, Sequence, Union
+
+from eth_hash.auto import keccak as _keccak256
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -5,36 +13,170 @@ import multiformats.cid as cid
 import multiformats.multihash as multihash
 
 
+# Hosts kept in the pool and keep-alive connections per host. requests defaults
+# to 10 of each, which queues concurrent block downloads from one provider.
+SP_POOL_CONNECTIONS = 32
+SP_POOL_MAXSIZE = 256
+
+# Connection caps for the async fetch_blocks path (aiohttp TCPConnector)
+SP_ASYNC_LIMIT = 64
+SP_ASYNC_LIMIT_PER_HOST = 32
+
+
 class SPClient:
     """Client for communication with Filecoin Storage Provider (SP)."""
 
-    def __init__(self):
+    def __init__(self, pool_connections: int = SP_POOL_CONNECTIONS, pool_maxsize: int = SP_POOL_MAXSIZE):
         self.session = requests.Session()
         retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._async_session = None
+        self._async_loop = None
 
     def close(self):
-        """Closes the HTTP session."""
+        """Closes the HTTP session and the aiohttp session used by fetch_blocks, if one was opened."""
         self.session.close()
+        self._discard_async_session()
+
+    async def aclose(self):
+        """Closes the aiohttp session used by fetch_blocks, if one was opened."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_loop = None
 
-    def fetch_block(self, sp_base_url: str, cid_str: str) -> bytes:
+    def fetch_block(self, sp_base_url: str, cid_str: str) -> Union[bytes, bytearray]:
         """
         Fetches a block from the Filecoin provider.
 
         :param sp_base_url: Base URL of the storage provider.
         :param cid_str: Content Identifier (CID) of the block.
-        :return: Raw block data.
+        :return: Raw block data; a bytearray when the provider sends Content-Length.
         :raises: Exception if the request fails or block retrieval fails.
         """
         url = f"{sp_base_url}/ipfs/{cid_str}?format=raw"
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.content
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                return _read_body(response)
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch block: {e}") from e
 
+    async def fetch_blocks(self, sp_base_url: str, cids: List[str]) -> List[bytes]:
+        """
+        Fetches several blocks from the Filecoin provider concurrently.
+
+        One aiohttp session is opened on first use and reused across calls; its
+        connector caps concurrency at SP_ASYNC_LIMIT connections in total and
+        SP_ASYNC_LIMIT_PER_HOST per provider. The session is bound to the event
+        loop that opened it, so all calls must run on that loop and ``aclose()``
+        should be awaited there when done. Once that loop has been closed (as
+        after ``asyncio.run``) the next call opens a fresh session.
+
+        :param sp_base_url: Base URL of the storage provider.
+        :param cids: Content Identifiers (CIDs) of the blocks.
+        :return: Raw block data in the order of cids.
+        :raises: Exception if any block retrieval fails.
+        """
+        import aiohttp
+
+        session = self._get_async_session(aiohttp)
+
+        async def fetch(cid_str: str) -> bytes:
+            url = f"{sp_base_url}/ipfs/{cid_str}?format=raw"
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        try:
+            return list(await asyncio.gather(*[fetch(cid_str) for cid_str in cids]))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Failed to fetch block: {e}") from e
+
+    def _get_async_session(self, aiohttp):
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not None and self._async_loop is not loop and not self._async_loop.is_closed():
+            raise RuntimeError("fetch_blocks must be awaited on the event loop that opened its session; "
+                               "await aclose() on that loop before switching")
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            self._discard_async_session()
+            connector = aiohttp.TCPConnector(limit=SP_ASYNC_LIMIT, limit_per_host=SP_ASYNC_LIMIT_PER_HOST)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._async_loop = loop
+        return self._async_session
+
+    def _discard_async_session(self):
+        # A session can only be closed on its own loop, which aclose() does. Once that
+        # loop is closed its transports are gone already; otherwise the caller skipped
+        # aclose(), so the connector is left to the loop and the leak is reported.
+        session, loop = self._async_session, self._async_loop
+        self._async_session = None
+        self._async_loop = None
+        if session is None or session.closed:
+            return
+        if not loop.is_closed():
+            warnings.warn("SPClient closed with an open aiohttp session; await aclose() on the loop "
+                          "that ran fetch_blocks", ResourceWarning, stacklevel=3)
+        session.detach()
+
+
+# Hash functions with a direct C implementation, keyed by multihash name. Others go
+# through multiformats, which resolves its implementation on every call.
+_DIGESTERS = {
+    "sha2-256": lambda data: hashlib.sha256(data).digest(),
+    "keccak-256": _keccak256,
+}
+
+
+def verify_blocks(cids: Sequence[Union[str, cid.CID]], data_list: Sequence[bytes]) -> List[bool]:
+    """
+    Checks fetched blocks against the multihash in their CIDs.
+
+    :param cids: CIDs the blocks were requested by.
+    :param data_list: Block data, in the order of cids.
+    :return: Whether each block matches its CID.
+    """
+    if len(cids) != len(data_list):
+        raise ValueError(f"got {len(data_list)} blocks for {len(cids)} CIDs")
+
+    results = []
+    for block_cid, data in zip(cids, data_list):
+        if not isinstance(block_cid, cid.CID):
+            block_cid = cid.CID.decode(block_cid)
+        expected = block_cid.raw_digest
+        digester = _DIGESTERS.get(block_cid.hashfun.name)
+        if digester is not None:
+            actual = digester(data)[:len(expected)]
+        else:
+            actual = multihash.unwrap(block_cid.hashfun.digest(data, size=len(expected)))
+        results.append(hmac.compare_digest(actual, expected))
+    return results
+
+
+def _read_body(response: requests.Response) -> Union[bytes, bytearray]:
+    # With a known, unencoded length the body is read straight into one buffer
+    # instead of being collected in 10 KiB chunks and joined. The buffer is
+    # returned as is; converting it to bytes would copy the block a second time.
+    length = response.headers.get("Content-Length")
+    if not length or response.headers.get("Content-Encoding", "identity") != "identity":
+        return response.content
+
+    buf = bytearray(int(length))
+    view = memoryview(buf)
+    received = 0
+    while received < len(buf):
+        n = response.raw.readinto(view[received:])
+        if not n:
+            raise requests.exceptions.ChunkedEncodingError(
+                f"connection closed after {received} of {len(buf)} bytes"
+            )
+        received += n
+    return buf
+
 
 # Example usage:
 if __name__ == "__main__":
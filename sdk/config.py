@@ -1,9 +1,9 @@
 from typing import Optional, List
-from private.memory.memory import Size
+from private.memory.memory import MB
 from dataclasses import dataclass
 from .erasure_code import ErasureCode
 
-BLOCK_SIZE = 1 * Size.MB
+BLOCK_SIZE = 1 * MB
 ENCRYPTION_OVERHEAD = 28  # 16 bytes for AES-GCM tag, 12 bytes for nonce
 MIN_BUCKET_NAME_LENGTH = 3
 MIN_FILE_SIZE = 127  # 127 bytes
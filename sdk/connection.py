@@ -2,16 +2,42 @@ import grpc
 import time
 import threading
 import logging
-from typing import Dict, Optional, Tuple, Callable
+import itertools
+from typing import Dict, List, Optional, Tuple, Callable
 from private.pb import nodeapi_pb2_grpc, ipcnodeapi_pb2_grpc
 from .config import SDKError
 
+logger = logging.getLogger(__name__)
+
+# Large messages for block payloads, and keepalive so idle channels are not
+# dropped and reconnected between chunks.
+_GRPC_OPTS = (
+    ('grpc.max_receive_message_length', 100 * 1024 * 1024),
+    ('grpc.max_send_message_length', 100 * 1024 * 1024),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+)
+_GRPC_FANOUT_OPTS = _GRPC_OPTS + (('grpc.use_local_subchannel_pool', 1),)
+
+# Channels opened per address by pools used for parallel block transfers.
+CHANNEL_FANOUT = 4
+
 
 class ConnectionPool:
+    """Keeps pooled gRPC channels per node address.
+
+    With ``fanout`` above one, each address gets that many channels on separate
+    HTTP/2 connections and pooled clients are handed out round-robin, so
+    concurrent block streams are not serialized on a single connection.
+    """
     
-    def __init__(self):
+    def __init__(self, fanout: int = 1):
         self._lock = threading.RLock()
-        self._connections: Dict[str, grpc.Channel] = {}
+        self._fanout = max(1, fanout)
+        self._pools: Dict[str, Tuple[List[grpc.Channel], itertools.count]] = {}
 
     def create_ipc_client(self, addr: str, pooled: bool) -> Tuple[ipcnodeapi_pb2_grpc.IPCNodeAPIStub, Optional[Callable[[], None]], Optional[Exception]]:
         try:
@@ -21,16 +47,7 @@ class ConnectionPool:
                     return None, None, err
                 return ipcnodeapi_pb2_grpc.IPCNodeAPIStub(conn), None, None
 
-            options = [
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024),  
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                ('grpc.keepalive_time_ms', 30000),  
-                ('grpc.keepalive_timeout_ms', 10000),  
-                ('grpc.keepalive_permit_without_calls', 1), 
-                ('grpc.http2.max_pings_without_data', 0),  
-                ('grpc.http2.min_time_between_pings_ms', 10000), 
-            ]
-            conn = grpc.insecure_channel(addr, options=options)
+            conn = grpc.insecure_channel(addr, options=_GRPC_OPTS)
             return ipcnodeapi_pb2_grpc.IPCNodeAPIStub(conn), conn.close, None
             
         except Exception as e:
@@ -44,64 +61,61 @@ class ConnectionPool:
                     return None, None, err
                 return nodeapi_pb2_grpc.StreamAPIStub(conn), None, None
 
-            options = [
-                ('grpc.max_receive_message_length', 100 * 1024 * 1024), 
-                ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                ('grpc.keepalive_time_ms', 30000), 
-                ('grpc.keepalive_timeout_ms', 10000), 
-                ('grpc.keepalive_permit_without_calls', 1),  
-                ('grpc.http2.max_pings_without_data', 0), 
-                ('grpc.http2.min_time_between_pings_ms', 10000),  
-            ]
-            conn = grpc.insecure_channel(addr, options=options)
+            conn = grpc.insecure_channel(addr, options=_GRPC_OPTS)
             return nodeapi_pb2_grpc.StreamAPIStub(conn), conn.close, None
             
         except Exception as e:
             return None, None, SDKError(f"Failed to create streaming client: {str(e)}")
 
     def _get(self, addr: str) -> Tuple[Optional[grpc.Channel], Optional[Exception]]:
+        pool = self._pools.get(addr)
+        if pool is not None:
+            channels, rr = pool
+            return channels[next(rr) % len(channels)], None
+
         with self._lock:
-            if addr in self._connections:
-                return self._connections[addr], None
+            if addr in self._pools:
+                return self._get(addr)
+
+        # Dial outside the lock so new addresses don't queue behind each other;
+        # if another thread got there first, keep its channels and close ours.
+        try:
+            channels = [self._dial(addr) for _ in range(self._fanout)]
+        except Exception as e:
+            return None, SDKError(f"Failed to connect to {addr}: {str(e)}")
 
         with self._lock:
-            if addr in self._connections:
-                return self._connections[addr], None
-
-            try:
-                options = [
-                    ('grpc.max_receive_message_length', 100 * 1024 * 1024),  
-                    ('grpc.max_send_message_length', 100 * 1024 * 1024),
-                    ('grpc.keepalive_time_ms', 30000),  
-                    ('grpc.keepalive_timeout_ms', 10000),  
-                    ('grpc.keepalive_permit_without_calls', 1),  
-                    ('grpc.http2.max_pings_without_data', 0), 
-                    ('grpc.http2.min_time_between_pings_ms', 10000),  
-                ]
-                conn = grpc.insecure_channel(addr, options=options)
-                
-                try:
-                    grpc.channel_ready_future(conn).result(timeout=5)
-                except grpc.FutureTimeoutError:
-                    logging.warning(f"Connection to {addr} not ready within timeout, proceeding anyway")
-                
-                self._connections[addr] = conn
-                return conn, None
-                
-            except Exception as e:
-                return None, SDKError(f"Failed to connect to {addr}: {str(e)}")
+            won = addr not in self._pools
+            if won:
+                self._pools[addr] = (channels, itertools.count(1))
+
+        if not won:
+            for conn in channels:
+                conn.close()
+            return self._get(addr)
+
+        for conn in channels:
+            _connect_in_background(addr, conn)
+        return channels[0], None
+
+    def _dial(self, addr: str) -> grpc.Channel:
+        if self._fanout > 1:
+            # Channels with identical args share subchannels; keep each on its own connection.
+            return grpc.insecure_channel(addr, options=_GRPC_FANOUT_OPTS)
+        return grpc.insecure_channel(addr, options=_GRPC_OPTS)
 
     def close(self) -> Optional[Exception]:
         with self._lock:
             errors = []
             
-            for addr, conn in self._connections.items():
-                try:
-                    conn.close()
-                except Exception as e:
-                    errors.append(f"failed to close connection to {addr}: {str(e)}")
+            for addr, (channels, _) in self._pools.items():
+                for conn in channels:
+                    try:
+                        conn.close()
+                    except Exception as e:
+                        errors.append(f"failed to close connection to {addr}: {str(e)}")
             
-            self._connections.clear()
+            self._pools.clear()
             
             if errors:
                 return SDKError(f"encountered errors while closing connections: {errors}")
@@ -109,5 +123,16 @@ class ConnectionPool:
             return None
 
 
+def _connect_in_background(addr: str, conn: grpc.Channel) -> None:
+    """Starts connecting a channel without blocking; the first RPC waits for it if needed."""
+    def on_state(state: grpc.ChannelConnectivity) -> None:
+        if state is grpc.ChannelConnectivity.READY:
+            conn.unsubscribe(on_state)
+        elif state is grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+            logger.debug("Connection to %s failed, gRPC will retry", addr)
+
+    conn.subscribe(on_state, try_to_connect=True)
+
+
 def new_connection_pool() -> ConnectionPool:
     return ConnectionPool()
\ No newline at end of file
@@ -1,6 +1,11 @@
 import io
+import os
+import base64
 import hashlib
-from typing import List, Optional, Any, BinaryIO, Tuple
+import threading
+import concurrent.futures
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, BinaryIO, Tuple
 from dataclasses import dataclass
 
 try:
@@ -45,9 +50,69 @@ from .config import DAG_PB_CODEC, RAW_CODEC, DEFAULT_CID_VERSION
 
 CID_VERSION = 1
 
+# hashlib's sha256 is OpenSSL's, which picks SHA-NI or AVX2 code at runtime;
+# every block hash in this module goes through this name.
+_sha256 = hashlib.sha256
+
+# Multihash header for sha2-256: code 0x12, 32-byte digest
+_SHA256_MULTIHASH_PREFIX = b"\x12\x20"
+
+
+def _sha256_multihash(data) -> bytes:
+    # Same bytes as multihash.digest(data, "sha2-256") without its per-call registry lookups
+    return _SHA256_MULTIHASH_PREFIX + _sha256(data).digest()
+
+
+# hashlib releases the GIL while hashing large buffers, so per-block work is
+# spread over a few threads when there is more than one core.
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
+_hash_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hash_executor_lock = threading.Lock()
+
+
+def _map_blocks(fn, items: List[Any]) -> List[Any]:
+    """``[fn(item) for item in items]``, run on the shared block pool when there
+    is more than one item and more than one core."""
+    global _hash_executor
+    if _HASH_WORKERS < 2 or len(items) < 2:
+        return [fn(item) for item in items]
+    
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                _hash_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_HASH_WORKERS, thread_name_prefix="dag-hash"
+                )
+    return list(_hash_executor.map(fn, items))
+
+
+CID_CACHE_SIZE = 4096
+
 class DAGError(Exception):
     pass
 
+
+def _decode_cid(cid_str: str):
+    """CID.decode with memoized results; the same CIDs are decoded again when
+    links are added, chunk roots are built and blocks are downloaded."""
+    return _decode_cid_cached(CID, cid_str)
+
+
+@lru_cache(maxsize=CID_CACHE_SIZE)
+def _decode_cid_cached(cid_class, cid_str: str):
+    # Keyed on the class as well, so rebinding CID never serves stale objects
+    return cid_class.decode(cid_str)
+
+
+# Lowercases the base32 alphabet in one pass over the encoded bytes
+_B32_TABLE = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567" + b"01", b"abcdefghijklmnopqrstuvwxyz234567" + b"ab")
+
+
+@lru_cache(maxsize=CID_CACHE_SIZE)
+def _fallback_cid(digest: bytes) -> str:
+    """Pseudo-CID string used when the IPLD libraries are unavailable."""
+    return "bafybeig" + base64.b32encode(digest).translate(_B32_TABLE).rstrip(b"=")[:50].decode("ascii")
+
 class DAGRoot:    
     def __init__(self):
         self.node = None  # Will store PBNode
@@ -67,11 +132,15 @@ class DAGRoot:
         else:
             cid_str = chunk_cid
             
+        pb_link = None
         if IPLD_AVAILABLE:
             try:
-                cid_obj = CID.decode(cid_str) if isinstance(cid_str, str) else chunk_cid
+                cid_obj = _decode_cid(cid_str) if isinstance(cid_str, str) else chunk_cid
             except:
                 cid_obj = cid_str
+            # The root's PBLink is built once here and reused by build()
+            if not isinstance(cid_obj, str):
+                pb_link = PBLink(hash=cid_obj, name="", size=proto_node_size)
         else:
             cid_obj = cid_str
             
@@ -81,7 +150,8 @@ class DAGRoot:
             "cid": cid_obj,
             "cid_str": cid_str,  
             "name": "",  
-            "size": proto_node_size
+            "size": proto_node_size,
+            "pb_link": pb_link
         })
     
     def build(self):
@@ -97,30 +167,13 @@ class DAGRoot:
             return str(link_cid)
         
         if not IPLD_AVAILABLE:
-            import base64
             combined_data = "".join([link["cid_str"] for link in self.links]).encode()
-            hash_digest = hashlib.sha256(combined_data).digest()
-            b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
-            char_map = str.maketrans('01', 'ab')
-            b32_hash = b32_hash.translate(char_map)
-            return f"bafybeig{b32_hash[:50]}"
+            hash_digest = _sha256(combined_data).digest()
+            return _fallback_cid(hash_digest)
         
         try:
-            pb_links = []
-            for link in self.links:
-                link_cid = link["cid"]
-                if isinstance(link_cid, str):
-                    try:
-                        link_cid = CID.decode(link_cid)
-                    except Exception:
-                        continue
-                
-                pb_link = PBLink(
-                    hash=link_cid,
-                    name=link["name"], 
-                    size=link["size"]
-                )
-                pb_links.append(pb_link)
+            # Links whose CID could not be decoded in add_link have no PBLink
+            pb_links = [link["pb_link"] for link in self.links if link["pb_link"] is not None]
             
             if not pb_links:
                 raise DAGError("no valid CIDs found for DAG links")
@@ -137,20 +190,16 @@ class DAGRoot:
             raise DAGError(f"failed to build DAG root: {str(e)}")
     
     def _create_unixfs_file_data(self) -> bytes:
-        unixfs_data = bytes([0x08, 0x02])  # Type = File
+        unixfs_data = bytearray(b"\x08\x02")  # Type = File
         
         if self.total_file_size > 0:
-            unixfs_data += bytes([0x18]) + self._encode_varint(self.total_file_size)
+            unixfs_data.append(0x18)
+            _encode_varint_into(unixfs_data, self.total_file_size)
         
-        return unixfs_data
+        return bytes(unixfs_data)
     
     def _encode_varint(self, value: int) -> bytes:
-        result = b''
-        while value > 127:
-            result += bytes([(value & 127) | 128])
-            value >>= 7
-        result += bytes([value & 127])
-        return result
+        return _encode_varint(value)
 
 @dataclass 
 class ChunkDAG:
@@ -182,15 +231,12 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int, enc_key: Optional[byt
             raw_size, encoded_size = node_sizes(encoded_data)
             
         else:
-            offset = 0
             pb_links = []
+            # Blocks are views into data; each is copied once, into its encoded node
+            view = memoryview(data)
+            block_datas = [view[offset:offset + block_size] for offset in range(0, len(data), block_size)]
             
-            while offset < len(data):
-                end_offset = min(offset + block_size, len(data))
-                block_data = data[offset:end_offset]
-                
-                block_cid, block_encoded_data = _create_unixfs_file_node(block_data)
-                
+            for block_cid, block_encoded_data in _create_unixfs_file_nodes(block_datas):
                 block = FileBlockUpload(
                     cid=str(block_cid) if hasattr(block_cid, '__str__') else block_cid,
                     data=block_encoded_data
@@ -199,7 +245,7 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int, enc_key: Optional[byt
                 
                 if IPLD_AVAILABLE:
                     try:
-                        cid_obj = CID.decode(block.cid) if isinstance(block.cid, str) else block_cid
+                        cid_obj = block_cid if not isinstance(block_cid, str) else _decode_cid(block_cid)
                         pb_links.append(PBLink(
                             hash=cid_obj,
                             name="",
@@ -207,8 +253,6 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int, enc_key: Optional[byt
                         ))
                     except:
                         pass
-                
-                offset = end_offset
             
             chunk_cid, encoded_size = _create_chunk_dag_root_node(blocks, pb_links)
             raw_size = raw_data_size
@@ -227,51 +271,67 @@ def build_dag(ctx: Any, reader: BinaryIO, block_size: int, enc_key: Optional[byt
 
 def _create_unixfs_file_node(data: bytes):
     if not IPLD_AVAILABLE:
-        hash_digest = hashlib.sha256(data).digest()
-        import base64
-        b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
-        char_map = str.maketrans('01', 'ab')
-        b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", data
+        hash_digest = _sha256(data).digest()
+        return _fallback_cid(hash_digest), bytes(data)
     
     try:
-        unixfs_data = bytes([0x08, 0x02])  
+        encoded_bytes = _encode_unixfs_file_node(data)
         
-        if len(data) > 0:
-            unixfs_data += bytes([0x22]) + _encode_varint(len(data)) + data
-        
-        pb_node = PBNode(data=unixfs_data, links=[])
-        encoded_bytes = encode(pb_node)
-        
-        digest = multihash.digest(encoded_bytes, "sha2-256")
+        digest = _sha256_multihash(encoded_bytes)
         cid = CID("base32", CID_VERSION, dag_pb_code, digest)
         
         return cid, encoded_bytes
         
     except Exception as e:
-        hash_digest = hashlib.sha256(data).digest()
-        import base64
-        b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
-        char_map = str.maketrans('01', 'ab')
-        b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", data
+        hash_digest = _sha256(data).digest()
+        return _fallback_cid(hash_digest), bytes(data)
+
+def _encode_unixfs_file_node(data: bytes) -> bytes:
+    # A leaf is a DAG-PB node whose only field is Data (0x0a), holding a UnixFS
+    # message with Type=File (0x08 0x02) and, when non-empty, Data (0x22). It is
+    # written directly because ipld_dag_pb's encoder copies the payload one
+    # byte at a time; the join below is the payload's only copy.
+    size = len(data)
+    unixfs_header = bytearray(b"\x08\x02")
+    if size:
+        unixfs_header.append(0x22)
+        _encode_varint_into(unixfs_header, size)
+    header = bytearray(b"\x0a")
+    _encode_varint_into(header, len(unixfs_header) + size)
+    header += unixfs_header
+    return b"".join((header, data))
+
+def _encode_and_hash_leaf(data: bytes) -> Tuple[bytes, bytes]:
+    encoded_bytes = _encode_unixfs_file_node(data)
+    return encoded_bytes, _sha256(encoded_bytes).digest()
+
+
+def _create_unixfs_file_nodes(datas: List[bytes]) -> List[Tuple[Any, bytes]]:
+    """_create_unixfs_file_node for every block of a chunk. Each block is encoded
+    and hashed on the block pool; CIDs are built afterwards, in order."""
+    if not IPLD_AVAILABLE or len(datas) < 2:
+        return [_create_unixfs_file_node(data) for data in datas]
+    
+    try:
+        return [
+            (CID("base32", CID_VERSION, dag_pb_code, _SHA256_MULTIHASH_PREFIX + digest), encoded_bytes)
+            for encoded_bytes, digest in _map_blocks(_encode_and_hash_leaf, datas)
+        ]
+    except Exception:
+        return [_create_unixfs_file_node(data) for data in datas]
 
 def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List = None):
     if not IPLD_AVAILABLE:
         combined_data = b"".join([block.data for block in blocks])
-        hash_digest = hashlib.sha256(combined_data).digest()
-        import base64
-        b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
-        char_map = str.maketrans('01', 'ab')
-        b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", len(combined_data)
+        hash_digest = _sha256(combined_data).digest()
+        return _fallback_cid(hash_digest), len(combined_data)
     
     try:
         if not pb_links:
             pb_links = []
             for block in blocks:
                 try:
-                    block_cid = CID.decode(block.cid) if isinstance(block.cid, str) else block.cid
+                    block_cid = _decode_cid(block.cid) if isinstance(block.cid, str) else block.cid
                     pb_link = PBLink(
                         hash=block_cid,
                         name="",
@@ -286,7 +346,7 @@ def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List =
         pb_node = PBNode(data=unixfs_data, links=pb_links)
         encoded_bytes = encode(pb_node)
         
-        digest = multihash.digest(encoded_bytes, "sha2-256")
+        digest = _sha256_multihash(encoded_bytes)
         cid = CID("base32", CID_VERSION, dag_pb_code, digest)
         
         total_size = sum(len(block.data) for block in blocks)
@@ -294,18 +354,18 @@ def _create_chunk_dag_root_node(blocks: List[FileBlockUpload], pb_links: List =
         
     except Exception as e:
         combined_data = b"".join([block.data for block in blocks])
-        hash_digest = hashlib.sha256(combined_data).digest()
-        import base64
-        b32_hash = base64.b32encode(hash_digest).decode().lower().rstrip('=')
-        char_map = str.maketrans('01', 'ab')
-        b32_hash = b32_hash.translate(char_map)
-        return f"bafybeig{b32_hash[:50]}", len(combined_data)
+        hash_digest = _sha256(combined_data).digest()
+        return _fallback_cid(hash_digest), len(combined_data)
 
 def node_sizes(node_data: bytes) -> Tuple[int, int]:
     if not IPLD_AVAILABLE:
         encoded_size = len(node_data)
         return encoded_size, encoded_size
     
+    sizes = _node_sizes_fast(node_data)
+    if sizes is not None:
+        return sizes
+    
     try:
         pb_node = decode(node_data)  
         
@@ -329,13 +389,93 @@ def node_sizes(node_data: bytes) -> Tuple[int, int]:
         encoded_size = len(node_data)
         return encoded_size, encoded_size
 
+def _node_sizes_fast(node_data: bytes) -> Optional[Tuple[int, int]]:
+    """node_sizes read straight from the DAG-PB bytes, without building a PBNode
+    and its links. Returns None for anything but a well-formed node (links
+    first, then at most one Data field) so the caller can fall back to decode."""
+    view = memoryview(node_data)
+    end = len(view)
+    offset = 0
+    links = 0
+    links_size = 0
+    data = None
+    try:
+        while offset < end:
+            tag = view[offset]
+            if tag == 0x12 and data is None:
+                length, read = _decode_varint(view, offset + 1)
+                offset += 1 + read
+                link_end = offset + length
+                if link_end > end:
+                    return None
+                tsize = _link_tsize(view, offset, link_end)
+                if tsize is None:
+                    return None
+                links += 1
+                links_size += tsize
+                offset = link_end
+            elif tag == 0x0a and data is None:
+                length, read = _decode_varint(view, offset + 1)
+                offset += 1 + read
+                if offset + length > end:
+                    return None
+                data = view[offset:offset + length]
+                offset += length
+            else:
+                return None
+    except (ValueError, IndexError):
+        return None
+    
+    if not data:
+        if links == 0:
+            return end, end
+        return 0, links_size
+    return _extract_unixfs_data_size(data), end if links == 0 else links_size
+
+def _link_tsize(view: memoryview, offset: int, end: int) -> Optional[int]:
+    # PBLink fields in canonical order: Hash (required), Name, Tsize
+    if offset >= end or view[offset] != 0x0a:
+        return None
+    length, read = _decode_varint(view, offset + 1)
+    offset += 1 + read + length
+    if offset < end and view[offset] == 0x12:
+        length, read = _decode_varint(view, offset + 1)
+        offset += 1 + read + length
+    if offset >= end or view[offset] != 0x18:
+        return None
+    tsize, read = _decode_varint(view, offset + 1)
+    if offset + 1 + read != end:
+        return None
+    return tsize
+
+def _skip_varint(data: bytes, offset: int) -> int:
+    return offset + _decode_varint(data, offset)[1]
+
+def _skip_length_delimited(data: bytes, offset: int) -> int:
+    length, bytes_read = _decode_varint(data, offset)
+    return offset + bytes_read + length
+
+def _skip_fixed64(data: bytes, offset: int) -> int:
+    return offset + 8
+
+def _skip_fixed32(data: bytes, offset: int) -> int:
+    return offset + 4
+
+def _skip_unknown(data: bytes, offset: int) -> int:
+    return offset + 1
+
+# Skips a field's payload given its wire type (tag & 0x07), replacing the
+# per-scanner if/elif chains; groups and reserved types advance one byte.
+# Scanners step over single-byte varints inline before consulting it.
+_WIRE_SKIP = (
+    _skip_varint, _skip_fixed64, _skip_length_delimited, _skip_unknown,
+    _skip_unknown, _skip_fixed32, _skip_unknown, _skip_unknown,
+)
+
 def _extract_unixfs_data_size(unixfs_bytes: bytes) -> int:
     try:
         offset = 0
         while offset < len(unixfs_bytes):
-            if offset >= len(unixfs_bytes):
-                break
-                
             field_tag = unixfs_bytes[offset]
             offset += 1
             
@@ -343,43 +483,66 @@ def _extract_unixfs_data_size(unixfs_bytes: bytes) -> int:
             wire_type = field_tag & 0x07
             
             if field_number == 3 and wire_type == 0:  
-                file_size, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                file_size, bytes_read = _decode_varint(unixfs_bytes, offset)
                 return file_size
             elif field_number == 4 and wire_type == 2:  
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 return length  
-            elif wire_type == 2:  
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
-                offset += bytes_read + length
-            elif wire_type == 0:  
-                value, bytes_read = _decode_varint(unixfs_bytes[offset:])
-                offset += bytes_read
-            elif wire_type == 1:  
-                offset += 8
-            elif wire_type == 5: 
-                offset += 4
-            else:
+            elif wire_type == 0 and unixfs_bytes[offset] < 0x80:
                 offset += 1
+            else:
+                offset = _WIRE_SKIP[wire_type](unixfs_bytes, offset)
         
         return 0
         
     except Exception:
         return 0
 
+_SMALL_VARINTS = tuple(bytes((i,)) for i in range(128))
+
+
 def _encode_varint(value: int) -> bytes:
-    result = b''
-    while value > 127:
-        result += bytes([(value & 127) | 128])
+    if value < 0x80:
+        return _SMALL_VARINTS[value & 0x7F]
+    if value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    
+    # Size the output from the bit length and fill it in place
+    n = (value.bit_length() + 6) // 7
+    buf = bytearray(n)
+    for i in range(n - 1):
+        buf[i] = (value & 0x7F) | 0x80
         value >>= 7
-    result += bytes([value & 127])
-    return result
+    buf[n - 1] = value
+    return bytes(buf)
 
-def _decode_varint(data: bytes) -> tuple[int, int]:
+def _encode_varint_into(buf: bytearray, value: int) -> None:
+    """Appends the varint for ``value`` to ``buf`` without an intermediate bytes object."""
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+def _decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
+    """Decodes the varint starting at ``offset``; callers pass an offset rather
+    than a slice so scanning a block never copies its tail."""
+    # Tags and most lengths fit in one or two bytes
+    end = len(data)
+    if offset < end:
+        b0 = data[offset]
+        if b0 < 0x80:
+            return b0, 1
+        if offset + 1 < end:
+            b1 = data[offset + 1]
+            if b1 < 0x80:
+                return (b0 & 0x7F) | (b1 << 7), 2
+    
     value = 0
     shift = 0
     bytes_read = 0
     
-    for byte in data:
+    for i in range(offset, len(data)):
+        byte = data[i]
         bytes_read += 1
         value |= (byte & 0x7F) << shift
         if (byte & 0x80) == 0:
@@ -396,7 +559,7 @@ def extract_block_data(cid_str: str, data: bytes) -> bytes:
             return _extract_unixfs_data_fallback(data)
             
         try:
-            cid_obj = CID.decode(cid_str)
+            cid_obj = _decode_cid(cid_str)
             cid_type = cid_obj.codec
         except:
             if cid_str.startswith('bafkreig'):
@@ -432,9 +595,6 @@ def _extract_unixfs_data_fallback(data: bytes) -> bytes:
         # Field 2 (Links): Array of links to other blocks
         
         while offset < len(data):
-            if offset >= len(data):
-                break
-                
             field_tag = data[offset]
             offset += 1
             
@@ -442,29 +602,21 @@ def _extract_unixfs_data_fallback(data: bytes) -> bytes:
             wire_type = field_tag & 0x07
             
             if field_number == 1 and wire_type == 2:
-                length, bytes_read = _decode_varint(data[offset:])
+                length, bytes_read = _decode_varint(data, offset)
                 offset += bytes_read
                 
                 if offset + length <= len(data):
-                    unixfs_data = data[offset:offset + length]
+                    unixfs_data = memoryview(data)[offset:offset + length]
                     extracted = _extract_unixfs_data(unixfs_data)
                     if extracted:
                         return extracted
                     offset += length
                 else:
                     break
-            elif wire_type == 2:  
-                length, bytes_read = _decode_varint(data[offset:])
-                offset += bytes_read + length
-            elif wire_type == 0:  
-                value, bytes_read = _decode_varint(data[offset:])
-                offset += bytes_read
-            elif wire_type == 1:  
-                offset += 8
-            elif wire_type == 5:  
-                offset += 4
-            else:
+            elif wire_type == 0 and data[offset] < 0x80:
                 offset += 1
+            else:
+                offset = _WIRE_SKIP[wire_type](data, offset)
         
         return data
         
@@ -475,9 +627,6 @@ def _extract_unixfs_data(unixfs_bytes: bytes) -> bytes:
     try:
         offset = 0
         while offset < len(unixfs_bytes):
-            if offset >= len(unixfs_bytes):
-                break
-                
             field_tag = unixfs_bytes[offset]
             offset += 1
             
@@ -485,25 +634,17 @@ def _extract_unixfs_data(unixfs_bytes: bytes) -> bytes:
             wire_type = field_tag & 0x07
             
             if field_number == 4 and wire_type == 2:  # Field 4 (Data) with length-delimited wire type
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
+                length, bytes_read = _decode_varint(unixfs_bytes, offset)
                 offset += bytes_read
                 
                 if offset + length <= len(unixfs_bytes):
-                    return unixfs_bytes[offset:offset + length]
+                    return bytes(unixfs_bytes[offset:offset + length])
                 else:
                     break
-            elif wire_type == 2:  # Length-delimited field
-                length, bytes_read = _decode_varint(unixfs_bytes[offset:])
-                offset += bytes_read + length
-            elif wire_type == 0:  # Varint
-                value, bytes_read = _decode_varint(unixfs_bytes[offset:])
-                offset += bytes_read
-            elif wire_type == 1:  # Fixed64
-                offset += 8
-            elif wire_type == 5:  # Fixed32
-                offset += 4
-            else:
+            elif wire_type == 0 and unixfs_bytes[offset] < 0x80:
                 offset += 1
+            else:
+                offset = _WIRE_SKIP[wire_type](unixfs_bytes, offset)
         
         return b""
         
@@ -535,7 +676,20 @@ def get_node_links(node_data: bytes) -> List[dict]:
     except Exception as e:
         raise DAGError(f"failed to extract links from node: {str(e)}")
 
-def block_by_cid(blocks: List[FileBlockUpload], cid_str: str) -> tuple[FileBlockUpload, bool]:
+def index_blocks(blocks: List[FileBlockUpload]) -> Dict[str, FileBlockUpload]:
+    """Maps each CID to its block, keeping the first block for duplicate CIDs
+    just as a linear scan would. Build it once to look up many CIDs."""
+    return {block.cid: block for block in reversed(blocks)}
+
+
+def block_by_cid(blocks: List[FileBlockUpload], cid_str: str,
+                 index: Optional[Dict[str, FileBlockUpload]] = None) -> tuple[FileBlockUpload, bool]:
+    if index is not None:
+        block = index.get(cid_str)
+        if block is not None:
+            return block, True
+        return FileBlockUpload(cid="", data=b""), False
+    
     for block in blocks:
         if block.cid == cid_str:
             return block, True
@@ -1,26 +1,215 @@
+import concurrent.futures
 import math
-from reedsolo import RSCodec, ReedSolomonError
-from itertools import combinations
+import os
+import threading
+from functools import lru_cache
+from itertools import chain, combinations
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# GF(2^8) with the 0x11d reduction polynomial and generator 2
+_GF_POLY = 0x11D
+
+
+def _gf_tables() -> Tuple[List[int], List[int], np.ndarray]:
+    exp = [0] * 512
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x <<= 1
+        if x & 0x100:
+            x ^= _GF_POLY
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+
+    # Full product table: row c is "multiply by c" as a 256-entry lookup, so a
+    # whole shard is scaled with one NumPy gather.
+    exp_arr = np.array(exp, dtype=np.uint8)
+    log_arr = np.array(log, dtype=np.int32)
+    mul = exp_arr[log_arr[:, None] + log_arr[None, :]]
+    mul[0, :] = 0
+    mul[:, 0] = 0
+    return exp, log, mul
+
+
+_GF_EXP, _GF_LOG, _GF_MUL = _gf_tables()
+
+
+def _gf_mul(a: int, b: int) -> int:
+    if a == 0 or b == 0:
+        return 0
+    return _GF_EXP[_GF_LOG[a] + _GF_LOG[b]]
+
+
+def _gf_inv(a: int) -> int:
+    return _GF_EXP[255 - _GF_LOG[a]]
+
+
+def _gf_pow(a: int, n: int) -> int:
+    if n == 0:
+        return 1
+    if a == 0:
+        return 0
+    return _GF_EXP[(_GF_LOG[a] * n) % 255]
+
+
+def _mat_mul(a: Sequence[Sequence[int]], b: Sequence[Sequence[int]]) -> List[List[int]]:
+    result = []
+    for row in a:
+        out = [0] * len(b[0])
+        for k, coef in enumerate(row):
+            if coef:
+                for c, value in enumerate(b[k]):
+                    out[c] ^= _gf_mul(coef, value)
+        result.append(out)
+    return result
+
+
+def _mat_inv(matrix: Sequence[Sequence[int]]) -> List[List[int]]:
+    n = len(matrix)
+    work = [list(row) + [int(i == r) for i in range(n)] for r, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if work[r][col]), None)
+        if pivot is None:
+            raise ValueError("matrix is singular")
+        work[col], work[pivot] = work[pivot], work[col]
+        inv = _gf_inv(work[col][col])
+        work[col] = [_gf_mul(inv, v) for v in work[col]]
+        for r in range(n):
+            factor = work[r][col]
+            if r != col and factor:
+                work[r] = [v ^ _gf_mul(factor, p) for v, p in zip(work[r], work[col])]
+    return [row[n:] for row in work]
+
+
+@lru_cache(maxsize=32)
+def _encoding_matrix(data_blocks: int, total_shards: int) -> Tuple[Tuple[int, ...], ...]:
+    """Systematic generator: a Vandermonde matrix normalized so its top rows are
+    the identity. Any data_blocks rows of it are invertible, which is what lets
+    any data_blocks shards rebuild the data."""
+    vandermonde = [[_gf_pow(r, c) for c in range(data_blocks)] for r in range(total_shards)]
+    top_inv = _mat_inv(vandermonde[:data_blocks])
+    return tuple(tuple(row) for row in _mat_mul(vandermonde, top_inv))
+
+
+@lru_cache(maxsize=256)
+def _decoding_matrix(data_blocks: int, total_shards: int, rows: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    matrix = _encoding_matrix(data_blocks, total_shards)
+    return tuple(tuple(row) for row in _mat_inv([matrix[r] for r in rows]))
+
+
+def _combine(coefs: Sequence[int], shards: Sequence[np.ndarray], out: np.ndarray) -> np.ndarray:
+    # out = sum(coef * shard) over GF(2^8): one table gather and XOR per input shard.
+    # ndarray.take runs about twice as fast as fancy indexing for a flat uint8
+    # lookup, and the scratch buffer avoids a fresh product array per shard.
+    # The first term is written straight into out, so a row with a single unit
+    # coefficient (replication, or an intact shard in a decode row) is a copy.
+    product = None
+    empty = True
+    for coef, shard in zip(coefs, shards):
+        if not coef:
+            continue
+        if empty:
+            if coef == 1:
+                np.copyto(out, shard)
+            else:
+                _GF_MUL[coef].take(shard, out=out)
+            empty = False
+        elif coef == 1:
+            np.bitwise_xor(out, shard, out=out)
+        else:
+            if product is None:
+                product = np.empty_like(out)
+            _GF_MUL[coef].take(shard, out=product)
+            np.bitwise_xor(out, product, out=out)
+    if empty:
+        out[:] = 0
+    return out
+
+
+# NumPy's take and bitwise_xor release the GIL, so the byte columns of large
+# shards are split across a few threads when there is more than one core.
+_EC_WORKERS = min(8, os.cpu_count() or 1)
+_MIN_COLUMNS_PER_WORKER = 64 * 1024
+_ec_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_ec_executor_lock = threading.Lock()
+
+
+def _combine_rows(coef_rows: Sequence[Sequence[int]], shards: Sequence[np.ndarray], outs: np.ndarray) -> None:
+    """_combine for every coefficient row, into the matching row of ``outs``.
+    Every byte column is independent, so columns are processed in ranges."""
+    global _ec_executor
+    shard_size = outs.shape[1]
+
+    def run(start: int, end: int) -> None:
+        inputs = [shard[start:end] for shard in shards]
+        for coefs, out in zip(coef_rows, outs):
+            _combine(coefs, inputs, out[start:end])
+
+    parts = min(_EC_WORKERS, shard_size // _MIN_COLUMNS_PER_WORKER)
+    if parts < 2:
+        run(0, shard_size)
+        return
+
+    if _ec_executor is None:
+        with _ec_executor_lock:
+            if _ec_executor is None:
+                _ec_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_EC_WORKERS, thread_name_prefix="erasure-code"
+                )
+    step = -(-shard_size // parts)
+    futures = [_ec_executor.submit(run, start, min(start + step, shard_size)) for start in range(0, shard_size, step)]
+    for future in futures:
+        future.result()
+
+
+def iter_missing_shards_idx(n: int, k: int) -> Iterator[List[int]]:
+    """Yields the same combinations as missing_shards_idx one at a time, so
+    callers that only iterate never hold all C(n, k) of them."""
+    return map(list, combinations(range(n), k))
 
 def missing_shards_idx(n, k):
-    return [list(combo) for combo in combinations(range(n), k)]
+    return list(iter_missing_shards_idx(n, k))
 
-def split_into_blocks(encoded: bytes, shard_size: int):
-    blocks = []
-    for offset in range(0, len(encoded), shard_size):
-        block = encoded[offset: offset + shard_size]
-        if len(block) < shard_size:
-            block = block.ljust(shard_size, b'\x00')
-        blocks.append(block)
-    return blocks
+def missing_shards_idx_array(n: int, k: int) -> np.ndarray:
+    """Same combinations as missing_shards_idx as one (C(n, k), k) array, without
+    a Python list per combination. Shard counts are capped at 256, so uint8 holds
+    every index."""
+    count = math.comb(n, k)
+    flat = np.fromiter(chain.from_iterable(combinations(range(n), k)), dtype=np.uint8, count=count * k)
+    return flat.reshape(count, k)
+
+def split_into_blocks(encoded: bytes, shard_size: int) -> List[memoryview]:
+    """Splits ``encoded`` into ``shard_size`` blocks, zero-padding the last one.
+
+    Blocks are read-only views into one padded buffer; the input is copied
+    only when padding is needed, never once per block.
+    """
+    count = -(-len(encoded) // shard_size)
+    view = memoryview(bytes(encoded).ljust(count * shard_size, b'\x00'))
+    return [view[offset:offset + shard_size] for offset in range(0, count * shard_size, shard_size)]
 
 class ErasureCode:
+    """Systematic Reed-Solomon over GF(2^8).
+
+    ``encode`` splits the data into ``data_blocks`` equal shards and appends
+    ``parity_blocks`` parity shards; any ``data_blocks`` of the resulting
+    shards are enough to recover the data. Shards are processed as NumPy
+    rows, so the Python-level work is per shard pair rather than per byte.
+    """
+
     def __init__(self, data_blocks: int, parity_blocks: int):
         if data_blocks <= 0 or parity_blocks <= 0:
             raise ValueError("Data and parity shards must be > 0")
+        if data_blocks + parity_blocks > 256:
+            raise ValueError("Data and parity shards must not exceed 256 in total")
         self.data_blocks = data_blocks
         self.parity_blocks = parity_blocks
         self.total_shards = data_blocks + parity_blocks
+        self._parity_rows: Optional[Tuple[Tuple[int, ...], ...]] = None
 
     @classmethod
     def new(cls, data_blocks: int, parity_blocks: int):
@@ -28,27 +217,34 @@ class ErasureCode:
 
     def encode(self, data: bytes) -> bytes:
         shard_size = math.ceil(len(data) / self.data_blocks)
-        padded_data = data.ljust(self.data_blocks * shard_size, b'\x00')
-        nsym = self.parity_blocks * shard_size
-        rsc = RSCodec(nsym)
-        encoded = rsc.encode(padded_data)
-        expected_len = self.total_shards * shard_size
-        if len(encoded) < expected_len:
-            encoded = encoded.ljust(expected_len, b'\x00')
-        return encoded
+        padded_data = bytes(data).ljust(self.data_blocks * shard_size, b'\x00')
+        if shard_size == 0:
+            return b""
+        shards = np.frombuffer(padded_data, dtype=np.uint8).reshape(self.data_blocks, shard_size)
+        # join reads the parity array through the buffer protocol, skipping a tobytes() copy
+        return b"".join((padded_data, self._parity(shards, shard_size)))
 
     def extract_data(self, encoded: bytes, original_data_size: int, erase_pos=None) -> bytes:
+        """Recovers the data from the encoded shards.
+
+        Shards touched by ``erase_pos`` are treated as lost and rebuilt from the
+        rest. Without erasures the parity is checked instead, and a mismatch is
+        reported as a decoding error since corruption cannot be located.
+        """
         shard_size = len(encoded) // self.total_shards
-        nsym = self.parity_blocks * shard_size
-        rsc = RSCodec(nsym)
-        try:
-            if erase_pos is not None:
-                decoded, _, _ = rsc.decode(encoded, erase_pos=erase_pos)
-            else:
-                decoded, _, _ = rsc.decode(encoded)
-            return decoded[:original_data_size]
-        except ReedSolomonError as e:
-            raise ValueError("Decoding error: " + str(e))
+        # Shards are zero-copy views into ``encoded``
+        view = memoryview(encoded)
+        blocks: List[Optional[memoryview]] = [view[i * shard_size:(i + 1) * shard_size] for i in range(self.total_shards)]
+        if erase_pos:
+            for shard in {pos // shard_size for pos in erase_pos}:
+                if shard < self.total_shards:
+                    blocks[shard] = None
+        elif shard_size:
+            shards = np.frombuffer(encoded, dtype=np.uint8, count=self.total_shards * shard_size)
+            shards = shards.reshape(self.total_shards, shard_size)
+            if not np.array_equal(self._parity(shards[:self.data_blocks], shard_size), shards[self.data_blocks:]):
+                raise ValueError("Decoding error: parity does not match data")
+        return self._reconstruct(blocks, shard_size, original_data_size)
 
     def extract_data_blocks(self, blocks, original_data_size: int) -> bytes:
         if not blocks:
@@ -62,11 +258,39 @@ class ErasureCode:
             raise ValueError("All blocks are missing")
         if len(blocks) != self.total_shards:
             raise ValueError(f"Expected {self.total_shards} blocks, got {len(blocks)}")
-        erase_pos = []
-        for i, block in enumerate(blocks):
-            if block is None:
-                start = i * shard_size
-                erase_pos.extend(range(start, start + shard_size))
-        fixed_blocks = [block if block is not None else b'\x00' * shard_size for block in blocks]
-        encoded = b"".join(fixed_blocks)
-        return self.extract_data(encoded, original_data_size, erase_pos=erase_pos)
+        return self._reconstruct(blocks, shard_size, original_data_size)
+
+    def _parity(self, data_shards: np.ndarray, shard_size: int) -> np.ndarray:
+        # The generator's parity rows are looked up once per instance, on first use
+        rows = self._parity_rows
+        if rows is None:
+            rows = self._parity_rows = _encoding_matrix(self.data_blocks, self.total_shards)[self.data_blocks:]
+        parity = np.empty((self.parity_blocks, shard_size), dtype=np.uint8)
+        _combine_rows(rows, data_shards, parity)
+        return parity
+
+    def _reconstruct(self, blocks: Sequence[Optional[bytes]], shard_size: int, original_data_size: int) -> bytes:
+        present = [i for i, block in enumerate(blocks) if block is not None]
+        if len(present) < self.data_blocks:
+            raise ValueError(f"Decoding error: need {self.data_blocks} shards, got {len(present)}")
+        if shard_size == 0 or original_data_size <= 0:
+            return b""
+
+        # Only the data shards overlapping the original size are rebuilt and
+        # joined; trailing shards that hold nothing but padding are skipped.
+        needed = min(self.data_blocks, -(-original_data_size // shard_size))
+        data_rows = list(blocks[:needed])
+        missing = [i for i, block in enumerate(data_rows) if block is None]
+        if missing:
+            rows = tuple(present[:self.data_blocks])
+            inputs = [np.frombuffer(blocks[r], dtype=np.uint8) for r in rows]
+            decode = _decoding_matrix(self.data_blocks, self.total_shards, rows)
+            rebuilt = np.empty((len(missing), shard_size), dtype=np.uint8)
+            _combine_rows([decode[i] for i in missing], inputs, rebuilt)
+            for out, i in zip(rebuilt, missing):
+                data_rows[i] = out
+
+        tail = original_data_size - (needed - 1) * shard_size
+        if tail < shard_size:
+            data_rows[-1] = memoryview(data_rows[-1])[:tail]
+        return b"".join(data_rows)
@@ -13,6 +13,7 @@ from private.spclient.spclient import SPClient
 from .sdk_ipc import IPC
 from .sdk_streaming import StreamingAPI
 from .erasure_code import ErasureCode
+from .connection import CHANNEL_FANOUT, ConnectionPool
 from .config import Config, SDKConfig, SDKError, BLOCK_SIZE, MIN_BUCKET_NAME_LENGTH
 from private.encryption import derive_key
 from .shared.grpc_base import GrpcClientBase
@@ -102,15 +103,10 @@ class WithRetry:
         if not needs_retry or self.max_attempts == 0:
             return err
 
-        def sleep_duration(attempt: int, base: float) -> float:
-            backoff = base * (2 ** attempt)
-            jitter = random.uniform(0, base)
-            return backoff + jitter
-
         for attempt in range(self.max_attempts):
-            delay = sleep_duration(attempt, self.base_delay)
+            delay = self._sleep_duration(attempt)
             
-            logging.debug(f"retrying attempt {attempt}, delay {delay}s, err: {err}")
+            logging.debug("retrying attempt %d, delay %ss, err: %s", attempt, delay, err)
             
             time.sleep(delay)
             
@@ -122,6 +118,11 @@ class WithRetry:
         
         return Exception(f"max retries exceeded: {err}")
 
+    def _sleep_duration(self, attempt: int) -> float:
+        backoff = self.base_delay * (2 ** attempt)
+        jitter = random.uniform(0, self.base_delay)
+        return backoff + jitter
+
 class SDKOption:
     def apply(self, sdk: 'SDK'):
         pass
@@ -175,6 +176,7 @@ class SDK():
         self.ipc_conn = None
         self.ipc_client = None
         self.sp_client = None
+        self.block_pool = None
         self.streaming_erasure_code = None
         self.config = config
         self._grpc_base = GrpcClientBase(self.config.connection_timeout)
@@ -206,6 +208,7 @@ class SDK():
             self.streaming_erasure_code = ErasureCode(self.config.streaming_max_blocks_in_chunk - self.config.parity_blocks_count, self.config.parity_blocks_count)
 
         self.sp_client = SPClient()
+        self.block_pool = ConnectionPool(fanout=CHANNEL_FANOUT)
 
     def _fetch_contract_info(self) -> Optional[dict]:
         """Dynamically fetch contract information using multiple endpoints"""
@@ -241,18 +244,25 @@ class SDK():
         return None
 
     def close(self):
-        """Close the gRPC channels."""
+        """Close the gRPC channels, the block transfer pool and the storage provider client."""
         if self.conn:
             self.conn.close()
         if self.ipc_conn and self.ipc_conn != self.conn:
             self.ipc_conn.close()
+        if self.block_pool:
+            err = self.block_pool.close()
+            if err:
+                logging.warning(f"failed to close connection pool: {err}")
+        if self.sp_client:
+            self.sp_client.close()
 
     def streaming_api(self):
         """Returns SDK streaming API."""
         return StreamingAPI(
             conn=self.conn,
             client=nodeapi_pb2_grpc.StreamAPIStub(self.conn),
-            config=self.config
+            config=self.config,
+            block_pool=self.block_pool
         )
 
     def ipc(self):
@@ -299,7 +309,8 @@ class SDK():
                 client=self.ipc_client,
                 conn=self.ipc_conn,  # Use the IPC connection
                 ipc_instance=ipc_instance,
-                config=self.config
+                config=self.config,
+                block_pool=self.block_pool
             )
         except Exception as e:
             raise SDKError(f"Failed to initialize IPC API: {str(e)}")
@@ -16,7 +16,7 @@ import grpc
 from .config import MIN_BUCKET_NAME_LENGTH, SDKError, SDKConfig, BLOCK_SIZE, ENCRYPTION_OVERHEAD
 from .erasure_code import ErasureCode
 from .dag import DAGRoot, build_dag, extract_block_data
-from .connection import ConnectionPool
+from .connection import CHANNEL_FANOUT, ConnectionPool
 from .model import (
     IPCBucketCreateResult, IPCBucket, IPCFileMeta, IPCFileListItem,
     IPCFileMetaV2, IPCFileChunkUploadV2, AkaveBlockData, FileBlockUpload,
@@ -131,10 +131,12 @@ def to_ipc_proto_chunk(chunk_cid, index: int, size: int, blocks):
     return cids, sizes, proto_chunk, None
 
 class IPC:
-    def __init__(self, client, conn, ipc_instance, config: SDKConfig):
+    def __init__(self, client, conn, ipc_instance, config: SDKConfig, block_pool: Optional[ConnectionPool] = None):
         self.client = client
         self.conn = conn
         self.ipc = ipc_instance
+        # Shared across chunks so node connections are dialed once, not per chunk.
+        self.block_pool = block_pool if block_pool is not None else ConnectionPool(fanout=CHANNEL_FANOUT)
         self.max_concurrency = config.max_concurrency
         self.block_part_size = config.block_part_size
         self.use_connection_pool = config.use_connection_pool
@@ -154,7 +156,7 @@ class IPC:
             tx = self.ipc.storage.create_bucket(
                 bucket_name=name,
                 from_address=self.ipc.auth.address,
-                private_key=self.ipc.auth.key,
+                private_key=self.ipc.signer,
                 gas_limit=500000,
                 nonce_manager=None
             )
@@ -286,7 +288,7 @@ class IPC:
                 tx_hash = self.ipc.storage.delete_bucket(
                     bucket_name=name,
                     from_address=self.ipc.auth.address,
-                    private_key=self.ipc.auth.key,
+                    private_key=self.ipc.signer,
                     bucket_id_hex=bucket_id_hex  # bucket ID from IPC response
                 )
                 logging.info(f"IPC delete_bucket transaction sent for '{name}', tx_hash: {tx_hash}")
@@ -511,7 +513,7 @@ class IPC:
                 try:
                     tx_hash = self.ipc.storage.create_file(
                         self.ipc.auth.address, 
-                        self.ipc.auth.key,
+                        self.ipc.signer,
                         bucket_id,
                         encrypted_file_name,
                         nonce_manager=None
@@ -652,7 +654,7 @@ class IPC:
                 for attempt in range(max_retries):
                     try:
                         tx_hash = self.ipc.storage.add_file_chunk(
-                            self.ipc.auth.address, self.ipc.auth.key,
+                            self.ipc.auth.address, self.ipc.signer,
                             self._convert_cid_to_bytes(chunk_upload.chunk_cid),
                             bucket_id, encrypted_file_name, chunk_upload.encoded_size,
                             cids, sizes, chunk_upload.index, nonce_manager=None)
@@ -722,7 +724,7 @@ class IPC:
                 file_upload.state.encoded_file_size,
                 file_upload.state.actual_file_size,
                 root_cid_bytes,
-                self.ipc.auth.address, self.ipc.auth.key)
+                self.ipc.auth.address, self.ipc.signer)
 
             if hasattr(self.ipc, 'wait_for_tx') and tx_hash:
                 self.ipc.wait_for_tx(tx_hash)
@@ -847,51 +849,44 @@ class IPC:
 
     def upload_chunk(self, ctx, file_chunk_upload: IPCFileChunkUploadV2) -> None:
         try:
-            pool = ConnectionPool()
+            pool = self.block_pool
             
-            try:
-                chunk_cid_str = file_chunk_upload.chunk_cid
-                if hasattr(file_chunk_upload.chunk_cid, 'string'):
-                    chunk_cid_str = file_chunk_upload.chunk_cid.string()
-                elif hasattr(file_chunk_upload.chunk_cid, 'toString'):
-                    chunk_cid_str = file_chunk_upload.chunk_cid.toString()
-                elif not isinstance(file_chunk_upload.chunk_cid, str):
-                    chunk_cid_str = str(file_chunk_upload.chunk_cid)
+            chunk_cid_str = file_chunk_upload.chunk_cid
+            if hasattr(file_chunk_upload.chunk_cid, 'string'):
+                chunk_cid_str = file_chunk_upload.chunk_cid.string()
+            elif hasattr(file_chunk_upload.chunk_cid, 'toString'):
+                chunk_cid_str = file_chunk_upload.chunk_cid.toString()
+            elif not isinstance(file_chunk_upload.chunk_cid, str):
+                chunk_cid_str = str(file_chunk_upload.chunk_cid)
+            
+            cids, sizes, proto_chunk, err = to_ipc_proto_chunk(
+                chunk_cid_str,
+                file_chunk_upload.index,
+                file_chunk_upload.actual_size,
+                file_chunk_upload.blocks
+            )
+            if err:
+                raise err
+            
+            # Upload all blocks in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {}
                 
-                cids, sizes, proto_chunk, err = to_ipc_proto_chunk(
-                    chunk_cid_str,
-                    file_chunk_upload.index,
-                    file_chunk_upload.actual_size,
-                    file_chunk_upload.blocks
-                )
-                if err:
-                    raise err
+                for i, block in enumerate(file_chunk_upload.blocks):
+                    future = executor.submit(
+                        self._upload_block,
+                        ctx, pool, i, block, proto_chunk, 
+                        file_chunk_upload.bucket_id, file_chunk_upload.file_name
+                    )
+                    futures[future] = i
                 
-                # Upload all blocks in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
-                    futures = {}
-                    
-                    for i, block in enumerate(file_chunk_upload.blocks):
-                        future = executor.submit(
-                            self._upload_block,
-                            ctx, pool, i, block, proto_chunk, 
-                            file_chunk_upload.bucket_id, file_chunk_upload.file_name
-                        )
-                        futures[future] = i
-                    
-                    for future in concurrent.futures.as_completed(futures):
-                        try:
-                            future.result()  
-                        except Exception as e:
-                            for f in futures:
-                                f.cancel()
-                            raise e
-                            
-            finally:
-                try:
-                    pool.close()
-                except Exception as e:
-                    logging.warning(f"Error closing connection pool: {str(e)}")
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()  
+                    except Exception as e:
+                        for f in futures:
+                            f.cancel()
+                        raise e
             
         except Exception as err:
             raise SDKError(f"failed to upload chunk: {str(err)}")
@@ -1066,13 +1061,7 @@ class IPC:
                 "bucketId": bytes(bucket_id) if len(bucket_id) == 32 else bytes(bucket_id) + b'\x00' * (32 - len(bucket_id))
             }
             
-            if isinstance(self.ipc.auth.key, bytes):
-                private_key_bytes = self.ipc.auth.key
-            else:
-                key_str = str(self.ipc.auth.key).replace('0x', '')
-                private_key_bytes = bytes.fromhex(key_str)
-            
-            signature_bytes = sign(private_key_bytes, domain, data_message, data_types)
+            signature_bytes = sign(self.ipc.signer, domain, data_message, data_types)
             signature_hex = signature_bytes.hex()
             
             return signature_hex, nonce_bytes
@@ -1336,43 +1325,38 @@ class IPC:
     def download_chunk_blocks(self, ctx, bucket_name: str, file_name: str, address: str, 
                              chunk_download, file_encryption_key: bytes, writer: io.IOBase):
         try:
-            pool = ConnectionPool()
+            pool = self.block_pool
             
-            try:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
-                    futures = {}
-                    
-                    for i, block in enumerate(chunk_download.blocks):
-                        futures[executor.submit(
-                            self.fetch_block_data,
-                            ctx, pool, chunk_download.cid, bucket_name, file_name, 
-                            address, chunk_download.index, i, block
-                        )] = i
-                    
-                    blocks = [None] * len(chunk_download.blocks)
-                    for future in concurrent.futures.as_completed(futures):
-                        index = futures[future]
-                        try:
-                            data = future.result()
-                            from .dag import extract_block_data
-                            blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
-                        except Exception as e:
-                            raise SDKError(f"failed to download block: {str(e)}")
-                
-                if self.erasure_code:
-                    data = self.erasure_code.extract_data_blocks(blocks, int(chunk_download.size))
-                else:
-                    data = b"".join([b for b in blocks if b is not None])
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {}
                 
-                if file_encryption_key:
-                    from private.encryption import decrypt
-                    data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
+                for i, block in enumerate(chunk_download.blocks):
+                    futures[executor.submit(
+                        self.fetch_block_data,
+                        ctx, pool, chunk_download.cid, bucket_name, file_name, 
+                        address, chunk_download.index, i, block
+                    )] = i
                 
-                writer.write(data)
-            finally:
-                err = pool.close()
-                if err:
-                    logging.warning(f"Error closing connection pool: {str(err)}")
+                blocks = [None] * len(chunk_download.blocks)
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
+                    try:
+                        data = future.result()
+                        from .dag import extract_block_data
+                        blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
+                    except Exception as e:
+                        raise SDKError(f"failed to download block: {str(e)}")
+            
+            if self.erasure_code:
+                data = self.erasure_code.extract_data_blocks(blocks, int(chunk_download.size))
+            else:
+                data = b"".join([b for b in blocks if b is not None])
+            
+            if file_encryption_key:
+                from private.encryption import decrypt
+                data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
+            
+            writer.write(data)
             
             return None
         except Exception as err:
@@ -14,7 +14,7 @@ import grpc
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from .config import SDKError, SDKConfig, BlockSize, EncryptionOverhead
-from .connection import ConnectionPool
+from .connection import CHANNEL_FANOUT, ConnectionPool
 from .model import (
     FileMeta, FileListItem, Chunk, FileUpload, FileDownload, FileBlockUpload, 
     FileChunkUpload, AkaveBlockData, FilecoinBlockData, FileBlockDownload, FileChunkDownload,
@@ -84,12 +84,15 @@ class StreamingAPI:
         self, 
         conn: grpc.Channel, 
         client: Any,
-        config: SDKConfig
+        config: SDKConfig,
+        block_pool: Optional[ConnectionPool] = None
     ) -> None:
         
         self.client = client
         self.conn = conn
         self.sp_client: SPClient = SPClient()
+        # Shared across chunks so node connections are dialed once, not per chunk.
+        self.block_pool = block_pool if block_pool is not None else ConnectionPool(fanout=CHANNEL_FANOUT)
         self.erasure_code = config.erasure_code
         self.max_concurrency = config.max_concurrency
         self.block_part_size = config.block_part_size
@@ -471,40 +474,30 @@ class StreamingAPI:
     
     def _upload_chunk(self, ctx: Any, file_chunk_upload: FileChunkUpload) -> None:
         try:
-            pool = ConnectionPool()
+            pool = self.block_pool
             
-            try:
-                # Convert to protobuf chunk format for sending
-                proto_chunk = to_proto_chunk(
-                    file_chunk_upload.stream_id,
-                    file_chunk_upload.chunk_cid.string() if hasattr(file_chunk_upload.chunk_cid, 'string') else str(file_chunk_upload.chunk_cid),
-                    file_chunk_upload.index,
-                    file_chunk_upload.encoded_size,  # Use encoded_size instead of actual_size
-                    file_chunk_upload.blocks
-                )
-                
-                # Upload blocks in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
-                    futures = []
+            # Convert to protobuf chunk format for sending
+            proto_chunk = to_proto_chunk(
+                file_chunk_upload.stream_id,
+                file_chunk_upload.chunk_cid.string() if hasattr(file_chunk_upload.chunk_cid, 'string') else str(file_chunk_upload.chunk_cid),
+                file_chunk_upload.index,
+                file_chunk_upload.encoded_size,  # Use encoded_size instead of actual_size
+                file_chunk_upload.blocks
+            )
+            
+            # Upload blocks in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = []
 
-                    for i, block in enumerate(file_chunk_upload.blocks):
-                        futures.append(executor.submit(
-                            self._upload_block,
-                            ctx, pool, i, block, proto_chunk
-                        ))
-                    
-                    # Wait for all futures to complete and raise any errors
-                    for future in concurrent.futures.as_completed(futures):
-                        future.result()
-                        
-            finally:
-                # Close the connection pool
-                try:
-                    err = pool.close()
-                    if err:
-                        logging.warning(f"failed to close connection pool: {err}")
-                except Exception as e:
-                    logging.warning(f"failed to close connection pool: {e}")
+                for i, block in enumerate(file_chunk_upload.blocks):
+                    futures.append(executor.submit(
+                        self._upload_block,
+                        ctx, pool, i, block, proto_chunk
+                    ))
+                
+                # Wait for all futures to complete and raise any errors
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
             
             return None
         except Exception as err:
@@ -668,56 +661,45 @@ class StreamingAPI:
     
     def _download_chunk_blocks(self, ctx: Any, stream_id: str, chunk_download: FileChunkDownload, file_encryption_key: bytes, writer: BinaryIO) -> None:
         try:
-            # Create a connection pool
-            pool = ConnectionPool()
+            pool = self.block_pool
             
-            try:
-                # Download blocks in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
-                    futures = {}
-                    
-                    # Submit download tasks for each block
-                    for i, block in enumerate(chunk_download.blocks):
-                        futures[executor.submit(
-                            self._fetch_block_data,
-                            ctx, pool, stream_id, chunk_download.cid,
-                            chunk_download.index, i, block
-                        )] = i
-                    
-                    # Collect results and organize them by position
-                    blocks: List[Optional[bytes]] = [None] * len(chunk_download.blocks)
-                    for future in concurrent.futures.as_completed(futures):
-                        index = futures[future]
-                        try:
-                            # Extract data from the block
-                            data = future.result()
-                            blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
-                        except Exception as e:
-                            raise SDKError(f"failed to download block: {str(e)}")
+            # Download blocks in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {}
                 
-                # Combine blocks based on whether erasure coding is used
-                if self.erasure_code is not None:
-                    # Use erasure coding to extract data
-                    data = self.erasure_code.extract_data(blocks, int(chunk_download.size)) # type: ignore[arg-type]
-                else:
-                    # Simple concatenation of blocks
-                    data = b"".join([b for b in blocks if b is not None])
+                # Submit download tasks for each block
+                for i, block in enumerate(chunk_download.blocks):
+                    futures[executor.submit(
+                        self._fetch_block_data,
+                        ctx, pool, stream_id, chunk_download.cid,
+                        chunk_download.index, i, block
+                    )] = i
                 
-                # Decrypt the data if an encryption key is provided
-                if file_encryption_key:
-                    data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
+                # Collect results and organize them by position
+                blocks: List[Optional[bytes]] = [None] * len(chunk_download.blocks)
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
+                    try:
+                        # Extract data from the block
+                        data = future.result()
+                        blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
+                    except Exception as e:
+                        raise SDKError(f"failed to download block: {str(e)}")
+            
+            # Combine blocks based on whether erasure coding is used
+            if self.erasure_code is not None:
+                # Use erasure coding to extract data
+                data = self.erasure_code.extract_data(blocks, int(chunk_download.size)) # type: ignore[arg-type]
+            else:
+                # Simple concatenation of blocks
+                data = b"".join([b for b in blocks if b is not None])
+            
+            # Decrypt the data if an encryption key is provided
+            if file_encryption_key:
+                data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
 
-                # Write the data
-                writer.write(data)
-                
-            finally:
-                # Close the connection pool
-                try:
-                    err = pool.close()
-                    if err:
-                        logging.warning(f"failed to close connection pool: {err}")
-                except Exception as e:
-                    logging.warning(f"failed to close connection pool: {e}")
+            # Write the data
+            writer.write(data)
             
             return None
         except Exception as err:
@@ -725,66 +707,55 @@ class StreamingAPI:
     
     def _download_random_chunk_blocks(self, ctx, stream_id, chunk_download, file_encryption_key, writer):
         try:
-            # Create a connection pool
-            pool = ConnectionPool()
+            pool = self.block_pool
             
-            try:
-                # Download blocks in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
-                    futures = {}
-                    
-                    # Create a map of all blocks
-                    blocks_map = {i: block for i, block in enumerate(chunk_download.Blocks)}
-                    
-                    # Get the block indexes and randomize them
-                    block_indexes = list(blocks_map.keys())
-                    random.shuffle(block_indexes)
-                    
-                    # Take only the necessary number of blocks (data blocks for erasure coding)
-                    for i in block_indexes[:self.erasure_code.data_blocks]:
-                        del blocks_map[i]
-                    
-                    # Submit download tasks for each selected block
-                    for index, block in blocks_map.items():
-                        futures[executor.submit(
-                            self._fetch_block_data,
-                            ctx, pool, stream_id, chunk_download.cid,
-                            chunk_download.index, index, block
-                        )] = index
-                    
-                    # Collect results and organize them by position
-                    blocks: List[Optional[bytes]] = [None] * len(chunk_download.blocks)
-                    for future in concurrent.futures.as_completed(futures):
-                        index = futures[future]
-                        try:
-                            # Extract data from the block
-                            data = future.result()
-                            blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
-                        except Exception as e:
-                            raise SDKError(f"failed to download block: {str(e)}")
+            # Download blocks in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {}
                 
-                if self.erasure_code is not None:
-                    # Use erasure coding to extract data
-                    data = self.erasure_code.extract_data(blocks, int(chunk_download.size)) # type: ignore[arg-type]
-                else:
-                    # Simple concatenation of blocks
-                    data = b"".join([b for b in blocks if b is not None])
-
-                # Decrypt the data if an encryption key is provided
-                if file_encryption_key:
-                    data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
+                # Create a map of all blocks
+                blocks_map = {i: block for i, block in enumerate(chunk_download.Blocks)}
                 
-                # Write the data
-                writer.write(data)
+                # Get the block indexes and randomize them
+                block_indexes = list(blocks_map.keys())
+                random.shuffle(block_indexes)
                 
-            finally:
-                # Close the connection pool
-                try:
-                    err = pool.close()
-                    if err:
-                        logging.warning(f"failed to close connection pool: {err}")
-                except Exception as e:
-                    logging.warning(f"failed to close connection pool: {e}")
+                # Take only the necessary number of blocks (data blocks for erasure coding)
+                for i in block_indexes[:self.erasure_code.data_blocks]:
+                    del blocks_map[i]
+                
+                # Submit download tasks for each selected block
+                for index, block in blocks_map.items():
+                    futures[executor.submit(
+                        self._fetch_block_data,
+                        ctx, pool, stream_id, chunk_download.cid,
+                        chunk_download.index, index, block
+                    )] = index
+                
+                # Collect results and organize them by position
+                blocks: List[Optional[bytes]] = [None] * len(chunk_download.blocks)
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
+                    try:
+                        # Extract data from the block
+                        data = future.result()
+                        blocks[index] = extract_block_data(chunk_download.blocks[index].cid, data)
+                    except Exception as e:
+                        raise SDKError(f"failed to download block: {str(e)}")
+            
+            if self.erasure_code is not None:
+                # Use erasure coding to extract data
+                data = self.erasure_code.extract_data(blocks, int(chunk_download.size)) # type: ignore[arg-type]
+            else:
+                # Simple concatenation of blocks
+                data = b"".join([b for b in blocks if b is not None])
+
+            # Decrypt the data if an encryption key is provided
+            if file_encryption_key:
+                data = decrypt(file_encryption_key, data, str(chunk_download.index).encode())
+            
+            # Write the data
+            writer.write(data)
             
             return None
         except Exception as err:
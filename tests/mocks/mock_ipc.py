@@ -7,6 +7,7 @@ class MockIPCClient:
         self.auth = Mock()
         self.auth.address = "0x1234567890123456789012345678901234567890"
         self.auth.key = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+        self.signer = self.auth.key
         
         self.storage = MockStorageContract()
         self.access_manager = Mock()
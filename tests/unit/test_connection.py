@@ -2,8 +2,9 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import grpc
 import threading
+import itertools
 
-from sdk.connection import ConnectionPool, new_connection_pool
+from sdk.connection import _GRPC_OPTS, ConnectionPool, new_connection_pool
 from sdk.config import SDKError
 
 
@@ -11,13 +12,13 @@ class TestConnectionPoolInit:
     
     def test_init(self):
         pool = ConnectionPool()
-        assert pool._connections == {}
+        assert pool._pools == {}
         assert isinstance(pool._lock, type(threading.RLock()))
     
     def test_new_connection_pool(self):
         pool = new_connection_pool()
         assert isinstance(pool, ConnectionPool)
-        assert pool._connections == {}
+        assert pool._pools == {}
 
 
 class TestCreateIPCClient:
@@ -56,7 +57,7 @@ class TestCreateIPCClient:
         assert stub is not None
         assert closer is not None
         assert err is None
-        mock_channel.assert_called_once_with("test:5500")
+        mock_channel.assert_called_once_with("test:5500", options=_GRPC_OPTS)
     
     @patch('grpc.insecure_channel')
     def test_create_ipc_client_exception(self, mock_channel):
@@ -107,7 +108,7 @@ class TestCreateStreamingClient:
         assert stub is not None
         assert closer is not None
         assert err is None
-        mock_channel.assert_called_once_with("test:5500")
+        mock_channel.assert_called_once_with("test:5500", options=_GRPC_OPTS)
     
     @patch('grpc.insecure_channel')
     def test_create_streaming_client_exception(self, mock_channel):
@@ -139,13 +140,13 @@ class TestGet:
         
         assert conn == mock_conn
         assert err is None
-        assert "test:5500" in pool._connections
-        mock_channel.assert_called_once_with("test:5500")
+        assert "test:5500" in pool._pools
+        mock_channel.assert_called_once_with("test:5500", options=_GRPC_OPTS)
     
     def test_get_existing_connection(self):
         pool = ConnectionPool()
         mock_conn = Mock()
-        pool._connections["test:5500"] = mock_conn
+        pool._pools["test:5500"] = ([mock_conn], itertools.count(1))
         
         conn, err = pool._get("test:5500")
         
@@ -154,20 +155,19 @@ class TestGet:
     
     @patch('grpc.insecure_channel')
     @patch('grpc.channel_ready_future')
-    def test_get_connection_timeout(self, mock_ready_future, mock_channel):
+    def test_get_does_not_wait_for_ready(self, mock_ready_future, mock_channel):
         pool = ConnectionPool()
         mock_conn = Mock()
         mock_channel.return_value = mock_conn
         
-        mock_future = Mock()
-        mock_future.result = Mock(side_effect=grpc.FutureTimeoutError())
-        mock_ready_future.return_value = mock_future
-        
         conn, err = pool._get("test:5500")
         
         assert conn == mock_conn
         assert err is None
-        assert "test:5500" in pool._connections
+        assert "test:5500" in pool._pools
+        mock_ready_future.assert_not_called()
+        mock_conn.subscribe.assert_called_once()
+        assert mock_conn.subscribe.call_args[1] == {'try_to_connect': True}
     
     @patch('grpc.insecure_channel')
     def test_get_connection_error(self, mock_channel):
@@ -203,8 +203,57 @@ class TestGet:
         for t in threads:
             t.join()
         
-        assert len(pool._connections) == 1
+        assert len(pool._pools) == 1
         assert all(conn == mock_conn for conn, _ in results)
+    
+    @patch('grpc.insecure_channel')
+    def test_get_concurrent_dial_keeps_one(self, mock_channel):
+        pool = ConnectionPool()
+        dialed = []
+        
+        def dial(addr, options=None):
+            import time
+            time.sleep(0.01)
+            conn = Mock()
+            dialed.append(conn)
+            return conn
+        
+        mock_channel.side_effect = dial
+        results = []
+        
+        threads = [threading.Thread(target=lambda: results.append(pool._get("test:5500")[0])) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        kept = pool._pools["test:5500"][0][0]
+        assert all(conn is kept for conn in results)
+        for conn in dialed:
+            if conn is kept:
+                conn.close.assert_not_called()
+            else:
+                conn.close.assert_called_once()
+    
+    @patch('grpc.insecure_channel')
+    @patch('grpc.channel_ready_future')
+    def test_get_fanout_round_robin(self, mock_ready_future, mock_channel):
+        pool = ConnectionPool(fanout=4)
+        conns = [Mock() for _ in range(4)]
+        mock_channel.side_effect = conns
+        mock_ready_future.return_value = Mock()
+        
+        got = [pool._get("test:5500")[0] for _ in range(8)]
+        
+        assert got == conns + conns
+        assert mock_channel.call_count == 4
+        options = mock_channel.call_args[1]['options']
+        assert ('grpc.use_local_subchannel_pool', 1) in options
+        
+        assert pool.close() is None
+        for conn in conns:
+            conn.close.assert_called_once()
+        assert pool._pools == {}
 
 
 class TestClose:
@@ -215,18 +264,18 @@ class TestClose:
         err = pool.close()
         
         assert err is None
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
     
     def test_close_single_connection(self):
         pool = ConnectionPool()
         mock_conn = Mock()
         mock_conn.close = Mock()
-        pool._connections["addr1"] = mock_conn
+        pool._pools["addr1"] = ([mock_conn], itertools.count(1))
         
         err = pool.close()
         
         assert err is None
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
         mock_conn.close.assert_called_once()
     
     def test_close_multiple_connections(self):
@@ -235,14 +284,14 @@ class TestClose:
         mock_conn2 = Mock()
         mock_conn3 = Mock()
         
-        pool._connections["addr1"] = mock_conn1
-        pool._connections["addr2"] = mock_conn2
-        pool._connections["addr3"] = mock_conn3
+        pool._pools["addr1"] = ([mock_conn1], itertools.count(1))
+        pool._pools["addr2"] = ([mock_conn2], itertools.count(1))
+        pool._pools["addr3"] = ([mock_conn3], itertools.count(1))
         
         err = pool.close()
         
         assert err is None
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
         mock_conn1.close.assert_called_once()
         mock_conn2.close.assert_called_once()
         mock_conn3.close.assert_called_once()
@@ -251,14 +300,14 @@ class TestClose:
         pool = ConnectionPool()
         mock_conn = Mock()
         mock_conn.close = Mock(side_effect=Exception("Close failed"))
-        pool._connections["addr1"] = mock_conn
+        pool._pools["addr1"] = ([mock_conn], itertools.count(1))
         
         err = pool.close()
         
         assert err is not None
         assert isinstance(err, SDKError)
         assert "encountered errors" in str(err)
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
     
     def test_close_with_partial_errors(self):
         pool = ConnectionPool()
@@ -272,15 +321,15 @@ class TestClose:
         mock_conn3 = Mock()
         mock_conn3.close = Mock()
         
-        pool._connections["addr1"] = mock_conn1
-        pool._connections["addr2"] = mock_conn2
-        pool._connections["addr3"] = mock_conn3
+        pool._pools["addr1"] = ([mock_conn1], itertools.count(1))
+        pool._pools["addr2"] = ([mock_conn2], itertools.count(1))
+        pool._pools["addr3"] = ([mock_conn3], itertools.count(1))
         
         err = pool.close()
         
         assert err is not None
         assert isinstance(err, SDKError)
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
         mock_conn1.close.assert_called_once()
         mock_conn2.close.assert_called_once()
         mock_conn3.close.assert_called_once()
@@ -318,7 +367,7 @@ class TestConnectionPoolThreadSafety:
         get_thread.join()
         close_thread.join()
         
-        assert len(pool._connections) == 0
+        assert len(pool._pools) == 0
 
 
 @pytest.mark.integration
@@ -0,0 +1,555 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import rlp
+from hexbytes import HexBytes
+from web3 import Web3
+
+from private.ipc.contracts.storage import StorageContract
+from private.ipc.contracts.contract_cache import clear_contract_cache, get_contract
+from private.ipc.contracts.tx_params import TxParamsCache, prep_tx_params
+
+
+def make_web3(batch_response):
+    web3 = Mock()
+    web3.provider.make_batch_request.return_value = batch_response
+    web3.eth.gas_price = 100
+    web3.eth.chain_id = 31337
+    web3.eth.get_transaction_count.return_value = 5
+    return web3
+
+
+class TestPrepTxParams:
+
+    def test_single_batch_round_trip(self):
+        web3 = make_web3([
+            {'id': 0, 'result': '0x3b9aca00'},
+            {'id': 1, 'result': '0x7a69'},
+            {'id': 2, 'result': '0x2a'},
+        ])
+
+        params = prep_tx_params(web3, "0xabc")
+
+        assert params == {'from': "0xabc", 'gasPrice': 10**9, 'chainId': 31337, 'nonce': 42}
+        web3.provider.make_batch_request.assert_called_once_with([
+            ('eth_gasPrice', []),
+            ('eth_chainId', []),
+            ('eth_getTransactionCount', ["0xabc", 'pending']),
+        ])
+        web3.eth.get_transaction_count.assert_not_called()
+
+    def test_nonce_manager_skips_nonce_request(self):
+        web3 = make_web3([{'id': 0, 'result': '0x1'}, {'id': 1, 'result': '0x2'}])
+        nonce_manager = Mock()
+        nonce_manager.get_nonce.return_value = 9
+
+        params = prep_tx_params(web3, "0xabc", nonce_manager)
+
+        assert params['nonce'] == 9
+        assert len(web3.provider.make_batch_request.call_args[0][0]) == 2
+
+    def test_falls_back_to_sequential_calls(self):
+        web3 = make_web3({'error': {'message': 'batch not supported'}})
+
+        params = prep_tx_params(web3, "0xabc")
+
+        assert params == {'from': "0xabc", 'gasPrice': 100, 'chainId': 31337, 'nonce': 5}
+        web3.eth.get_transaction_count.assert_called_once_with("0xabc", 'pending')
+
+
+class TestTxParamsCache:
+
+    def make_cache(self, gas_price_ttl=12.0):
+        web3 = make_web3([
+            {'id': 0, 'result': '0x64'},
+            {'id': 1, 'result': '0x7a69'},
+            {'id': 2, 'result': '0x5'},
+        ])
+        return web3, TxParamsCache(web3, gas_price_ttl=gas_price_ttl)
+
+    def test_nonce_incremented_locally(self):
+        web3, cache = self.make_cache()
+
+        nonces = [cache.prep("0xAbC")['nonce'] for _ in range(3)]
+
+        assert nonces == [5, 6, 7]
+        web3.provider.make_batch_request.assert_called_once()
+
+    def test_invalidate_nonce_refetches(self):
+        web3, cache = self.make_cache()
+        cache.prep("0xabc")
+
+        cache.invalidate_nonce("0xABC")
+        web3.provider.make_batch_request.return_value = [
+            {'id': 0, 'result': '0x64'}, {'id': 1, 'result': '0x7a69'}, {'id': 2, 'result': '0x9'},
+        ]
+
+        assert cache.prep("0xabc")['nonce'] == 9
+
+    def test_prepared_params_are_independent_copies(self):
+        web3, cache = self.make_cache()
+
+        first = cache.prep("0xabc")
+        first.update({'gas': 1, 'data': b"x"})
+        second = cache.prep("0xdef")
+
+        assert second == {'from': "0xdef", 'gasPrice': 100, 'chainId': 31337, 'nonce': 5}
+
+    def test_stale_gas_price_is_refreshed(self):
+        web3, cache = self.make_cache(gas_price_ttl=0)
+        cache.prep("0xabc")
+        web3.provider.make_batch_request.return_value = [{'id': 0, 'result': '0xc8'}]
+
+        params = cache.prep("0xabc")
+
+        assert params['gasPrice'] == 200
+        assert params['chainId'] == 31337
+        assert params['nonce'] == 6
+        assert web3.provider.make_batch_request.call_args[0][0] == [('eth_gasPrice', [])]
+
+
+class TestContractCache:
+
+    ADDRESS = "0x1234567890AbcdEF1234567890aBcdef12345678"
+    OTHER_ADDRESS = "0x0154953F6E583f09D9B38F7C4e7C6265906eC207"
+
+    def setup_method(self):
+        clear_contract_cache()
+
+    def test_reuses_contract_for_same_key(self):
+        w3 = Mock()
+        abi = [{"type": "fallback"}]
+
+        first = get_contract(w3, self.ADDRESS, abi)
+        second = get_contract(w3, self.ADDRESS.lower(), abi)
+
+        assert first is second
+        w3.eth.contract.assert_called_once_with(abi=abi)
+        w3.eth.contract.return_value.assert_called_once_with(address=self.ADDRESS)
+
+    def test_distinct_web3_address_or_abi_get_own_contract(self):
+        w3, other_w3 = Mock(), Mock()
+        abi = [{"type": "fallback"}]
+
+        get_contract(w3, self.ADDRESS, abi)
+        get_contract(w3, self.OTHER_ADDRESS, abi)
+        get_contract(w3, self.ADDRESS, list(abi))
+        get_contract(other_w3, self.ADDRESS, abi)
+
+        assert w3.eth.contract.call_count == 2
+        assert w3.eth.contract.return_value.call_count == 3
+        other_w3.eth.contract.assert_called_once()
+
+    def test_factory_cache_is_bounded(self):
+        from private.ipc.contracts import contract_cache
+
+        abi = [{"type": "fallback"}]
+        with patch.object(contract_cache, 'FACTORY_CACHE_SIZE', 2):
+            first, second, third = Mock(), Mock(), Mock()
+            for w3 in (first, second, third):
+                contract_cache.get_contract_factory(w3, abi)
+
+            assert len(contract_cache._factories) == 2
+            assert (id(first), id(abi)) not in contract_cache._factories
+
+    def test_checksum_address_is_memoized(self):
+        from private.ipc.contracts.contract_cache import checksum_address
+
+        checksum_address.cache_clear()
+        assert checksum_address(self.ADDRESS.lower()) == self.ADDRESS
+        assert checksum_address(self.ADDRESS.lower()) == self.ADDRESS
+        assert checksum_address.cache_info().hits == 1
+
+    def test_lazy_abi_parses_once_on_first_access(self):
+        from private.ipc.contracts.contract_cache import LazyABI
+
+        class Holder:
+            ABI = LazyABI('[{"type": "fallback", "stateMutability": "payable"}]')
+
+        assert Holder.__dict__["ABI"]._abi is None
+        assert Holder.ABI is Holder().ABI
+        assert Holder.ABI[0]["type"] == "fallback"
+
+    def test_frozen_abi_builds_working_contract(self):
+        from private.ipc.contracts.contract_cache import freeze_abi
+        from private.ipc.contracts.list_policy import ListPolicyMetaData
+
+        abi = freeze_abi([dict(entry) for entry in ListPolicyMetaData.ABI])
+        contract = get_contract(Web3(), "0x1234567890123456789012345678901234567890", abi)
+
+        assert isinstance(abi, tuple)
+        with pytest.raises(TypeError):
+            abi[0]["name"] = "changed"
+        assert contract.encode_abi("owner", []) == "0x8da5cb5b"
+
+
+class TestStorageAsyncSends:
+
+    PRIVATE_KEY = "0x" + "11" * 32
+    ADDRESS = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+
+    def make_storage(self):
+        storage = StorageContract(Web3(), "0x1234567890123456789012345678901234567890")
+        storage._tx_params = TxParamsCache(make_web3([
+            {'id': 0, 'result': '0x3b9aca00'},
+            {'id': 1, 'result': '0x7a69'},
+            {'id': 2, 'result': '0x4'},
+        ]))
+        return storage
+
+    def make_async_web3(self):
+        aw3 = Mock()
+        aw3.eth.send_raw_transaction = AsyncMock(side_effect=lambda raw: Web3.keccak(raw))
+        aw3.eth.wait_for_transaction_receipt = AsyncMock(return_value=Mock(status=1))
+        return aw3
+
+    def test_acreate_files_uses_consecutive_nonces(self):
+        storage = self.make_storage()
+        aw3 = self.make_async_web3()
+
+        tx_hashes = asyncio.run(storage.acreate_files(aw3, self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, ["a", "b", "c"]))
+
+        sent = [call.args[0] for call in aw3.eth.send_raw_transaction.call_args_list]
+        nonces = [int.from_bytes(rlp.decode(raw)[0], 'big') for raw in sent]
+        assert nonces == [4, 5, 6]
+        assert len(tx_hashes) == 3
+        assert aw3.eth.wait_for_transaction_receipt.await_count == 3
+
+    def test_batch_reserves_nonces_from_shared_cache(self):
+        storage = self.make_storage()
+        aw3 = self.make_async_web3()
+
+        asyncio.run(storage.acreate_files(aw3, self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, ["a", "b"]))
+
+        assert storage._prep_tx_params(self.ADDRESS)['nonce'] == 6
+        storage._tx_params.web3.provider.make_batch_request.assert_called_once()
+
+    def test_send_failure_invalidates_nonce(self):
+        storage = self.make_storage()
+        aw3 = self.make_async_web3()
+        aw3.eth.send_raw_transaction.side_effect = Exception("connection reset")
+
+        with pytest.raises(Exception, match="connection reset"):
+            asyncio.run(storage.acreate_file(aw3, self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, "a"))
+
+        assert self.ADDRESS.lower() not in storage._tx_params._nonces
+
+    def test_failed_receipt_reports_index_and_revert(self):
+        storage = self.make_storage()
+        aw3 = self.make_async_web3()
+        aw3.eth.wait_for_transaction_receipt.side_effect = [Mock(status=1), Mock(status=0, blockNumber=10)]
+
+        with patch.object(storage, '_revert_error', return_value=Exception("Transaction reverted: BucketNonexists")) as revert:
+            with pytest.raises(Exception, match="transaction 1 of 2 failed: Transaction reverted: BucketNonexists"):
+                asyncio.run(storage.acreate_files(aw3, self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, ["a", "b"]))
+
+        assert revert.call_args[0][0] == self.ADDRESS
+
+
+class TestCalldata:
+
+    def test_storage_calldata_matches_contract_encoding(self):
+        from private.ipc.contracts.storage import CREATE_FILE_SELECTOR, DELETE_BUCKET_SELECTOR
+        from private.ipc.contracts.calldata import encode_call
+
+        storage = StorageContract(Web3(), "0x1234567890123456789012345678901234567890")
+        bucket_id = b"\x01" * 32
+
+        assert encode_call(CREATE_FILE_SELECTOR, ['bytes32', 'string'], [bucket_id, "a.txt"]) == bytes.fromhex(
+            storage.contract.encode_abi("createFile", [bucket_id, "a.txt"])[2:]
+        )
+        assert encode_call(DELETE_BUCKET_SELECTOR, ['bytes32', 'string', 'uint256'], [bucket_id, "b", 3]) == bytes.fromhex(
+            storage.contract.encode_abi("deleteBucket", [bucket_id, "b", 3])[2:]
+        )
+
+    def test_chunk_calldata_matches_contract_encoding(self):
+        from private.ipc.contracts.storage import (
+            ADD_FILE_CHUNK_SELECTOR, FILL_CHUNK_BLOCKS_SELECTOR, FILL_CHUNK_BLOCK_ARGS_TYPE,
+        )
+        from private.ipc.contracts.calldata import encode_call
+
+        storage = StorageContract(Web3(), "0x1234567890123456789012345678901234567890")
+        b32 = b"\x02" * 32
+        chunk_args = [b"cid", b32, "f", 10, [b32], [5], 0]
+        block_args = [(b32, b32, b32, 1, 2, 3, "f", b"sig", 4)]
+
+        assert encode_call(
+            ADD_FILE_CHUNK_SELECTOR,
+            ['bytes', 'bytes32', 'string', 'uint256', 'bytes32[]', 'uint256[]', 'uint256'],
+            chunk_args,
+        ) == bytes.fromhex(storage.contract.encode_abi("addFileChunk", chunk_args)[2:])
+        assert encode_call(
+            FILL_CHUNK_BLOCKS_SELECTOR, [FILL_CHUNK_BLOCK_ARGS_TYPE + '[]'], [block_args]
+        ) == bytes.fromhex(storage.contract.encode_abi("fillChunkBlocks", [block_args])[2:])
+
+    def test_policy_selectors_match_abi(self):
+        from private.ipc.contracts.list_policy import ASSIGN_ROLE_SELECTOR, ListPolicyContract
+        from private.ipc.contracts.policy_factory import DEPLOY_POLICY_SELECTOR, PolicyFactoryContract
+
+        address = "0x1234567890123456789012345678901234567890"
+        policy = ListPolicyContract(Web3(), address)
+        factory = PolicyFactoryContract(Web3(), address)
+
+        assert policy.contract.encode_abi("assignRole", [address]).startswith("0x" + ASSIGN_ROLE_SELECTOR.hex())
+        assert factory.contract.encode_abi("deployPolicy", [b"x"]).startswith("0x" + DEPLOY_POLICY_SELECTOR.hex())
+
+
+class TestLazyBindings:
+
+    def test_erc1967_proxy_builds_bindings_on_first_use(self):
+        from private.ipc.contracts.erc1967_proxy import ERC1967Proxy, ERC1967ProxyCaller
+
+        proxy = ERC1967Proxy(Web3(), "0x1234567890123456789012345678901234567890")
+
+        assert "caller" not in vars(proxy)
+        assert isinstance(proxy.caller, ERC1967ProxyCaller)
+        assert proxy.caller is proxy.caller
+
+
+class TestStorageReceiptWait:
+
+    def test_wait_receipt_uses_configured_polling(self):
+        storage = StorageContract(Web3(), "0x1234567890123456789012345678901234567890", receipt_poll_latency=2.0)
+        storage.web3 = Mock()
+
+        storage._wait_receipt(b"\x01" * 32)
+
+        storage.web3.eth.wait_for_transaction_receipt.assert_called_once_with(b"\x01" * 32, timeout=120.0, poll_latency=2.0)
+
+
+class TestStorageBatchSends:
+
+    PRIVATE_KEY = "0x" + "11" * 32
+    ADDRESS = "0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A"
+
+    def make_storage(self, send_response):
+        storage = StorageContract(Web3(), "0x1234567890123456789012345678901234567890")
+        web3 = make_web3(None)
+        web3.provider.make_batch_request.side_effect = [
+            [{'id': 0, 'result': '0x64'}, {'id': 1, 'result': '0x7a69'}, {'id': 2, 'result': '0x4'}],
+            send_response,
+        ]
+        web3.eth.wait_for_transaction_receipt.return_value = Mock(status=1)
+        storage.web3 = web3
+        storage._tx_params = TxParamsCache(web3)
+        return storage, web3
+
+    def test_create_files_batch_sends_once_with_consecutive_nonces(self):
+        storage, web3 = self.make_storage([{'id': 0, 'result': '0x' + 'aa' * 32}, {'id': 1, 'result': '0x' + 'bb' * 32}])
+
+        tx_hashes = storage.create_files_batch(self.ADDRESS, self.PRIVATE_KEY, [(b"\x01" * 32, "a"), (b"\x01" * 32, "b")])
+
+        sends = web3.provider.make_batch_request.call_args[0][0]
+        nonces = [int.from_bytes(rlp.decode(bytes.fromhex(params[0][2:]))[0], 'big') for _, params in sends]
+        assert nonces == [4, 5]
+        assert tx_hashes == ['aa' * 32, 'bb' * 32]
+        assert web3.eth.wait_for_transaction_receipt.call_count == 2
+        web3.eth.send_raw_transaction.assert_not_called()
+
+    def test_send_returns_before_receipt(self):
+        storage, web3 = self.make_storage(None)
+        web3.eth.send_raw_transaction.return_value = HexBytes(b"\xaa" * 32)
+
+        tx_hash = storage.send_create_file(self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, "a")
+
+        assert tx_hash == 'aa' * 32
+        web3.eth.wait_for_transaction_receipt.assert_not_called()
+
+        web3.eth.wait_for_transaction_receipt.return_value = Mock(status=0)
+        with pytest.raises(Exception, match="Transaction failed"):
+            storage.wait_tx(tx_hash)
+
+    def test_failed_create_bucket_decodes_custom_error(self):
+        from web3.exceptions import ContractCustomError
+
+        storage, web3 = self.make_storage(None)
+        web3.eth.send_raw_transaction.return_value = HexBytes(b"\xaa" * 32)
+        web3.eth.wait_for_transaction_receipt.return_value = Mock(status=0, blockNumber=10)
+        web3.eth.call.side_effect = ContractCustomError("0x497ef2c2", data="0x497ef2c2")
+
+        with pytest.raises(Exception, match="Transaction reverted: BucketAlreadyExists"):
+            storage.create_bucket("bucket", self.ADDRESS, self.PRIVATE_KEY)
+
+        call_tx, block = web3.eth.call.call_args[0]
+        assert block == 9
+        assert call_tx['data'][:4] == Web3.keccak(text="createBucket(string)")[:4]
+
+    def test_create_files_batch_send_error_resyncs_nonce(self):
+        storage, web3 = self.make_storage([{'id': 0, 'error': {'message': 'nonce too low'}}])
+
+        with pytest.raises(Exception, match="nonce too low"):
+            storage.create_files_batch(self.ADDRESS, self.PRIVATE_KEY, [(b"\x01" * 32, "a")])
+
+        assert storage._tx_params._nonces == {}
+
+    def test_signing_error_resyncs_nonce(self):
+        storage, web3 = self.make_storage(None)
+
+        with pytest.raises(Exception):
+            storage.send_create_file(self.ADDRESS, "0xnot-a-key", b"\x01" * 32, "a")
+
+        assert storage._tx_params._nonces == {}
+        web3.eth.send_raw_transaction.assert_not_called()
+
+    def test_stale_nonce_resyncs_and_retries_once(self):
+        storage, web3 = self.make_storage([{'id': 0, 'result': '0x64'}, {'id': 1, 'result': '0x9'}])
+        web3.eth.send_raw_transaction.side_effect = [Exception("nonce too low"), HexBytes(b"\xaa" * 32)]
+
+        tx_hash = storage.send_create_file(self.ADDRESS, self.PRIVATE_KEY, b"\x01" * 32, "a")
+
+        sent = [call.args[0] for call in web3.eth.send_raw_transaction.call_args_list]
+        assert [int.from_bytes(rlp.decode(raw)[0], 'big') for raw in sent] == [4, 9]
+        assert tx_hash == HexBytes(b"\xaa" * 32).hex()
+
+    def test_receipt_timeout_resyncs_nonce(self):
+        storage, web3 = self.make_storage(None)
+        web3.eth.send_raw_transaction.return_value = HexBytes(b"\xaa" * 32)
+        web3.eth.wait_for_transaction_receipt.side_effect = TimeoutError("not mined")
+
+        with pytest.raises(TimeoutError):
+            storage.create_bucket("bucket", self.ADDRESS, self.PRIVATE_KEY)
+
+        assert storage._tx_params._nonces == {}
+
+    def test_wrappers_share_nonce_cache_per_web3(self):
+        from private.ipc.contracts.list_policy import ListPolicyContract
+        from private.ipc.contracts.tx_params import shared_tx_params
+
+        w3 = Web3()
+        storage = StorageContract(w3, "0x1234567890123456789012345678901234567890")
+        policy = ListPolicyContract(w3, "0x1234567890123456789012345678901234567891")
+
+        assert storage._tx_params is policy._tx_params is shared_tx_params(w3)
+        assert shared_tx_params(Web3()) is not storage._tx_params
+
+
+class TestPolicyTransactors:
+
+    def test_assign_role_signs_and_sends_raw_transaction(self):
+        from eth_account import Account
+        from private.ipc.contracts.list_policy import ASSIGN_ROLE_SELECTOR, ListPolicyContract
+
+        account = Account.from_key("0x" + "11" * 32)
+        policy = ListPolicyContract(Web3(), "0x1234567890123456789012345678901234567890")
+        policy.w3 = make_web3([{'id': 0, 'result': '0x1'}, {'id': 1, 'result': '0x7a69'}, {'id': 2, 'result': '0x3'}])
+        policy.w3.eth.send_raw_transaction.return_value = b"\xaa" * 32
+        policy._tx_params = TxParamsCache(policy.w3)
+
+        tx_hash = policy.assign_role(account, account.address)
+
+        raw = policy.w3.eth.send_raw_transaction.call_args[0][0]
+        fields = rlp.decode(raw)
+        assert tx_hash == "aa" * 32
+        assert int.from_bytes(fields[0], 'big') == 3
+        assert fields[5].startswith(ASSIGN_ROLE_SELECTOR)
+
+
+class TestMulticallReads:
+
+    ADDRESS = "0x1234567890123456789012345678901234567890"
+
+    def test_validate_access_many_single_eth_call(self):
+        from eth_abi import encode
+        from private.ipc.contracts.list_policy import ListPolicyContract
+
+        policy = ListPolicyContract(Web3(), self.ADDRESS)
+        policy.w3 = Mock()
+        policy.w3.eth.call.return_value = encode(
+            ['(bool,bytes)[]'], [[(True, encode(['bool'], [True])), (True, encode(['bool'], [False])), (False, b"")]]
+        )
+
+        result = policy.validate_access_many([self.ADDRESS] * 3, [b"a", b"b", b"c"])
+
+        assert result == [True, False, None]
+        policy.w3.eth.call.assert_called_once()
+
+    def test_get_files_by_name_decodes_file_structs(self):
+        from eth_abi import encode
+        from private.ipc.contracts.storage import FILE_TYPE
+
+        storage = StorageContract(Web3(), self.ADDRESS)
+        storage.web3 = Mock()
+        file_info = (b"\x01" * 32, b"cid", b"\x02" * 32, "a.txt", 10, 20, 5, ([b"c1"], [7]))
+        storage.web3.eth.call.return_value = encode(
+            ['(bool,bytes)[]'], [[(True, encode([FILE_TYPE], [file_info])), (False, b"")]]
+        )
+
+        assert storage.get_files_by_name(b"\x02" * 32, ["a.txt", "missing"]) == [file_info, None]
+
+    def test_falls_back_without_multicall(self):
+        storage = StorageContract(Web3(), self.ADDRESS)
+        storage.web3 = Mock()
+        storage.web3.eth.call.return_value = b""
+        storage.get_file_by_name = Mock(side_effect=["file", Exception("not found")])
+
+        assert storage.get_files_by_name(b"\x02" * 32, ["a", "b"]) == ["file", None]
+
+    def test_validate_access_uses_direct_eth_call(self):
+        from eth_abi import encode
+        from private.ipc.contracts.list_policy import VALIDATE_ACCESS_SELECTOR, ListPolicyContract
+
+        policy = ListPolicyContract(Web3(), self.ADDRESS)
+        policy.w3 = Mock()
+        policy.w3.eth.call.return_value = encode(['bool'], [True])
+
+        assert policy.validate_access(self.ADDRESS, b"data") is True
+        tx = policy.w3.eth.call.call_args[0][0]
+        assert tx['to'] == self.ADDRESS
+        assert tx['data'] == bytes.fromhex(policy.contract.encode_abi("validateAccess", [self.ADDRESS, b"data"])[2:])
+        assert tx['data'][:4] == VALIDATE_ACCESS_SELECTOR
+
+
+class TestSignTransaction:
+
+    PRIVATE_KEY = "0x" + "11" * 32
+
+    def make_tx(self, **overrides):
+        tx = {
+            'nonce': 5, 'gasPrice': 10**9, 'gas': 500000, 'chainId': 78964,
+            'to': "0x1234567890123456789012345678901234567890", 'value': 0, 'data': b"\x01\x02",
+        }
+        tx.update(overrides)
+        return tx
+
+    def expected(self, tx):
+        from eth_account import Account
+        from private.ipc.contracts.tx_params import get_raw_transaction
+
+        return get_raw_transaction(Account.sign_transaction(tx, self.PRIVATE_KEY))
+
+    def test_matches_eth_account_for_legacy_tx(self):
+        from private.ipc.contracts.signing import sign_transaction
+
+        for tx in (self.make_tx(), self.make_tx(nonce=0, value=7, data="0x")):
+            assert sign_transaction(tx, self.PRIVATE_KEY) == self.expected(tx)
+
+    def test_matches_without_coincurve(self):
+        from unittest.mock import patch
+        from private.ipc.contracts import signing
+
+        tx = self.make_tx()
+        with patch('private.signer.coincurve', None):
+            raw = signing.sign_transaction(tx, bytes.fromhex(self.PRIVATE_KEY[2:]))
+
+        assert raw == self.expected(tx)
+
+    def test_accepts_caller_held_signer(self):
+        from private.ipc.contracts.signing import sign_transaction
+        from private.signer import Signer
+
+        signer = Signer(self.PRIVATE_KEY)
+        legacy = self.make_tx()
+        dynamic = self.make_tx(maxFeePerGas=2 * 10**9, maxPriorityFeePerGas=10**9)
+        del dynamic['gasPrice']
+
+        assert sign_transaction(legacy, signer) == self.expected(legacy)
+        assert sign_transaction(dynamic, signer) == self.expected(dynamic)
+
+    def test_dynamic_fee_tx_uses_eth_account(self):
+        from private.ipc.contracts.signing import sign_transaction
+
+        tx = self.make_tx(maxFeePerGas=2 * 10**9, maxPriorityFeePerGas=10**9)
+        del tx['gasPrice']
+
+        assert sign_transaction(tx, self.PRIVATE_KEY) == self.expected(tx)
@@ -4,6 +4,7 @@ Unit tests for DAG (Directed Acyclic Graph) functionality.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 import io
+import base64
 import hashlib
 from dataclasses import dataclass
 
@@ -17,11 +18,15 @@ from sdk.dag import (
     bytes_to_node,
     get_node_links,
     block_by_cid,
+    index_blocks,
     _encode_varint,
+    _encode_varint_into,
     _decode_varint,
     _extract_unixfs_data_size,
     _extract_unixfs_data,
     _create_unixfs_file_node,
+    _create_unixfs_file_nodes,
+    _decode_cid,
     _create_chunk_dag_root_node,
     IPLD_AVAILABLE
 )
@@ -82,6 +87,20 @@ class TestDAGRoot:
         assert dag_root.links[0]["cid"] == mock_cid
         assert dag_root.total_file_size == 512
     
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_add_link_builds_pb_link_once(self):
+        """Test that add_link prepares the PBLink that build() reuses."""
+        dag_root = DAGRoot()
+        cid_str = "bafybeigweriqysuigpnsu3jmndgonrihee4dmx27rctlsd5mfn5arrnxyi"
+        
+        dag_root.add_link(cid_str, raw_data_size=1024, proto_node_size=1200)
+        dag_root.add_link("not-a-cid", raw_data_size=10, proto_node_size=10)
+        
+        pb_link = dag_root.links[0]["pb_link"]
+        assert str(pb_link.hash) == cid_str
+        assert pb_link.t_size == 1200
+        assert dag_root.links[1]["pb_link"] is None
+    
     def test_add_multiple_links(self):
         """Test adding multiple links."""
         dag_root = DAGRoot()
@@ -209,6 +228,13 @@ class TestVarintFunctions:
         expected = bytes([172, 2])  # 300 encoded as varint
         assert result == expected
     
+    def test_encode_varint_into_appends(self):
+        """Test that _encode_varint_into appends the same bytes as _encode_varint."""
+        for value in (0, 127, 128, 300, 16384, 2**35):
+            buf = bytearray(b"\x18")
+            _encode_varint_into(buf, value)
+            assert buf == b"\x18" + _encode_varint(value)
+    
     def test_decode_varint_small(self):
         """Test decoding small varint."""
         data = bytes([42])
@@ -230,6 +256,13 @@ class TestVarintFunctions:
         
         with pytest.raises(ValueError, match="varint too long"):
             _decode_varint(data)
+    
+    def test_decode_varint_at_offset(self):
+        """Test decoding varints of every length class from an offset."""
+        for value in (0, 127, 128, 16383, 16384, 2**35):
+            data = b"\x0a" + _encode_varint(value) + b"\xff"
+            assert _decode_varint(data, 1) == (value, len(data) - 2)
+        assert _decode_varint(b"\x0a", 1) == (0, 0)
 
 
 class TestBuildDAG:
@@ -310,23 +343,22 @@ class TestCreateUnixFSFileNode:
         assert cid.startswith("bafybeig")
         assert encoded_data == data
     
+    @patch('sdk.dag.IPLD_AVAILABLE', False)
+    def test_create_unixfs_file_node_no_ipld_cid_format(self):
+        """Test that the fallback CID is the lowercased base32 digest."""
+        data = b"test data"
+        b32_hash = base64.b32encode(hashlib.sha256(data).digest()).decode().lower().rstrip('=')
+        
+        cid, _ = _create_unixfs_file_node(data)
+        
+        assert cid == "bafybeig" + b32_hash[:50]
+    
     @patch('sdk.dag.IPLD_AVAILABLE', True)
-    @patch('sdk.dag.PBNode')
-    @patch('sdk.dag.encode')
-    @patch('sdk.dag.multihash')
     @patch('sdk.dag.CID')
-    def test_create_unixfs_file_node_with_ipld(self, mock_cid_class, mock_multihash, mock_encode, mock_pbnode):
+    def test_create_unixfs_file_node_with_ipld(self, mock_cid_class):
         """Test _create_unixfs_file_node with IPLD."""
         data = b"test data"
         
-        # Mock encoding
-        encoded_bytes = b"encoded_unixfs_data"
-        mock_encode.return_value = encoded_bytes
-        
-        # Mock multihash
-        digest = b"hash_digest"
-        mock_multihash.digest.return_value = digest
-        
         # Mock CID
         mock_cid = Mock()
         mock_cid_class.return_value = mock_cid
@@ -334,10 +366,51 @@ class TestCreateUnixFSFileNode:
         cid, encoded_data = _create_unixfs_file_node(data)
         
         assert cid == mock_cid
-        assert encoded_data == encoded_bytes
-        mock_encode.assert_called_once()
-        mock_multihash.digest.assert_called_once_with(encoded_bytes, "sha2-256")
+        # DAG-PB Data field wrapping UnixFS Type=File and Data
+        assert encoded_data == b"\x0a\x0d\x08\x02\x22\x09" + data
+        # sha2-256 multihash: code 0x12, length 0x20, digest
+        digest = mock_cid_class.call_args[0][3]
+        assert digest == b"\x12\x20" + hashlib.sha256(encoded_data).digest()
+    
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_create_unixfs_file_node_matches_dag_pb_encode(self):
+        """Test the direct leaf encoding against ipld_dag_pb."""
+        from ipld_dag_pb import PBNode, encode
+        
+        for data in (b"", b"x", b"y" * 200, b"z" * 70000):
+            unixfs_data = b"\x08\x02" + (b"\x22" + _encode_varint(len(data)) + data if data else b"")
+            _, encoded_data = _create_unixfs_file_node(memoryview(data))
+            assert encoded_data == bytes(encode(PBNode(data=unixfs_data, links=[])))
+    
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_create_unixfs_file_nodes_matches_single(self):
+        """Test batched leaf creation against one call per block."""
+        datas = [b"block one", b"block two", b"", b"x" * 3000]
+        
+        with patch('sdk.dag._HASH_WORKERS', 4):
+            batched = _create_unixfs_file_nodes(datas)
+        
+        for data, (cid, encoded) in zip(datas, batched):
+            single_cid, single_encoded = _create_unixfs_file_node(data)
+            assert str(cid) == str(single_cid)
+            assert bytes(encoded) == bytes(single_encoded)
 
+class TestDecodeCid:
+    """Test _decode_cid function."""
+    
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_decode_cid_is_memoized(self):
+        """Test that repeated decodes return the same CID object."""
+        cid_str = "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi"
+        first = _decode_cid(cid_str)
+        assert str(first) == cid_str
+        assert _decode_cid(cid_str) is first
+    
+    @patch('sdk.dag.CID')
+    def test_decode_cid_follows_cid_class(self, mock_cid_class):
+        """Test that a rebound CID class is used instead of cached results."""
+        mock_cid_class.decode.return_value = "decoded"
+        assert _decode_cid("bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi") == "decoded"
 
 class TestNodeSizes:
     """Test node_sizes function."""
@@ -393,6 +466,30 @@ class TestNodeSizes:
             
             assert raw_size == 250
             assert encoded_size == 300  # Sum of link sizes
+    
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_node_sizes_reads_encoded_leaf(self):
+        """Test node_sizes on a real leaf without decoding it."""
+        data = b"x" * 300
+        _, encoded = _create_unixfs_file_node(data)
+        
+        with patch('sdk.dag.decode') as mock_decode:
+            raw_size, encoded_size = node_sizes(encoded)
+        
+        assert raw_size == len(data)
+        assert encoded_size == len(encoded)
+        mock_decode.assert_not_called()
+    
+    @pytest.mark.skipif(not IPLD_AVAILABLE, reason="IPLD libraries not available")
+    def test_node_sizes_sums_encoded_link_sizes(self):
+        """Test node_sizes on a real node with links."""
+        from ipld_dag_pb import PBNode, PBLink, encode
+        
+        cid = _decode_cid("bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi")
+        links = [PBLink(hash=cid, name="", size=100), PBLink(hash=cid, name="b", size=200)]
+        encoded = bytes(encode(PBNode(data=b"\x08\x02\x18\xfa\x01", links=links)))
+        
+        assert node_sizes(encoded) == (250, 300)
 
 
 class TestExtractBlockData:
@@ -543,6 +640,25 @@ class TestBlockByCid:
         
         assert found is False
         assert block.cid == ""
+    
+    def test_block_by_cid_with_index(self, sample_file_blocks):
+        """Test lookups through a prebuilt index."""
+        index = index_blocks(sample_file_blocks)
+        
+        for expected in sample_file_blocks:
+            block, found = block_by_cid(sample_file_blocks, expected.cid, index)
+            assert found is True
+            assert block is expected
+        
+        block, found = block_by_cid(sample_file_blocks, "nonexistent_cid", index)
+        assert found is False
+        assert block.cid == ""
+    
+    def test_index_blocks_keeps_first_duplicate(self):
+        """Test that duplicate CIDs resolve to the first block, as in a scan."""
+        blocks = [FileBlockUpload(cid="dup", data=b"first"), FileBlockUpload(cid="dup", data=b"second")]
+        
+        assert index_blocks(blocks)["dup"].data == b"first"
 
 
 class TestExtractUnixFSData:
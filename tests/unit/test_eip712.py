@@ -0,0 +1,183 @@
+import pytest
+from unittest.mock import patch
+
+from private.eip712 import (
+    Domain, TypedData, sign, sign_batch, hash_typed_data, encode_data, encode_type, encode_value,
+    recover_signer_address, recover_signer_address_from_hash
+)
+from sdk.common import SDKError
+
+
+PRIVATE_KEY = bytes.fromhex("1234567890abcdef" * 4)
+SIGNER_ADDRESS = "0x1Be31A94361a391bBaFB2a4CCd704F57dc04d4bb"
+
+
+@pytest.fixture
+def domain():
+    return Domain("Storage", "1", 31337, "0x1234567890123456789012345678901234567890")
+
+
+@pytest.fixture
+def storage_types():
+    return {
+        "StorageData": [
+            TypedData("chunkCID", "bytes"),
+            TypedData("blockCID", "bytes32"),
+            TypedData("chunkIndex", "uint256"),
+            TypedData("blockIndex", "uint8"),
+            TypedData("nodeId", "bytes32"),
+            TypedData("nonce", "uint256"),
+            TypedData("deadline", "uint256"),
+            TypedData("bucketId", "bytes32"),
+        ]
+    }
+
+
+@pytest.fixture
+def message():
+    return {
+        "chunkCID": b"\x01\x02chunk",
+        "blockCID": b"\x11" * 32,
+        "chunkIndex": 3,
+        "blockIndex": 7,
+        "nodeId": b"\x22" * 32,
+        "nonce": 12345,
+        "deadline": 9999999,
+        "bucketId": b"\x33" * 32,
+    }
+
+
+class TestHashTypedData:
+
+    def test_matches_reference_vector(self, domain, message, storage_types):
+        # Reference digest produced by eth_account.messages.encode_typed_data
+        expected = "e70e4c2f3cdfcec63c6278692df84300a83662295e51bb6b995fd1e047a72621"
+
+        assert hash_typed_data(domain, message, storage_types).hex() == expected
+
+    def test_different_domain_changes_hash(self, domain, message, storage_types):
+        other = Domain("Storage", "1", 1, domain.verifying_contract)
+
+        assert hash_typed_data(domain, message, storage_types) != hash_typed_data(other, message, storage_types)
+
+    def test_encode_type(self, storage_types):
+        assert encode_type("StorageData", storage_types) == (
+            "StorageData(bytes chunkCID,bytes32 blockCID,uint256 chunkIndex,uint8 blockIndex,"
+            "bytes32 nodeId,uint256 nonce,uint256 deadline,bytes32 bucketId)"
+        )
+
+    def test_domain_separator_is_cached(self, domain, message, storage_types):
+        from private.eip712 import _domain_separator
+
+        _domain_separator.cache_clear()
+        first = hash_typed_data(domain, message, storage_types)
+        second = hash_typed_data(domain, message, storage_types)
+
+        assert first == second
+        assert _domain_separator.cache_info().hits == 1
+
+    def test_encode_data_unsupported_field_type(self):
+        types = {"Custom": [TypedData("amount", "int128")]}
+
+        with pytest.raises(ValueError, match="unsupported type: int128"):
+            encode_data("Custom", {"amount": 1}, types)
+
+
+class TestEncodeValue:
+
+    def test_uint8(self):
+        assert encode_value(7, "uint8") == bytes(31) + b"\x07"
+
+    def test_uint8_out_of_range(self):
+        with pytest.raises(ValueError, match="uint8 value out of range"):
+            encode_value(256, "uint8")
+
+    def test_uint64(self):
+        assert encode_value(2**40, "uint64") == (2**40).to_bytes(32, "big")
+
+    def test_uint256_negative(self):
+        with pytest.raises(ValueError, match="cannot be negative"):
+            encode_value(-1, "uint256")
+
+    def test_address_string_and_bytes(self):
+        addr = "0x1234567890123456789012345678901234567890"
+        expected = bytes(12) + bytes.fromhex(addr[2:])
+
+        assert encode_value(addr, "address") == expected
+        assert encode_value(bytes.fromhex(addr[2:]), "address") == expected
+
+    def test_address_invalid_length(self):
+        with pytest.raises(ValueError, match="invalid address length"):
+            encode_value("0x1234", "address")
+
+    def test_bytes32_wrong_length(self):
+        with pytest.raises(ValueError, match="expected 32 bytes"):
+            encode_value(b"\x00" * 31, "bytes32")
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError, match="unsupported type"):
+            encode_value(1, "int128")
+
+
+class TestSign:
+
+    def test_sign_and_recover(self, domain, message, storage_types):
+        signature = sign(PRIVATE_KEY, domain, message, storage_types)
+
+        assert len(signature) == 65
+        assert signature[64] in (27, 28)
+        assert recover_signer_address(signature, domain, message, storage_types) == SIGNER_ADDRESS
+
+    def test_recover_from_precomputed_hash(self, domain, message, storage_types):
+        signature = sign(PRIVATE_KEY, domain, message, storage_types)
+        hash_bytes = hash_typed_data(domain, message, storage_types)
+
+        assert recover_signer_address_from_hash(signature, hash_bytes) == SIGNER_ADDRESS
+
+    def test_sign_is_deterministic(self, domain, message, storage_types):
+        assert sign(PRIVATE_KEY, domain, message, storage_types) == sign(PRIVATE_KEY, domain, message, storage_types)
+
+    def test_sign_invalid_message(self, domain, message, storage_types):
+        message["blockIndex"] = 300
+
+        with pytest.raises(SDKError, match="EIP-712 signing failed"):
+            sign(PRIVATE_KEY, domain, message, storage_types)
+
+    def test_sign_batch_matches_sign(self, domain, message, storage_types):
+        second = dict(message, chunkIndex=4, nonce=54321)
+
+        signatures = sign_batch(PRIVATE_KEY, domain, [message, second], storage_types)
+
+        assert signatures == [
+            sign(PRIVATE_KEY, domain, message, storage_types),
+            sign(PRIVATE_KEY, domain, second, storage_types),
+        ]
+
+    def test_sign_batch_empty(self, domain, storage_types):
+        assert sign_batch(PRIVATE_KEY, domain, [], storage_types) == []
+
+    def test_sign_batch_invalid_message(self, domain, message, storage_types):
+        bad = dict(message, blockIndex=-1)
+
+        with pytest.raises(SDKError, match="EIP-712 signing failed"):
+            sign_batch(PRIVATE_KEY, domain, [message, bad], storage_types)
+
+    def test_sign_without_coincurve(self, domain, message, storage_types):
+        expected = sign(PRIVATE_KEY, domain, message, storage_types)
+
+        with patch('private.eip712.coincurve', None), patch('private.signer.coincurve', None):
+            signature = sign(PRIVATE_KEY, domain, message, storage_types)
+            recovered = recover_signer_address(signature, domain, message, storage_types)
+
+        assert signature == expected
+        assert recovered == SIGNER_ADDRESS
+
+    def test_sign_with_caller_held_signer(self, domain, message, storage_types):
+        from private.signer import Signer
+
+        signer = Signer(PRIVATE_KEY)
+        expected = sign(PRIVATE_KEY, domain, message, storage_types)
+
+        assert sign(signer, domain, message, storage_types) == expected
+        assert sign_batch(signer, domain, [message], storage_types) == [expected]
+        assert PRIVATE_KEY.hex() not in repr(signer)
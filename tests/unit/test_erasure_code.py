@@ -2,7 +2,13 @@ import pytest
 from unittest.mock import Mock, patch
 import math
 
-from sdk.erasure_code import ErasureCode, missing_shards_idx, split_into_blocks
+from sdk.erasure_code import (
+    ErasureCode,
+    iter_missing_shards_idx,
+    missing_shards_idx,
+    missing_shards_idx_array,
+    split_into_blocks,
+)
 
 
 class TestMissingShardsIdx:
@@ -26,6 +32,18 @@ class TestMissingShardsIdx:
         assert len(result) == 1
         assert result[0] == []
 
+    def test_missing_shards_idx_array_matches_list(self):
+        for n, k in [(5, 2), (5, 0), (8, 3)]:
+            result = missing_shards_idx_array(n, k)
+            assert result.shape == (len(missing_shards_idx(n, k)), k)
+            assert result.tolist() == missing_shards_idx(n, k)
+
+    def test_iter_missing_shards_idx_is_lazy(self):
+        result = iter_missing_shards_idx(32, 16)
+        assert not isinstance(result, list)
+        assert next(result) == list(range(16))
+        assert list(iter_missing_shards_idx(5, 2)) == missing_shards_idx(5, 2)
+
 
 class TestSplitIntoBlocks:
     
@@ -55,6 +73,11 @@ class TestSplitIntoBlocks:
         assert len(blocks) == 1
         assert blocks[0] == b"ab\x00\x00\x00"
 
+    def test_split_into_blocks_views_input(self):
+        data = b"123456789012"
+        blocks = split_into_blocks(data, 4)
+        assert all(block.obj is data for block in blocks)
+
 
 class TestErasureCodeInit:
     
@@ -245,6 +268,30 @@ class TestErasureCodeExtractDataBlocks:
         
         assert decoded == data
 
+    def test_extract_data_blocks_any_missing_combination(self):
+        ec = ErasureCode(4, 2)
+        data = bytes(range(256)) * 40
+
+        encoded = ec.encode(data)
+        shard_size = len(encoded) // 6
+        assert encoded[:len(data)] == data
+
+        for missing in missing_shards_idx(6, 2):
+            blocks = split_into_blocks(encoded, shard_size)
+            for i in missing:
+                blocks[i] = None
+            assert ec.extract_data_blocks(blocks, len(data)) == data
+
+    def test_extract_data_blocks_too_many_missing(self):
+        ec = ErasureCode(3, 1)
+        encoded = ec.encode(b"Too many missing")
+        blocks = split_into_blocks(encoded, len(encoded) // 4)
+        blocks[0] = None
+        blocks[1] = None
+
+        with pytest.raises(ValueError, match="Decoding error"):
+            ec.extract_data_blocks(blocks, 16)
+
 
 class TestErasureCodeRoundtrip:
     
@@ -371,3 +418,30 @@ class TestErasureCodeIntegration:
             decoded = ec.extract_data(encoded, len(data))
             assert decoded == data
 
+    def test_column_split_matches_serial(self):
+        ec = ErasureCode(4, 3)
+        data = bytes(range(256)) * 200
+        encoded = ec.encode(data)
+
+        with patch('sdk.erasure_code._EC_WORKERS', 4), patch('sdk.erasure_code._MIN_COLUMNS_PER_WORKER', 1000):
+            assert ec.encode(data) == encoded
+
+            shard_size = len(encoded) // 7
+            blocks = split_into_blocks(encoded, shard_size)
+            blocks[0] = None
+            blocks[2] = None
+            blocks[5] = None
+            assert ec.extract_data_blocks(blocks, len(data)) == data
+
+    def test_unit_coefficient_rows(self):
+        data = bytes(range(256)) * 12
+
+        # One data shard: every parity row is a unit row, i.e. a plain copy
+        encoded = ErasureCode(1, 2).encode(data)
+        assert encoded == data * 3
+
+        # With three data shards the single parity row is all ones, i.e. XOR
+        encoded = ErasureCode(3, 1).encode(data)
+        size = len(data) // 3
+        a, b, c = (int.from_bytes(data[i * size:(i + 1) * size], "big") for i in range(3))
+        assert encoded[len(data):] == (a ^ b ^ c).to_bytes(size, "big")
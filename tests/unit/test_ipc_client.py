@@ -0,0 +1,176 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from private.ipc.client import BatchReceiptRequest, Client, NonceManager, new_http_provider
+
+
+def make_web3(start_nonce=7):
+    web3 = Mock()
+    web3.eth.get_transaction_count.return_value = start_nonce
+    return web3
+
+
+class TestNonceManager:
+    
+    def test_fetches_pending_nonce_once(self):
+        web3 = make_web3(7)
+        manager = NonceManager(web3, "0xabc")
+        
+        nonces = [manager.get_nonce() for _ in range(3)]
+        
+        assert nonces == [7, 8, 9]
+        web3.eth.get_transaction_count.assert_called_once_with("0xabc", "pending")
+    
+    def test_reset_refetches_from_chain(self):
+        web3 = make_web3(7)
+        manager = NonceManager(web3, "0xabc")
+        manager.get_nonce()
+        
+        web3.eth.get_transaction_count.return_value = 20
+        manager.reset_nonce()
+        
+        assert manager.get_nonce() == 20
+        assert web3.eth.get_transaction_count.call_count == 2
+    
+    def test_concurrent_nonces_are_unique(self):
+        manager = NonceManager(make_web3(0), "0xabc")
+        results = []
+        lock = threading.Lock()
+        
+        def worker():
+            local = [manager.get_nonce() for _ in range(200)]
+            with lock:
+                results.extend(local)
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert sorted(results) == list(range(1600))
+
+
+class TestTransactionReceiptsBatch:
+    
+    def make_client(self, web3):
+        return Client(web3=web3, auth=Mock(), storage=Mock())
+    
+    def test_single_batch_round_trip(self):
+        web3 = Mock()
+        web3.provider.make_batch_request.return_value = [
+            {"jsonrpc": "2.0", "id": 0, "result": {"status": "0x1"}},
+            {"jsonrpc": "2.0", "id": 1, "result": None},
+        ]
+        client = self.make_client(web3)
+        
+        result = client.get_transaction_receipts_batch([
+            BatchReceiptRequest(hash="0xaa", key="first"),
+            BatchReceiptRequest(hash="0xbb", key="second"),
+        ])
+        
+        web3.provider.make_batch_request.assert_called_once_with([
+            ("eth_getTransactionReceipt", ["0xaa"]),
+            ("eth_getTransactionReceipt", ["0xbb"]),
+        ])
+        web3.eth.get_transaction_receipt.assert_not_called()
+        assert result.responses[0].receipt == {"status": "0x1"}
+        assert result.responses[0].key == "first"
+        assert result.responses[1].receipt is None
+        assert result.responses[1].error is None
+    
+    def test_falls_back_to_sequential_on_batch_error(self):
+        web3 = Mock()
+        web3.provider.make_batch_request.return_value = {"error": {"message": "batch not supported"}}
+        web3.eth.get_transaction_receipt.return_value = {"status": 1}
+        client = self.make_client(web3)
+        
+        result = client.get_transaction_receipts_batch([BatchReceiptRequest(hash="0xaa", key="only")])
+        
+        web3.eth.get_transaction_receipt.assert_called_once_with("0xaa")
+        assert result.responses[0].receipt == {"status": 1}
+
+
+class TestNewHttpProvider:
+    
+    def test_mounts_enlarged_pool(self):
+        provider = new_http_provider("http://localhost:8545", pool_size=32)
+        
+        session = provider._request_session_manager.cache_and_return_session(provider.endpoint_uri)
+        adapter = session.get_adapter("http://localhost:8545")
+        
+        assert adapter._pool_connections == 32
+        assert adapter._pool_maxsize == 64
+
+
+class TestSignBlocks:
+    
+    def test_batch_matches_single_signatures(self):
+        from private.ipc.ipc import StorageData, sign_block, sign_blocks
+        
+        private_key = "0x" + "11" * 32
+        storage_address = "0x" + "ab" * 20
+        blocks = [StorageData(b"chunk", b"0" * 32, 0, i, b"1" * 32, 5, 10, b"2" * 32) for i in range(3)]
+        
+        signatures = sign_blocks(private_key, storage_address, 1, blocks)
+        
+        assert signatures == [sign_block(private_key, storage_address, 1, block) for block in blocks]
+    
+    def test_sign_block_recovers_to_signer(self):
+        from eth_account import Account
+        from private.eip712 import Domain, recover_signer_address
+        from private.ipc.ipc import _STORAGE_DATA_TYPES, StorageData, sign_block
+        
+        private_key = "0x" + "11" * 32
+        storage_address = "0x" + "ab" * 20
+        block = StorageData(b"chunk", b"0" * 32, 0, 1, b"1" * 32, 5, 10, b"2" * 32)
+        domain = Domain("Storage", "1", 1, Web3.to_checksum_address(storage_address))
+        
+        signature = sign_block(private_key, storage_address, 1, block)
+        
+        signer = recover_signer_address(signature, domain, block.to_message_dict(), _STORAGE_DATA_TYPES)
+        assert signer == Account.from_key(private_key).address
+    
+    def test_sign_block_with_client_signer(self):
+        from eth_account import Account
+        from private.ipc.ipc import StorageData, sign_block
+        
+        private_key = "0x" + "11" * 32
+        storage_address = "0x" + "ab" * 20
+        block = StorageData(b"chunk", b"0" * 32, 0, 1, b"1" * 32, 5, 10, b"2" * 32)
+        client = Client(web3=Mock(), auth=Account.from_key(private_key), storage=Mock())
+        
+        assert client.signer is client.signer
+        assert sign_block(client.signer, storage_address, 1, block) == sign_block(private_key, storage_address, 1, block)
+
+
+class TestCalculateFileIds:
+    
+    def test_matches_single_calculation(self):
+        from private.ipc.ipc import calculate_file_id, calculate_file_ids
+        
+        bucket_id = b"\x01" * 32
+        names = ["a.txt", "b.txt", "ünïcode"]
+        
+        assert calculate_file_ids(bucket_id, names) == [calculate_file_id(bucket_id, name) for name in names]
+
+
+class TestCalculateBucketId:
+    
+    def test_address_prefix_and_case_do_not_matter(self):
+        from private.ipc.ipc import calculate_bucket_id
+        
+        addr = "ab" * 20
+        expected = Web3.keccak(b"bucket" + bytes.fromhex(addr))
+        
+        for variant in (addr, "0x" + addr, "0X" + addr.upper()):
+            assert calculate_bucket_id("bucket", variant) == expected
+    
+    def test_rejects_wrong_length(self):
+        from private.ipc.ipc import calculate_bucket_id
+        
+        with pytest.raises(ValueError, match="20-byte"):
+            calculate_bucket_id("bucket", "0x" + "ab" * 19)
@@ -0,0 +1,36 @@
+import pytest
+
+from private.memory import EB, KB, MB, Size, format_size
+
+
+class TestFormatSize:
+
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0B"),
+        (999, "999B"),
+        (KB, "1.00KB"),
+        (MB - 1, "1000.00KB"),
+        (MB, "1.00MB"),
+        (123456789, "123.46MB"),
+        (EB - 1, "1000.00PB"),
+        (EB, "1.00EB"),
+        (10 ** 21, "1000.00EB"),
+        (1500.0, "1.50KB"),
+    ])
+    def test_unit_boundaries(self, size, expected):
+        assert format_size(size) == expected
+
+    def test_matches_threshold_scan_around_powers_of_ten(self):
+        units = [(EB, "EB"), (10 ** 15, "PB"), (10 ** 12, "TB"), (10 ** 9, "GB"), (MB, "MB"), (KB, "KB")]
+
+        def scan(size):
+            for threshold, unit in units:
+                if size >= threshold:
+                    return f"{size / threshold:.2f}{unit}"
+            return f"{size}B"
+
+        sizes = [10 ** exp + delta for exp in range(1, 20) for delta in (-1, 0, 1)]
+        assert [format_size(size) for size in sizes] == [scan(size) for size in sizes]
+
+    def test_size_wrapper_delegates(self):
+        assert str(Size(2 * MB)) == Size(2 * MB).format_size() == "2.00MB"
@@ -294,11 +294,14 @@ class TestSDK:
         
         config.ipc_address = "different.ipc.ai:5501"  # Different IPC address
         sdk = SDK(config)
+        sdk.block_pool = Mock()
+        sdk.block_pool.close.return_value = None
         
         sdk.close()
         
         mock_conn.close.assert_called_once()
         mock_ipc_conn.close.assert_called_once()
+        sdk.block_pool.close.assert_called_once()
     
     def test_validate_bucket_name_valid(self, mock_ipc_stub, mock_node_stub, mock_channel):
         config = SDKConfig(address="test.node.ai:5500", private_key="test_key")
@@ -399,6 +402,7 @@ class TestSDK:
         
         assert result == mock_streaming_instance
         mock_streaming_api.assert_called_once()
+        assert mock_streaming_api.call_args[1]['block_pool'] is sdk.block_pool
     
     @patch('sdk.sdk.IPC')
     @patch('sdk.sdk.Client.dial')
@@ -425,6 +429,7 @@ class TestSDK:
         assert result == mock_ipc_result
         mock_dial.assert_called_once()
         mock_ipc_class.assert_called_once()
+        assert mock_ipc_class.call_args[1]['block_pool'] is sdk.block_pool
     
     def test_ipc_no_private_key(self, mock_ipc_stub, mock_node_stub, mock_channel):
         config = SDKConfig(address="test.node.ai:5500")  # No private key
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from private.spclient.spclient import SP_POOL_MAXSIZE, SPClient, verify_blocks
+
+BLOCK = bytes(range(256)) * 4096
+
+
+class _BlockHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if "missing" in self.path:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        if "chunked" not in self.path:
+            self.send_header("Content-Length", str(len(BLOCK)))
+        self.end_headers()
+        self.wfile.write(BLOCK)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def provider_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BlockHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSPClientPool:
+
+    def test_session_shares_one_sized_adapter(self):
+        client = SPClient()
+
+        adapter = client.session.get_adapter("https://provider.example")
+        assert adapter is client.session.get_adapter("http://provider.example")
+        assert adapter._pool_maxsize == SP_POOL_MAXSIZE
+        client.close()
+
+
+class TestFetchBlock:
+
+    def test_reads_sized_body(self, provider_url):
+        client = SPClient()
+
+        data = client.fetch_block(provider_url, "bafyblock")
+
+        assert data == BLOCK
+        assert isinstance(data, bytearray)
+        client.close()
+
+    def test_reads_body_without_length(self, provider_url):
+        client = SPClient()
+
+        assert client.fetch_block(provider_url, "chunked") == BLOCK
+        client.close()
+
+
+class TestFetchBlocks:
+
+    def test_fetches_concurrently_in_order(self, provider_url):
+        client = SPClient()
+
+        async def run():
+            try:
+                return await client.fetch_blocks(provider_url, ["a", "b", "chunked"])
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) == [BLOCK, BLOCK, BLOCK]
+
+    def test_http_error_is_wrapped(self, provider_url):
+        client = SPClient()
+
+        async def run():
+            try:
+                return await client.fetch_blocks(provider_url, ["a", "missing"])
+            finally:
+                await client.aclose()
+
+        with pytest.raises(Exception, match="Failed to fetch block"):
+            asyncio.run(run())
+
+    def test_session_is_bound_to_one_loop(self, provider_url):
+        client = SPClient()
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            first_loop.run_until_complete(client.fetch_blocks(provider_url, ["a"]))
+            session = client._async_session
+
+            with pytest.raises(RuntimeError, match="event loop"):
+                second_loop.run_until_complete(client.fetch_blocks(provider_url, ["a"]))
+
+            first_loop.run_until_complete(client.aclose())
+            assert session.closed
+            second_loop.run_until_complete(client.fetch_blocks(provider_url, ["a"]))
+            second_loop.run_until_complete(client.aclose())
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    def test_new_session_after_loop_closed(self, provider_url):
+        client = SPClient()
+
+        asyncio.run(client.fetch_blocks(provider_url, ["a"]))
+        first_session = client._async_session
+        assert asyncio.run(client.fetch_blocks(provider_url, ["a"])) == [BLOCK]
+
+        assert client._async_session is not first_session
+        client.close()
+        assert client._async_session is None
+
+    def test_close_without_aclose_warns(self, provider_url):
+        client = SPClient()
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(client.fetch_blocks(provider_url, ["a"]))
+
+            with pytest.warns(ResourceWarning, match="aclose"):
+                client.close()
+            assert client._async_session is None
+        finally:
+            loop.close()
+
+
+class TestVerifyBlocks:
+
+    def test_checks_each_block_against_its_multihash(self):
+        from multiformats import CID, multihash
+
+        data = b"block data"
+        sha_cid = CID("base32", 1, "raw", multihash.digest(data, "sha2-256"))
+        truncated_cid = CID("base32", 1, "raw", multihash.digest(data, "sha2-256", size=20))
+        blake_cid = CID("base32", 1, "raw", multihash.digest(data, "blake2b-256"))
+
+        results = verify_blocks([str(sha_cid), truncated_cid, blake_cid, str(sha_cid)], [data, data, data, b"other"])
+
+        assert results == [True, True, True, False]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            verify_blocks(["bafy"], [])
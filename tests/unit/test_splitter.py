@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch
 import io
+import os
 
 from private.encryption.splitter import Splitter, new_splitter
 
@@ -447,4 +448,67 @@ class TestSplitterIntegration:
             assert isinstance(chunk, bytes)
             assert len(chunk) > 0
 
+    def test_real_encryption_roundtrip(self):
+        from private.encryption.encryption import decrypt
 
+        key = b"real_encryption_key_32bytes_test"
+        data = bytes(range(256)) * 3
+        block_size = 100
+
+        splitter = new_splitter(key, io.BytesIO(data), block_size)
+
+        decrypted = b"".join(
+            decrypt(key, chunk, f"block_{i}".encode()) for i, chunk in enumerate(splitter)
+        )
+
+        assert decrypted == data
+
+    def test_reader_without_readinto(self):
+        key = b"real_encryption_key_32bytes_test"
+
+        class ReadOnlyReader:
+            def __init__(self, data):
+                self.data = data
+                self.pos = 0
+
+            def read(self, size):
+                result = self.data[self.pos:self.pos + size]
+                self.pos += len(result)
+                return result
+
+        splitter = new_splitter(key, ReadOnlyReader(b"z" * 25), 10)
+
+        assert len(list(splitter)) == 3
+
+    def test_prefetch_preserves_block_order(self):
+        from private.encryption.encryption import decrypt
+
+        key = b"real_encryption_key_32bytes_test"
+        data = os.urandom(1000)
+
+        splitter = Splitter(key, io.BytesIO(data), 64, prefetch=3)
+        chunks = list(splitter)
+
+        assert len(chunks) == 16
+        assert splitter.counter == 16
+        assert b"".join(decrypt(key, c, f"block_{i}".encode()) for i, c in enumerate(chunks)) == data
+
+    @patch('private.encryption.splitter.encrypt')
+    def test_prefetch_encryption_error(self, mock_encrypt):
+        key = b"real_encryption_key_32bytes_test"
+        mock_encrypt.side_effect = Exception("Encryption failed")
+
+        splitter = Splitter(key, io.BytesIO(b"data"), 1024, prefetch=2)
+
+        with pytest.raises(Exception, match="splitter error"):
+            list(splitter)
+
+    def test_new_splitter_does_not_prefetch_by_default(self):
+        key = b"real_encryption_key_32bytes_test"
+
+        splitter = new_splitter(key, io.BytesIO(b"data"), 1024)
+
+        assert splitter.prefetch == 0
+        assert splitter._buffer is None
+        assert len(list(splitter)) == 1
+        assert len(splitter._buffer) == 1024